@@ -14,7 +14,7 @@ import logging
 
 from .services.bigquery_service import BigQueryService
 from .services.processing_service import ProcessingService
-from .models.response_models import FieldComparisonResponse, ErrorResponse
+from .models.response_models import FieldComparisonResponse, ChangeFeedResponse, ErrorResponse
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -186,7 +186,7 @@ async def get_ford_field_comparison(
     offset: Optional[int] = Query(0, description="Offset for pagination (default: 0)"),
     auto_fetch: bool = Query(True, description="Automatically download and process missing dates"),
     query_type: str = Query("db_comparison", description="Type of query: 'db_comparison' (Ford DB Comparison) or 'field_comparison' (Ford Comparison)"),
-    db_orders_date: Optional[str] = Query(None, description="Date for db_orders table selection in YYYY-MM-DD format (e.g., 2025-11-10). Only used for db_comparison query type. If not provided, uses new_date.")
+    db_orders_date: Optional[str] = Query(None, description="db_orders snapshot date in YYYY-MM-DD format (e.g., 2025-11-10). Only used for db_comparison query type. If not provided, uses new_date.")
 ):
     """
     Get Ford order field comparisons between two dates
@@ -195,8 +195,8 @@ async def get_ford_field_comparison(
     Shows which fields changed and their old/new values.
     
     Query types:
-    - "db_comparison": Uses ford_orders_db_comarision.sql - compares with db_orders table (Ford DB Comparison)
-    - "field_comparison": Uses ford_orders_field_comparison_parameterized.sql - regular field comparison (Ford Comparison)
+    - "db_comparison": Field changes compared with the db_orders table (Ford DB Comparison)
+    - "field_comparison": Regular field comparison (Ford Comparison)
     
     If auto_fetch is True (default), automatically downloads and processes
     missing dates from GCS before running the comparison.
@@ -268,15 +268,15 @@ async def get_ford_field_comparison(
                 # Use db_orders_date if provided, otherwise use new_date
                 date_to_check = db_orders_date if db_orders_date else new_date
                 try:
-                    logger.info(f"Checking if db_orders table exists for date {date_to_check}...")
-                    if not bq.check_db_orders_table_exists(date_to_check):
-                        logger.info(f"db_orders table for {date_to_check} not found. Auto-fetching...")
+                    logger.info(f"Checking if db_orders has a snapshot for date {date_to_check}...")
+                    if not bq.check_db_orders_date_exists(date_to_check):
+                        logger.info(f"db_orders snapshot for {date_to_check} not found. Auto-fetching...")
                         missing_dates.append(f"db_orders_{date_to_check}")
                         fetch_result = bq.ensure_db_orders_date_available(date_to_check)
                         fetch_results[f"db_orders_{date_to_check}"] = fetch_result
                         logger.info(f"Auto-fetch result for db_orders_{date_to_check}: {fetch_result.get('status', 'unknown')}")
                     else:
-                        logger.info(f"db_orders table for {date_to_check} already exists in BigQuery")
+                        logger.info(f"db_orders snapshot for {date_to_check} already exists in BigQuery")
                 except Exception as e:
                     logger.warning(f"Error checking/fetching db_orders_date {date_to_check}: {str(e)}")
                     # Continue anyway - the query might still work
@@ -334,6 +334,7 @@ async def get_ford_field_comparison(
             "data_rows": len(results.get("data", [])),
             "offset": results.get("offset", 0),
             "query_duration_seconds": round(query_duration, 2),
+            "materialized": results.get("materialized", False),
             "auto_fetched_dates": missing_dates if auto_fetch and missing_dates else None
         }
         logger.info(f"=== FORD FIELD COMPARISON RESPONSE ===")
@@ -361,6 +362,71 @@ async def get_ford_field_comparison(
         )
 
 
+@app.get(
+    "/api/ford-change-feed",
+    response_model=ChangeFeedResponse,
+    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+)
+async def get_ford_change_feed(
+    start: str = Query(..., description="First date in YYYY-MM-DD format (e.g., 2025-11-03)"),
+    end: str = Query(..., description="Last date in YYYY-MM-DD format (e.g., 2025-11-10)"),
+    field: Optional[List[str]] = Query(None, description="Only return changes of this field (repeat for several)"),
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of changes to return (default: 1000)"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (default: 0)")
+):
+    """
+    Get every Ford field change between consecutive dates in a range
+    
+    Computed in one BigQuery job over all snapshots in the range, instead of
+    one /api/ford-field-comparison request per pair of days. Each change has
+    the old_date / new_date it happened between, ordered by new_date.
+    """
+    logger.info(f"=== FORD CHANGE FEED REQUEST ===")
+    logger.info(f"Request Parameters: start={start}, end={end}, field={field}, limit={limit}, offset={offset}")
+    
+    try:
+        try:
+            start_date = datetime.strptime(start, "%Y-%m-%d")
+            end_date = datetime.strptime(end, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid date format. Use YYYY-MM-DD format (e.g., 2025-11-07)"
+            )
+        if end_date < start_date:
+            raise HTTPException(status_code=400, detail="end must not be before start")
+        
+        start_time = datetime.now()
+        try:
+            results = await get_bq_service().get_ford_change_feed(
+                start_date=start,
+                end_date=end,
+                fields=field,
+                limit=limit,
+                offset=offset
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        query_duration = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Change feed: {len(results['data'])} of {results['total']} changes in {query_duration:.2f} seconds")
+        return results
+        
+    except HTTPException as e:
+        logger.error(f"=== FORD CHANGE FEED ERROR (HTTP {e.status_code}) ===")
+        logger.error(f"Error: {e.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        logger.error(f"=== FORD CHANGE FEED ERROR ===")
+        logger.error(f"Error Message: {str(e)}")
+        logger.error(f"Traceback:\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error executing query: {str(e)}"
+        )
+
+
 @app.get("/api/ford-field-comparison/stats")
 async def get_ford_field_comparison_stats(
     old_date: str = Query(..., description="Old date in YYYY-MM-DD format"),
@@ -28,6 +28,20 @@ class FieldComparisonResponse(BaseModel):
     offset: int = Field(0, description="Offset applied to results")
     old_date: str = Field(..., description="Old date used in comparison")
     new_date: str = Field(..., description="New date used in comparison")
+    resolved_old_date: Optional[str] = Field(None, description="Date whose rows were queried for old_date (differs if old_date is unchanged from an earlier report)")
+    resolved_new_date: Optional[str] = Field(None, description="Date whose rows were queried for new_date (differs if new_date is unchanged from an earlier report)")
+    materialized: bool = Field(False, description="Changes were read from ford_field_changes (computed at load time) instead of comparing the snapshots")
+
+
+class ChangeFeedResponse(BaseModel):
+    """Response model for change feed endpoint"""
+    data: List[Dict[str, Any]] = Field(..., description="Field changes with the old_date / new_date they happened between")
+    total: int = Field(..., description="Total number of changes in the date range")
+    limit: int = Field(..., description="Limit applied to results")
+    offset: int = Field(0, description="Offset applied to results")
+    start_date: str = Field(..., description="First date of the range")
+    end_date: str = Field(..., description="Last date of the range")
+    fields: Optional[List[str]] = Field(None, description="Fields the changes were filtered to (None = all)")
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,14 @@
+-- ============================================================================
+-- Rebuild db_orders.UniqueCode with the OEM name in lower case - BigQuery
+-- Partitions written before the code lower-cased oem hold codes ending in
+-- '||Ford' for rows stored as 'Ford', which never match the 'ford' code the
+-- Ford DB comparison builds (they showed up as NO_MAPPING).
+-- The expression is generated by
+-- processing.bigquery_loader.orders_unique_code_sql()
+-- (tests/test_bigquery_loader.py checks it stays in sync with the loader).
+-- Run once; partitions written since then already hold lower-case codes.
+-- ============================================================================
+
+UPDATE `arcane-transit-357411.shaed_elt.db_orders`
+SET UniqueCode = CONCAT(COALESCE(CAST(orderNo AS STRING), ''), '||', COALESCE(CAST(bodyCode AS STRING), ''), '||', COALESCE(CAST(modelYear AS STRING), ''), '||', LOWER(COALESCE(CAST(oem AS STRING), '')))
+WHERE oem != LOWER(oem);
@@ -0,0 +1,97 @@
+-- ============================================================================
+-- Build ford_oem_orders_history from the daily copies in ford_oem_orders - BigQuery
+-- History mode (FORD_LOAD_MODE=history / --load-mode history) keeps one row per
+-- order version with valid_from / valid_to instead of a full copy per day.
+-- This script converts the dates already appended to ford_oem_orders:
+--   - a version is a (_row_key, _content_hash) pair; it is valid from the first
+--     date of each run of consecutive loaded dates it appears on, until the
+--     next loaded date it is missing from (NULL = still current)
+--   - exact duplicate rows within one date collapse into one version
+-- Run ford_oem_orders_add_row_hashes.sql first (it backfills _content_hash),
+-- then this once, before switching the loader to history mode. The view matches
+-- processing.bigquery_loader.ford_snapshots_view_sql().
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS `arcane-transit-357411.shaed_elt.ford_oem_history_loads` (
+    snapshot_date DATE NOT NULL,
+    source_filename STRING,
+    source_file_created_timestamp TIMESTAMP,
+    row_count INT64,
+    loaded_at TIMESTAMP
+);
+
+INSERT INTO `arcane-transit-357411.shaed_elt.ford_oem_history_loads`
+    (snapshot_date, source_filename, source_file_created_timestamp, row_count, loaded_at)
+SELECT
+    _source_file_date,
+    ANY_VALUE(_source_filename),
+    ANY_VALUE(_source_file_created_timestamp),
+    COUNT(*),
+    CURRENT_TIMESTAMP()
+FROM `arcane-transit-357411.shaed_elt.ford_oem_orders`
+GROUP BY _source_file_date;
+
+CREATE TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders_history`
+CLUSTER BY _row_key
+AS
+WITH dates AS (
+    SELECT
+        snapshot_date,
+        ROW_NUMBER() OVER (ORDER BY snapshot_date) AS day_number
+    FROM (
+        SELECT DISTINCT _source_file_date AS snapshot_date
+        FROM `arcane-transit-357411.shaed_elt.ford_oem_orders`
+    )
+),
+versions AS (
+    -- One row per version and date it appears on
+    SELECT
+        ARRAY_AGG(o LIMIT 1)[OFFSET(0)] AS version,
+        o._row_key,
+        o._content_hash,
+        d.day_number,
+        d.snapshot_date
+    FROM `arcane-transit-357411.shaed_elt.ford_oem_orders` o
+    INNER JOIN dates d
+        ON o._source_file_date = d.snapshot_date
+    GROUP BY o._row_key, o._content_hash, d.day_number, d.snapshot_date
+),
+islands AS (
+    -- Consecutive dates of the same version share an island number
+    SELECT
+        *,
+        day_number - ROW_NUMBER() OVER (PARTITION BY _row_key, _content_hash ORDER BY day_number) AS island
+    FROM versions
+),
+spans AS (
+    SELECT
+        ARRAY_AGG(version ORDER BY day_number LIMIT 1)[OFFSET(0)] AS version,
+        MIN(snapshot_date) AS valid_from,
+        MAX(day_number) AS last_day_number
+    FROM islands
+    GROUP BY _row_key, _content_hash, island
+)
+SELECT
+    s.version.*,
+    s.valid_from,
+    next_day.snapshot_date AS valid_to
+FROM spans s
+LEFT JOIN dates next_day
+    ON next_day.day_number = s.last_day_number + 1;
+
+CREATE OR REPLACE VIEW `arcane-transit-357411.shaed_elt.ford_oem_orders_snapshots` AS
+SELECT
+    h.* EXCEPT (_source_filename, _source_file_created_timestamp, _source_file_date, valid_from, valid_to),
+    l.source_filename AS _source_filename,
+    l.source_file_created_timestamp AS _source_file_created_timestamp,
+    l.snapshot_date AS _source_file_date
+FROM `arcane-transit-357411.shaed_elt.ford_oem_orders_history` h
+JOIN (
+    -- Latest load of each date (a date may be merged again)
+    SELECT *
+    FROM `arcane-transit-357411.shaed_elt.ford_oem_history_loads`
+    WHERE TRUE
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY snapshot_date ORDER BY loaded_at DESC) = 1
+) l
+    ON h.valid_from <= l.snapshot_date
+    AND (h.valid_to IS NULL OR l.snapshot_date < h.valid_to);
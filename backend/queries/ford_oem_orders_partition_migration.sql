@@ -0,0 +1,25 @@
+-- ============================================================================
+-- Partition ford_oem_orders on _source_file_date - BigQuery
+-- Tables created by the Ford loads are partitioned by day on _source_file_date
+-- and clustered on Order_Number, Body_Code, Model_Year, so existence checks,
+-- snapshot reads and comparisons filtering on _source_file_date only scan the
+-- dates they ask for. This rebuilds a table created before that:
+--   - the rows are copied into ford_oem_orders_partitioned
+--   - the original is renamed to ford_oem_orders_unpartitioned (backup)
+--   - the copy takes the ford_oem_orders name
+-- `python main.py ford --partition-table` runs the same script
+-- (processing.bigquery_loader.ford_orders_partition_sql()); Ford loads never
+-- run it. The renames are not atomic: if one fails, rename the tables by hand.
+-- Drop ford_oem_orders_unpartitioned once the new table is checked.
+-- ============================================================================
+
+CREATE TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders_partitioned`
+PARTITION BY _source_file_date
+CLUSTER BY Order_Number, Body_Code, Model_Year
+AS
+SELECT * REPLACE (CAST(_source_file_date AS DATE) AS _source_file_date)
+FROM `arcane-transit-357411.shaed_elt.ford_oem_orders`;
+
+ALTER TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders` RENAME TO ford_oem_orders_unpartitioned;
+
+ALTER TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders_partitioned` RENAME TO ford_oem_orders;
@@ -0,0 +1,201 @@
+-- ============================================================================
+-- Add and backfill _content_hash on the history and delta tables - BigQuery
+-- History and delta modes identify a row version by (_row_key, _content_hash)
+-- instead of (_row_key, _row_hash), which only covers the compared fields.
+-- Rows loaded before the processor emitted _content_hash get:
+--   - history rows and new / changed delta rows: the hash of their columns,
+--     as the processor computes it (processing.row_hashes.content_hash_sql(),
+--     kept in sync by tests/test_row_hashes.py)
+--   - removed delta rows (no column values): the hash of the version they
+--     remove, the latest earlier new / changed row with the same
+--     (_row_key, _row_hash)
+-- Run the statements of the tables in use once, before their next load.
+-- History: the next merge closes the versions whose non-compared columns
+-- changed since they were merged. Delta: the local version cache written
+-- before the change is ignored, so the next load fetches its baseline from
+-- ford_oem_orders_delta_snapshots and emits the changes the old versions
+-- missed.
+-- ============================================================================
+
+-- History mode
+
+ALTER TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders_history`
+    ADD COLUMN IF NOT EXISTS _content_hash INT64;
+
+UPDATE `arcane-transit-357411.shaed_elt.ford_oem_orders_history`
+SET _content_hash = CAST(CONCAT('0x', SUBSTR(TO_HEX(SHA256(ARRAY_TO_STRING([
+            IF(COALESCE(CAST(All_Interior_Trim_Colors AS STRING), '') = '', '', CONCAT('All_Interior_Trim_Colors\x1e', CAST(All_Interior_Trim_Colors AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Body_Code AS STRING), '') = '', '', CONCAT('Body_Code\x1e', CAST(Body_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Body_Code_Description AS STRING), '') = '', '', CONCAT('Body_Code_Description\x1e', CAST(Body_Code_Description AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Conveyance AS STRING), '') = '', '', CONCAT('Conveyance\x1e', CAST(Conveyance AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Customer_First_Initial AS STRING), '') = '', '', CONCAT('Customer_First_Initial\x1e', CAST(Customer_First_Initial AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Customer_Name AS STRING), '') = '', '', CONCAT('Customer_Name\x1e', CAST(Customer_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Delivered_Date AS STRING), '') = '', '', CONCAT('Delivered_Date\x1e', CAST(Delivered_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(End_User_FIN AS STRING), '') = '', '', CONCAT('End_User_FIN\x1e', CAST(End_User_FIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(End_User_Fin_Name AS STRING), '') = '', '', CONCAT('End_User_Fin_Name\x1e', CAST(End_User_Fin_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Engine AS STRING), '') = '', '', CONCAT('Engine\x1e', CAST(Engine AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Estimated_Arrival_Week AS STRING), '') = '', '', CONCAT('Estimated_Arrival_Week\x1e', CAST(Estimated_Arrival_Week AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Estimated_Build_Date AS STRING), '') = '', '', CONCAT('Estimated_Build_Date\x1e', CAST(Estimated_Build_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Final_Ramp AS STRING), '') = '', '', CONCAT('Final_Ramp\x1e', CAST(Final_Ramp AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Fleet_Incentive_Program AS STRING), '') = '', '', CONCAT('Fleet_Incentive_Program\x1e', CAST(Fleet_Incentive_Program AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Fleet_Numeric_Priority_Code AS STRING), '') = '', '', CONCAT('Fleet_Numeric_Priority_Code\x1e', CAST(Fleet_Numeric_Priority_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Gross_Vehicle_Weight AS STRING), '') = '', '', CONCAT('Gross_Vehicle_Weight\x1e', CAST(Gross_Vehicle_Weight AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Interior_Trims AS STRING), '') = '', '', CONCAT('Interior_Trims\x1e', CAST(Interior_Trims AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location AS STRING), '') = '', '', CONCAT('Last_Location\x1e', CAST(Last_Location AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Address AS STRING), '') = '', '', CONCAT('Last_Location_Address\x1e', CAST(Last_Location_Address AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Code AS STRING), '') = '', '', CONCAT('Last_Location_Code\x1e', CAST(Last_Location_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Date AS STRING), '') = '', '', CONCAT('Last_Location_Date\x1e', CAST(Last_Location_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Name AS STRING), '') = '', '', CONCAT('Last_Location_Name\x1e', CAST(Last_Location_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Updated AS STRING), '') = '', '', CONCAT('Last_Updated\x1e', CAST(Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Updated_Estimated_Build_Date AS STRING), '') = '', '', CONCAT('Last_Updated_Estimated_Build_Date\x1e', CAST(Last_Updated_Estimated_Build_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Model_Year AS STRING), '') = '', '', CONCAT('Model_Year\x1e', CAST(Model_Year AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Key AS STRING), '') = '', '', CONCAT('Order_Key\x1e', CAST(Order_Key AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Number AS STRING), '') = '', '', CONCAT('Order_Number\x1e', CAST(Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Received AS STRING), '') = '', '', CONCAT('Order_Received\x1e', CAST(Order_Received AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Type_Code AS STRING), '') = '', '', CONCAT('Order_Type_Code\x1e', CAST(Order_Type_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_City AS STRING), '') = '', '', CONCAT('Ordering_Dealer_City\x1e', CAST(Ordering_Dealer_City AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Code AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Code\x1e', CAST(Ordering_Dealer_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Name AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Name\x1e', CAST(Ordering_Dealer_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_State_Province AS STRING), '') = '', '', CONCAT('Ordering_Dealer_State_Province\x1e', CAST(Ordering_Dealer_State_Province AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Street AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Street\x1e', CAST(Ordering_Dealer_Street AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Zip_Postal_Code AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Zip_Postal_Code\x1e', CAST(Ordering_Dealer_Zip_Postal_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_FIN AS STRING), '') = '', '', CONCAT('Ordering_FIN\x1e', CAST(Ordering_FIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Fin_Name AS STRING), '') = '', '', CONCAT('Ordering_Fin_Name\x1e', CAST(Ordering_Fin_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(PEP_TCO_Code AS STRING), '') = '', '', CONCAT('PEP_TCO_Code\x1e', CAST(PEP_TCO_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Paint AS STRING), '') = '', '', CONCAT('Paint\x1e', CAST(Paint AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Plant_Date AS STRING), '') = '', '', CONCAT('Plant_Date\x1e', CAST(Plant_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Post_Delivered_Upfitting AS STRING), '') = '', '', CONCAT('Post_Delivered_Upfitting\x1e', CAST(Post_Delivered_Upfitting AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Post_Delivered_Upfitting_Last_Updated AS STRING), '') = '', '', CONCAT('Post_Delivered_Upfitting_Last_Updated\x1e', CAST(Post_Delivered_Upfitting_Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Primary_Status AS STRING), '') = '', '', CONCAT('Primary_Status\x1e', CAST(Primary_Status AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Priority_Code AS STRING), '') = '', '', CONCAT('Priority_Code\x1e', CAST(Priority_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Produced_Date AS STRING), '') = '', '', CONCAT('Produced_Date\x1e', CAST(Produced_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Purchase_Order_Number AS STRING), '') = '', '', CONCAT('Purchase_Order_Number\x1e', CAST(Purchase_Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Released_Date AS STRING), '') = '', '', CONCAT('Released_Date\x1e', CAST(Released_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Scheduled_Date AS STRING), '') = '', '', CONCAT('Scheduled_Date\x1e', CAST(Scheduled_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Seat_Trim AS STRING), '') = '', '', CONCAT('Seat_Trim\x1e', CAST(Seat_Trim AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Secondary_Status AS STRING), '') = '', '', CONCAT('Secondary_Status\x1e', CAST(Secondary_Status AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Completed_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Completed_Date\x1e', CAST(Ship_Through_Completed_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Received_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Received_Date\x1e', CAST(Ship_Through_Received_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Started_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Started_Date\x1e', CAST(Ship_Through_Started_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Thru_Location AS STRING), '') = '', '', CONCAT('Ship_Thru_Location\x1e', CAST(Ship_Thru_Location AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Thru_Plant AS STRING), '') = '', '', CONCAT('Ship_Thru_Plant\x1e', CAST(Ship_Thru_Plant AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_City AS STRING), '') = '', '', CONCAT('Ship_To_City\x1e', CAST(Ship_To_City AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Name AS STRING), '') = '', '', CONCAT('Ship_To_Name\x1e', CAST(Ship_To_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_State_Province AS STRING), '') = '', '', CONCAT('Ship_To_State_Province\x1e', CAST(Ship_To_State_Province AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Street AS STRING), '') = '', '', CONCAT('Ship_To_Street\x1e', CAST(Ship_To_Street AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Zip_Postal_Code AS STRING), '') = '', '', CONCAT('Ship_To_Zip_Postal_Code\x1e', CAST(Ship_To_Zip_Postal_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_to_Dealer_Code AS STRING), '') = '', '', CONCAT('Ship_to_Dealer_Code\x1e', CAST(Ship_to_Dealer_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Shipped_Date AS STRING), '') = '', '', CONCAT('Shipped_Date\x1e', CAST(Shipped_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Special_Order_Number AS STRING), '') = '', '', CONCAT('Special_Order_Number\x1e', CAST(Special_Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Status_Last_Updated AS STRING), '') = '', '', CONCAT('Status_Last_Updated\x1e', CAST(Status_Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Upfitter_Estimated_Completion_Date AS STRING), '') = '', '', CONCAT('Upfitter_Estimated_Completion_Date\x1e', CAST(Upfitter_Estimated_Completion_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Upfitter_Estimated_Start_Date AS STRING), '') = '', '', CONCAT('Upfitter_Estimated_Start_Date\x1e', CAST(Upfitter_Estimated_Start_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(VIN AS STRING), '') = '', '', CONCAT('VIN\x1e', CAST(VIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(VIN8 AS STRING), '') = '', '', CONCAT('VIN8\x1e', CAST(VIN8 AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Vehicle_Line AS STRING), '') = '', '', CONCAT('Vehicle_Line\x1e', CAST(Vehicle_Line AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Wheelbase AS STRING), '') = '', '', CONCAT('Wheelbase\x1e', CAST(Wheelbase AS STRING), '\x1f'))
+        ], ''))), 1, 15)) AS INT64)
+WHERE _content_hash IS NULL;
+
+-- Delta mode
+
+ALTER TABLE `arcane-transit-357411.shaed_elt.ford_oem_orders_delta`
+    ADD COLUMN IF NOT EXISTS _content_hash INT64;
+
+UPDATE `arcane-transit-357411.shaed_elt.ford_oem_orders_delta`
+SET _content_hash = CAST(CONCAT('0x', SUBSTR(TO_HEX(SHA256(ARRAY_TO_STRING([
+            IF(COALESCE(CAST(All_Interior_Trim_Colors AS STRING), '') = '', '', CONCAT('All_Interior_Trim_Colors\x1e', CAST(All_Interior_Trim_Colors AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Body_Code AS STRING), '') = '', '', CONCAT('Body_Code\x1e', CAST(Body_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Body_Code_Description AS STRING), '') = '', '', CONCAT('Body_Code_Description\x1e', CAST(Body_Code_Description AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Conveyance AS STRING), '') = '', '', CONCAT('Conveyance\x1e', CAST(Conveyance AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Customer_First_Initial AS STRING), '') = '', '', CONCAT('Customer_First_Initial\x1e', CAST(Customer_First_Initial AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Customer_Name AS STRING), '') = '', '', CONCAT('Customer_Name\x1e', CAST(Customer_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Delivered_Date AS STRING), '') = '', '', CONCAT('Delivered_Date\x1e', CAST(Delivered_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(End_User_FIN AS STRING), '') = '', '', CONCAT('End_User_FIN\x1e', CAST(End_User_FIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(End_User_Fin_Name AS STRING), '') = '', '', CONCAT('End_User_Fin_Name\x1e', CAST(End_User_Fin_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Engine AS STRING), '') = '', '', CONCAT('Engine\x1e', CAST(Engine AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Estimated_Arrival_Week AS STRING), '') = '', '', CONCAT('Estimated_Arrival_Week\x1e', CAST(Estimated_Arrival_Week AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Estimated_Build_Date AS STRING), '') = '', '', CONCAT('Estimated_Build_Date\x1e', CAST(Estimated_Build_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Final_Ramp AS STRING), '') = '', '', CONCAT('Final_Ramp\x1e', CAST(Final_Ramp AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Fleet_Incentive_Program AS STRING), '') = '', '', CONCAT('Fleet_Incentive_Program\x1e', CAST(Fleet_Incentive_Program AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Fleet_Numeric_Priority_Code AS STRING), '') = '', '', CONCAT('Fleet_Numeric_Priority_Code\x1e', CAST(Fleet_Numeric_Priority_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Gross_Vehicle_Weight AS STRING), '') = '', '', CONCAT('Gross_Vehicle_Weight\x1e', CAST(Gross_Vehicle_Weight AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Interior_Trims AS STRING), '') = '', '', CONCAT('Interior_Trims\x1e', CAST(Interior_Trims AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location AS STRING), '') = '', '', CONCAT('Last_Location\x1e', CAST(Last_Location AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Address AS STRING), '') = '', '', CONCAT('Last_Location_Address\x1e', CAST(Last_Location_Address AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Code AS STRING), '') = '', '', CONCAT('Last_Location_Code\x1e', CAST(Last_Location_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Date AS STRING), '') = '', '', CONCAT('Last_Location_Date\x1e', CAST(Last_Location_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Location_Name AS STRING), '') = '', '', CONCAT('Last_Location_Name\x1e', CAST(Last_Location_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Updated AS STRING), '') = '', '', CONCAT('Last_Updated\x1e', CAST(Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Last_Updated_Estimated_Build_Date AS STRING), '') = '', '', CONCAT('Last_Updated_Estimated_Build_Date\x1e', CAST(Last_Updated_Estimated_Build_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Model_Year AS STRING), '') = '', '', CONCAT('Model_Year\x1e', CAST(Model_Year AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Key AS STRING), '') = '', '', CONCAT('Order_Key\x1e', CAST(Order_Key AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Number AS STRING), '') = '', '', CONCAT('Order_Number\x1e', CAST(Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Received AS STRING), '') = '', '', CONCAT('Order_Received\x1e', CAST(Order_Received AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Order_Type_Code AS STRING), '') = '', '', CONCAT('Order_Type_Code\x1e', CAST(Order_Type_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_City AS STRING), '') = '', '', CONCAT('Ordering_Dealer_City\x1e', CAST(Ordering_Dealer_City AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Code AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Code\x1e', CAST(Ordering_Dealer_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Name AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Name\x1e', CAST(Ordering_Dealer_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_State_Province AS STRING), '') = '', '', CONCAT('Ordering_Dealer_State_Province\x1e', CAST(Ordering_Dealer_State_Province AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Street AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Street\x1e', CAST(Ordering_Dealer_Street AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Dealer_Zip_Postal_Code AS STRING), '') = '', '', CONCAT('Ordering_Dealer_Zip_Postal_Code\x1e', CAST(Ordering_Dealer_Zip_Postal_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_FIN AS STRING), '') = '', '', CONCAT('Ordering_FIN\x1e', CAST(Ordering_FIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ordering_Fin_Name AS STRING), '') = '', '', CONCAT('Ordering_Fin_Name\x1e', CAST(Ordering_Fin_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(PEP_TCO_Code AS STRING), '') = '', '', CONCAT('PEP_TCO_Code\x1e', CAST(PEP_TCO_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Paint AS STRING), '') = '', '', CONCAT('Paint\x1e', CAST(Paint AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Plant_Date AS STRING), '') = '', '', CONCAT('Plant_Date\x1e', CAST(Plant_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Post_Delivered_Upfitting AS STRING), '') = '', '', CONCAT('Post_Delivered_Upfitting\x1e', CAST(Post_Delivered_Upfitting AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Post_Delivered_Upfitting_Last_Updated AS STRING), '') = '', '', CONCAT('Post_Delivered_Upfitting_Last_Updated\x1e', CAST(Post_Delivered_Upfitting_Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Primary_Status AS STRING), '') = '', '', CONCAT('Primary_Status\x1e', CAST(Primary_Status AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Priority_Code AS STRING), '') = '', '', CONCAT('Priority_Code\x1e', CAST(Priority_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Produced_Date AS STRING), '') = '', '', CONCAT('Produced_Date\x1e', CAST(Produced_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Purchase_Order_Number AS STRING), '') = '', '', CONCAT('Purchase_Order_Number\x1e', CAST(Purchase_Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Released_Date AS STRING), '') = '', '', CONCAT('Released_Date\x1e', CAST(Released_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Scheduled_Date AS STRING), '') = '', '', CONCAT('Scheduled_Date\x1e', CAST(Scheduled_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Seat_Trim AS STRING), '') = '', '', CONCAT('Seat_Trim\x1e', CAST(Seat_Trim AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Secondary_Status AS STRING), '') = '', '', CONCAT('Secondary_Status\x1e', CAST(Secondary_Status AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Completed_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Completed_Date\x1e', CAST(Ship_Through_Completed_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Received_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Received_Date\x1e', CAST(Ship_Through_Received_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Through_Started_Date AS STRING), '') = '', '', CONCAT('Ship_Through_Started_Date\x1e', CAST(Ship_Through_Started_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Thru_Location AS STRING), '') = '', '', CONCAT('Ship_Thru_Location\x1e', CAST(Ship_Thru_Location AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_Thru_Plant AS STRING), '') = '', '', CONCAT('Ship_Thru_Plant\x1e', CAST(Ship_Thru_Plant AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_City AS STRING), '') = '', '', CONCAT('Ship_To_City\x1e', CAST(Ship_To_City AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Name AS STRING), '') = '', '', CONCAT('Ship_To_Name\x1e', CAST(Ship_To_Name AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_State_Province AS STRING), '') = '', '', CONCAT('Ship_To_State_Province\x1e', CAST(Ship_To_State_Province AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Street AS STRING), '') = '', '', CONCAT('Ship_To_Street\x1e', CAST(Ship_To_Street AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_To_Zip_Postal_Code AS STRING), '') = '', '', CONCAT('Ship_To_Zip_Postal_Code\x1e', CAST(Ship_To_Zip_Postal_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Ship_to_Dealer_Code AS STRING), '') = '', '', CONCAT('Ship_to_Dealer_Code\x1e', CAST(Ship_to_Dealer_Code AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Shipped_Date AS STRING), '') = '', '', CONCAT('Shipped_Date\x1e', CAST(Shipped_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Special_Order_Number AS STRING), '') = '', '', CONCAT('Special_Order_Number\x1e', CAST(Special_Order_Number AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Status_Last_Updated AS STRING), '') = '', '', CONCAT('Status_Last_Updated\x1e', CAST(Status_Last_Updated AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Upfitter_Estimated_Completion_Date AS STRING), '') = '', '', CONCAT('Upfitter_Estimated_Completion_Date\x1e', CAST(Upfitter_Estimated_Completion_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Upfitter_Estimated_Start_Date AS STRING), '') = '', '', CONCAT('Upfitter_Estimated_Start_Date\x1e', CAST(Upfitter_Estimated_Start_Date AS STRING), '\x1f')),
+            IF(COALESCE(CAST(VIN AS STRING), '') = '', '', CONCAT('VIN\x1e', CAST(VIN AS STRING), '\x1f')),
+            IF(COALESCE(CAST(VIN8 AS STRING), '') = '', '', CONCAT('VIN8\x1e', CAST(VIN8 AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Vehicle_Line AS STRING), '') = '', '', CONCAT('Vehicle_Line\x1e', CAST(Vehicle_Line AS STRING), '\x1f')),
+            IF(COALESCE(CAST(Wheelbase AS STRING), '') = '', '', CONCAT('Wheelbase\x1e', CAST(Wheelbase AS STRING), '\x1f'))
+        ], ''))), 1, 15)) AS INT64)
+WHERE _change_type != 'removed' AND _content_hash IS NULL;
+
+UPDATE `arcane-transit-357411.shaed_elt.ford_oem_orders_delta` r
+SET _content_hash = v._content_hash
+FROM (
+    SELECT
+        removed._row_key,
+        removed._row_hash,
+        removed._source_file_date,
+        ARRAY_AGG(version._content_hash ORDER BY version._source_file_date DESC LIMIT 1)[OFFSET(0)] AS _content_hash
+    FROM `arcane-transit-357411.shaed_elt.ford_oem_orders_delta` removed
+    INNER JOIN `arcane-transit-357411.shaed_elt.ford_oem_orders_delta` version
+        ON version._row_key = removed._row_key
+        AND version._row_hash = removed._row_hash
+        AND version._source_file_date < removed._source_file_date
+        AND version._change_type != 'removed'
+    WHERE removed._change_type = 'removed'
+    GROUP BY removed._row_key, removed._row_hash, removed._source_file_date
+) v
+WHERE r._change_type = 'removed'
+    AND r._content_hash IS NULL
+    AND r._row_key = v._row_key
+    AND r._row_hash = v._row_hash
+    AND r._source_file_date = v._source_file_date;
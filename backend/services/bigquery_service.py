@@ -6,6 +6,7 @@ Handles all BigQuery queries and data retrieval
 from typing import List, Dict, Any, Optional
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
+from google.api_core.exceptions import GoogleAPIError
 import os
 import re
 from pathlib import Path
@@ -15,9 +16,16 @@ from datetime import datetime
 import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
-from shared.config import DOWNLOAD_PROJECT_ID
+from shared.config import DOWNLOAD_PROJECT_ID, FORD_ORDERS_TABLE
 from data_extraction import OEMDownloader
 from processing.processors import OEM_PROCESSORS
+from processing.processors.ford import (
+    FORD_KEY_COLUMNS, FORD_COMPARISON_FIELDS, FORD_FIELD_MANIFEST, FORD_DB_CODE_FIELDS
+)
+from processing.comparison_sql import change_feed_sql, field_comparison_sql, db_comparison_sql
+from processing.bigquery_loader import (
+    FORD_FIELD_CHANGES_TABLE, FORD_FIELD_CHANGE_LOADS_TABLE, ORDERS_TABLE
+)
 
 
 class BigQueryService:
@@ -42,44 +50,80 @@ class BigQueryService:
         self.query_template = None
         self.use_parameters = False
     
-    def _load_query_template(self, query_type: str = "db_comparison"):
+    def _load_query_template(
+        self,
+        query_type: str = "db_comparison",
+        changes_table: Optional[str] = None
+    ):
         """
-        Load the SQL query template from file
+        Generate the SQL query template from the Ford field manifest
         
         Args:
-            query_type: Type of query to load
-                - "db_comparison": Load ford_orders_db_comarision.sql (for DB comparison)
-                - "field_comparison": Load ford_orders_field_comparison_parameterized.sql (for regular comparison)
+            query_type: Type of query to generate
+                - "db_comparison": Field changes cross-verified with db_orders (DB comparison)
+                - "field_comparison": Field changes only (regular comparison)
+            changes_table: Fully qualified ford_field_changes table to read the
+                           changes from (default: compare the snapshots)
         """
-        # SQL files are now in backend/queries/ directory
-        queries_dir = Path(__file__).parent.parent / "queries"
+        # Read Ford snapshots from the configured table (e.g. the history mode view)
+        ford_table = f"{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}"
         
         if query_type == "db_comparison":
-            # Load DB comparison query (ford_orders_db_comparision.sql)
-            query_file = queries_dir / "ford_orders_db_comparision.sql"
-            if not query_file.exists():
-                raise FileNotFoundError(f"DB comparison query file not found: {query_file}")
+            # db_orders snapshot is selected per request with @db_orders_date
+            self.query_template = db_comparison_sql(
+                ford_table,
+                f"{self.project_id}.{self.dataset_id}.{ORDERS_TABLE}",
+                FORD_KEY_COLUMNS,
+                FORD_FIELD_MANIFEST,
+                FORD_DB_CODE_FIELDS,
+                "ford",
+                changes_table
+            )
+            self.is_db_comparison = True
         elif query_type == "field_comparison":
-            # Load regular field comparison query
-            query_file = queries_dir / "ford_orders_field_comparison_parameterized.sql"
-            if not query_file.exists():
-                # Fallback to original file
-                query_file = queries_dir / "ford_orders_field_comparison.sql"
-                if not query_file.exists():
-                    raise FileNotFoundError(f"Field comparison query file not found: {query_file}")
+            self.query_template = field_comparison_sql(ford_table, FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, changes_table)
+            self.is_db_comparison = False
         else:
             raise ValueError(f"Unknown query_type: {query_type}. Must be 'db_comparison' or 'field_comparison'")
         
-        with open(query_file, 'r') as f:
-            self.query_template = f.read()
-            self.use_parameters = "@old_date" in self.query_template and "@new_date" in self.query_template
-            # Check if it's a DB comparison query by looking for DB comparison fields in SELECT
-            self.is_db_comparison = (
-                "DB_ORDERS_TABLE_PLACEHOLDER" in self.query_template or
-                "Ford_Field_Name" in self.query_template or
-                "DB_Orders_Value" in self.query_template or
-                "Sync_Status" in self.query_template
-            )
+        self.use_parameters = True
+    
+    def _materialized_changes_table(self, old_date: str, new_date: str) -> Optional[str]:
+        """
+        Get the ford_field_changes table if it holds the changes of a date pair
+        
+        The loader materializes the changes from the previous loaded date to
+        each new date (see BigQueryLoader.materialize_ford_field_changes). The
+        latest pair recorded for new_date is the one in its partition.
+        
+        Args:
+            old_date: Old date in YYYY-MM-DD format
+            new_date: New date in YYYY-MM-DD format
+            
+        Returns:
+            Fully qualified table name, or None if the pair must be compared
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        query = f"""
+        SELECT CAST(old_date AS STRING) AS old_date, source_table
+        FROM `{self.project_id}.{self.dataset_id}.{FORD_FIELD_CHANGE_LOADS_TABLE}`
+        WHERE new_date = @new_date
+        ORDER BY computed_at DESC
+        LIMIT 1
+        """
+        job_config = QueryJobConfig(query_parameters=[
+            ScalarQueryParameter("new_date", "DATE", new_date),
+        ])
+        try:
+            row = next(iter(self.client.query(query, job_config=job_config).result()), None)
+        except Exception:
+            # Nothing materialized yet (table missing) - compare the snapshots
+            return None
+        
+        if row and row.old_date == old_date and row.source_table == FORD_ORDERS_TABLE:
+            return f"{self.project_id}.{self.dataset_id}.{FORD_FIELD_CHANGES_TABLE}"
+        return None
     
     def _build_query_config(self, old_date: str, new_date: str, db_orders_date: Optional[str] = None):
         """
@@ -88,8 +132,8 @@ class BigQueryService:
         Args:
             old_date: Old date in YYYY-MM-DD format
             new_date: New date in YYYY-MM-DD format
-            db_orders_date: Date for db_orders table selection (YYYY-MM-DD format)
-                           If None, uses new_date as fallback
+            db_orders_date: db_orders snapshot to cross-verify against (YYYY-MM-DD format,
+                            the @db_orders_date parameter). If None, uses new_date
             
         Returns:
             Tuple of (query_string, QueryJobConfig)
@@ -99,36 +143,6 @@ class BigQueryService:
         
         query = self.query_template
         
-        # Handle db_orders table name replacement (for DB comparison query)
-        if self.is_db_comparison:
-            # Use db_orders_date if provided, otherwise fallback to new_date
-            date_to_use = db_orders_date if db_orders_date else new_date
-            
-            # Convert date (YYYY-MM-DD) to table name format (MM_DD_YYYY)
-            # e.g., 2025-11-10 -> 11_10_2025
-            try:
-                date_obj = datetime.strptime(date_to_use, "%Y-%m-%d")
-                table_suffix = date_obj.strftime("%m_%d_%Y")
-                db_orders_table = f"db_orders_{table_suffix}"
-                
-                # Replace placeholder if it exists
-                if "DB_ORDERS_TABLE_PLACEHOLDER" in query:
-                    query = query.replace("DB_ORDERS_TABLE_PLACEHOLDER", db_orders_table)
-                else:
-                    # Replace hardcoded table name pattern (db_orders_MM_DD_YYYY)
-                    query = re.sub(r"db_orders_\d{2}_\d{2}_\d{4}", db_orders_table, query)
-            except ValueError:
-                # If date parsing fails, try to extract from date string
-                # Fallback: assume format is correct and extract parts
-                parts = date_to_use.split("-")
-                if len(parts) == 3:
-                    table_suffix = f"{parts[1]}_{parts[2]}_{parts[0]}"
-                    db_orders_table = f"db_orders_{table_suffix}"
-                    if "DB_ORDERS_TABLE_PLACEHOLDER" in query:
-                        query = query.replace("DB_ORDERS_TABLE_PLACEHOLDER", db_orders_table)
-                    else:
-                        query = re.sub(r"db_orders_\d{2}_\d{2}_\d{4}", db_orders_table, query)
-        
         # Replace hardcoded dates if query is not parameterized
         if not self.use_parameters:
             # Replace all instances of hardcoded dates in various formats
@@ -147,12 +161,14 @@ class BigQueryService:
         
         if self.use_parameters:
             # Use parameterized query
-            job_config = QueryJobConfig(
-                query_parameters=[
-                    ScalarQueryParameter("old_date", "DATE", old_date),
-                    ScalarQueryParameter("new_date", "DATE", new_date),
-                ]
-            )
+            query_parameters = [
+                ScalarQueryParameter("old_date", "DATE", old_date),
+                ScalarQueryParameter("new_date", "DATE", new_date),
+            ]
+            if self.is_db_comparison:
+                # db_orders partition to cross-verify against (default: new_date)
+                query_parameters.append(ScalarQueryParameter("db_orders_date", "DATE", db_orders_date or new_date))
+            job_config = QueryJobConfig(query_parameters=query_parameters)
             return query, job_config
         else:
             # Fallback: string replacement for non-parameterized queries
@@ -162,6 +178,45 @@ class BigQueryService:
             query = query.replace("'2025-11-10' AS new_date", f"'{new_date}' AS new_date")
             return query, QueryJobConfig()
     
+    def resolve_ford_date(self, date: str) -> str:
+        """
+        Resolve a Ford snapshot date recorded as "same as" an earlier date
+        
+        Unchanged daily reports are not reloaded into ford_oem_orders (see
+        processing/snapshots.py); ford_oem_snapshot_aliases maps their date to
+        the date whose rows are identical.
+        
+        Args:
+            date: Date in YYYY-MM-DD format
+            
+        Returns:
+            Date whose rows to query (date itself if it is not an alias)
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        query = f"""
+        SELECT CAST(same_as_date AS STRING) AS same_as_date
+        FROM `{self.project_id}.{self.dataset_id}.ford_oem_snapshot_aliases`
+        WHERE snapshot_date = @date
+        ORDER BY recorded_at DESC
+        LIMIT 1
+        """
+        job_config = QueryJobConfig(
+            query_parameters=[
+                ScalarQueryParameter("date", "DATE", date),
+            ]
+        )
+        try:
+            row = next(iter(self.client.query(query, job_config=job_config).result()), None)
+        except NotFound:
+            # No alias recorded yet
+            return date
+        except GoogleAPIError as e:
+            # Aliases only redirect the query; query the requested date itself
+            print(f"⚠ Could not resolve snapshot alias for {date}: {e}")
+            return date
+        return row.same_as_date if row else date
+    
     def test_connection(self):
         """Test BigQuery connection"""
         try:
@@ -189,31 +244,42 @@ class BigQueryService:
             limit: Optional limit on number of results
             offset: Offset for pagination
             query_type: Type of query to execute
-                - "db_comparison": Use ford_orders_db_comarision.sql (for DB comparison)
-                - "field_comparison": Use ford_orders_field_comparison_parameterized.sql (for regular comparison)
-            db_orders_date: Date for db_orders table selection (YYYY-MM-DD format)
+                - "db_comparison": Field changes cross-verified with db_orders (for DB comparison)
+                - "field_comparison": Field changes only (for regular comparison)
+            db_orders_date: db_orders snapshot date to cross-verify against (YYYY-MM-DD format)
                            Only used for db_comparison query type
                            If None, uses new_date as fallback
             
         Returns:
             Dictionary with results and metadata
         """
-        # Load the appropriate query template
-        self._load_query_template(query_type)
-        
-        # Build query and config with parameters
-        query, job_config = self._build_query_config(old_date, new_date, db_orders_date)
-        
-        # Remove trailing semicolon if present (for adding LIMIT/OFFSET)
-        query = query.rstrip().rstrip(';')
+        db_orders_date = db_orders_date or new_date
         
-        # Add pagination if needed
-        if limit is not None:
-            query += f"\nLIMIT {limit}"
-        if offset > 0:
-            query += f"\nOFFSET {offset}"
+        # Checked up front so an unknown query_type still raises ValueError
+        if query_type not in ("db_comparison", "field_comparison"):
+            raise ValueError(f"Unknown query_type: {query_type}. Must be 'db_comparison' or 'field_comparison'")
         
         try:
+            # Query the rows of aliased ("same as") dates; db_orders still follows the requested date
+            resolved_old_date = self.resolve_ford_date(old_date)
+            resolved_new_date = self.resolve_ford_date(new_date)
+            
+            # Consecutive loaded dates were compared at load time: read their partition
+            changes_table = self._materialized_changes_table(resolved_old_date, resolved_new_date)
+            self._load_query_template(query_type, changes_table)
+            
+            # Build query and config with parameters
+            query, job_config = self._build_query_config(resolved_old_date, resolved_new_date, db_orders_date)
+            
+            # Remove trailing semicolon if present (for adding LIMIT/OFFSET)
+            query = query.rstrip().rstrip(';')
+            
+            # Add pagination if needed
+            if limit is not None:
+                query += f"\nLIMIT {limit}"
+            if offset > 0:
+                query += f"\nOFFSET {offset}"
+            
             # Execute query with parameterized config
             query_job = self.client.query(query, job_config=job_config)
             results = query_job.result()
@@ -228,6 +294,11 @@ class BigQueryService:
                         row_dict[key] = value.isoformat()
                     else:
                         row_dict[key] = value
+                # Label rows with the requested dates, not the alias targets
+                if "old_date" in row_dict:
+                    row_dict["old_date"] = old_date
+                if "new_date" in row_dict:
+                    row_dict["new_date"] = new_date
                 rows.append(row_dict)
             
             # Get total count by executing the same query without limit/offset
@@ -237,7 +308,7 @@ class BigQueryService:
                 total_count = len(rows)
             else:
                 # Execute a count query (simpler version)
-                count_query, count_config = self._build_query_config(old_date, new_date)
+                count_query, count_config = self._build_query_config(resolved_old_date, resolved_new_date, db_orders_date)
                 count_query = count_query.rstrip().rstrip(';')
                 count_query = f"SELECT COUNT(*) as total FROM ({count_query})"
                 
@@ -254,7 +325,10 @@ class BigQueryService:
                 "limit": limit,
                 "offset": offset,
                 "old_date": old_date,
-                "new_date": new_date
+                "new_date": new_date,
+                "resolved_old_date": resolved_old_date,
+                "resolved_new_date": resolved_new_date,
+                "materialized": changes_table is not None
             }
             
         except NotFound as e:
@@ -265,7 +339,8 @@ class BigQueryService:
     async def get_ford_field_comparison_stats(
         self,
         old_date: str,
-        new_date: str
+        new_date: str,
+        query_type: str = "field_comparison"
     ) -> Dict[str, Any]:
         """
         Get statistics about field comparisons
@@ -273,28 +348,42 @@ class BigQueryService:
         Args:
             old_date: Old date in YYYY-MM-DD format
             new_date: New date in YYYY-MM-DD format
+            query_type: Comparison query the statistics are computed over
+                        ("field_comparison" or "db_comparison", see
+                        get_ford_field_comparison)
             
         Returns:
             Dictionary with statistics
         """
-        # Build base query and config with parameters
-        base_query, job_config = self._build_query_config(old_date, new_date)
-        base_query = base_query.rstrip().rstrip(';')
-        
-        # Create stats query
-        stats_query = f"""
-        WITH field_changes AS (
-            {base_query}
-        )
-        SELECT 
-            Field_Name,
-            COUNT(*) as change_count
-        FROM field_changes
-        GROUP BY Field_Name
-        ORDER BY change_count DESC
-        """
+        if query_type not in ("db_comparison", "field_comparison"):
+            raise ValueError(f"Unknown query_type: {query_type}. Must be 'db_comparison' or 'field_comparison'")
         
         try:
+            # Query the rows of aliased ("same as") dates, like get_ford_field_comparison
+            resolved_old_date = self.resolve_ford_date(old_date)
+            resolved_new_date = self.resolve_ford_date(new_date)
+            
+            # Generated for this pair, not left over from the previous request
+            changes_table = self._materialized_changes_table(resolved_old_date, resolved_new_date)
+            self._load_query_template(query_type, changes_table)
+            
+            # Build base query and config with parameters
+            base_query, job_config = self._build_query_config(resolved_old_date, resolved_new_date, new_date)
+            base_query = base_query.rstrip().rstrip(';')
+            
+            # Create stats query
+            stats_query = f"""
+            WITH field_changes AS (
+                {base_query}
+            )
+            SELECT 
+                Field_Name,
+                COUNT(*) as change_count
+            FROM field_changes
+            GROUP BY Field_Name
+            ORDER BY change_count DESC
+            """
+            
             # Execute stats query with parameterized config
             query_job = self.client.query(stats_query, job_config=job_config)
             results = query_job.result()
@@ -338,9 +427,93 @@ class BigQueryService:
         except Exception as e:
             raise Exception(f"Stats query failed: {str(e)}")
     
+    async def get_ford_change_feed(
+        self,
+        start_date: str,
+        end_date: str,
+        fields: Optional[List[str]] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Get every Ford field change between consecutive snapshots in a date range
+        
+        Runs a single query over all dates in the range (see
+        processing.comparison_sql.change_feed_sql) instead of one two-date
+        comparison per day. Each change is labelled with the pair of dates it
+        happened between.
+        
+        Args:
+            start_date: First date in YYYY-MM-DD format
+            end_date: Last date in YYYY-MM-DD format
+            fields: Only return changes of these fields (default: all compared fields)
+            limit: Maximum number of changes to return
+            offset: Offset for pagination
+            
+        Returns:
+            Dictionary with results and metadata
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        if fields:
+            unknown = [field for field in fields if field not in FORD_COMPARISON_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        
+        query = change_feed_sql(
+            f"{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}",
+            FORD_KEY_COLUMNS,
+            fields or FORD_COMPARISON_FIELDS,
+            FORD_COMPARISON_FIELDS
+        )
+        job_config = QueryJobConfig(
+            query_parameters=[
+                ScalarQueryParameter("start_date", "DATE", start_date),
+                ScalarQueryParameter("end_date", "DATE", end_date),
+                ScalarQueryParameter("limit", "INT64", limit),
+                ScalarQueryParameter("offset", "INT64", offset),
+            ]
+        )
+        
+        try:
+            results = self.client.query(query, job_config=job_config).result()
+            
+            rows = []
+            total_count = 0
+            for row in results:
+                row_dict = dict(row.items())
+                total_count = row_dict.pop("total_count")
+                rows.append(row_dict)
+            
+            if not rows and offset > 0:
+                # Past the last page: the total isn't in any returned row
+                count_config = QueryJobConfig(query_parameters=job_config.query_parameters[:2] + [
+                    ScalarQueryParameter("limit", "INT64", 1),
+                    ScalarQueryParameter("offset", "INT64", 0),
+                ])
+                first = next(iter(self.client.query(query, job_config=count_config).result()), None)
+                total_count = first.total_count if first else 0
+            
+            return {
+                "data": rows,
+                "total": total_count,
+                "limit": limit,
+                "offset": offset,
+                "start_date": start_date,
+                "end_date": end_date,
+                "fields": fields
+            }
+            
+        except NotFound as e:
+            raise Exception(f"Table or dataset not found: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Query execution failed: {str(e)}")
+    
     def check_date_exists(self, date: str) -> bool:
         """
-        Check if a date exists in the ford_oem_orders table
+        Check if a date exists in the Ford orders table (FORD_ORDERS_TABLE)
+        
+        A date recorded as "same as" an earlier date exists if that date does.
         
         Args:
             date: Date in YYYY-MM-DD format
@@ -351,7 +524,7 @@ class BigQueryService:
         try:
             query = f"""
             SELECT COUNT(*) as count
-            FROM `{self.project_id}.{self.dataset_id}.ford_oem_orders`
+            FROM `{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}`
             WHERE _source_file_date = @date
             LIMIT 1
             """
@@ -360,7 +533,7 @@ class BigQueryService:
             
             job_config = QueryJobConfig(
                 query_parameters=[
-                    ScalarQueryParameter("date", "DATE", date),
+                    ScalarQueryParameter("date", "DATE", self.resolve_ford_date(date)),
                 ]
             )
             
@@ -372,32 +545,30 @@ class BigQueryService:
             # If table doesn't exist or error, return False
             return False
     
-    def check_db_orders_table_exists(self, date: str) -> bool:
+    def check_db_orders_date_exists(self, date: str) -> bool:
         """
-        Check if a db_orders table exists for a given date
+        Check if the db_orders table has a snapshot for a given date
         
         Args:
             date: Date in YYYY-MM-DD format
             
         Returns:
-            True if table exists, False otherwise
+            True if the snapshot_date partition has rows, False otherwise
         """
-        from datetime import datetime as dt
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        query = f"""
+        SELECT COUNT(*) AS count
+        FROM `{self.project_id}.{self.dataset_id}.{ORDERS_TABLE}`
+        WHERE snapshot_date = @date
+        """
+        job_config = QueryJobConfig(query_parameters=[
+            ScalarQueryParameter("date", "DATE", date),
+        ])
         try:
-            # Convert YYYY-MM-DD to MM_DD_YYYY format for table name
-            date_obj = dt.strptime(date, "%Y-%m-%d")
-            table_suffix = date_obj.strftime("%m_%d_%Y")
-            table_name = f"db_orders_{table_suffix}"
-            
-            # Check if table exists
-            table_ref = self.client.dataset(self.dataset_id).table(table_name)
-            try:
-                self.client.get_table(table_ref)
-                return True
-            except Exception:
-                return False
-        except Exception as e:
-            # If any error, return False
+            return next(iter(self.client.query(query, job_config=job_config).result())).count > 0
+        except Exception:
+            # If table doesn't exist or error, return False
             return False
     
     def ensure_db_orders_date_available(self, date: str) -> Dict[str, Any]:
@@ -413,11 +584,11 @@ class BigQueryService:
         """
         from datetime import datetime as dt
         
-        # Check if table already exists
-        if self.check_db_orders_table_exists(date):
+        # Check if the snapshot is already loaded
+        if self.check_db_orders_date_exists(date):
             return {
                 "status": "exists",
-                "message": f"db_orders table for {date} already exists in BigQuery",
+                "message": f"db_orders snapshot for {date} already exists in BigQuery",
                 "action_taken": None
             }
         
@@ -428,9 +599,23 @@ class BigQueryService:
         except ValueError:
             raise ValueError(f"Invalid date format: {date}. Expected YYYY-MM-DD")
         
+        # A date loaded before db_orders was partitioned: copy its daily table
+        daily_table = f"db_orders_{date_obj.strftime('%m_%d_%Y')}"
+        try:
+            self.client.get_table(self.client.dataset(self.dataset_id).table(daily_table))
+            from processing.bigquery_loader import BigQueryLoader
+            if BigQueryLoader().write_orders_partition(daily_table, date):
+                return {
+                    "status": "success",
+                    "message": f"Copied {daily_table} into the db_orders snapshot for {date}",
+                    "action_taken": ["copy"]
+                }
+        except NotFound:
+            pass
+        
         result = {
             "status": "processing",
-            "message": f"db_orders table for {date} not found. Extracting and processing...",
+            "message": f"db_orders snapshot for {date} not found. Extracting and processing...",
             "action_taken": [],
             "date": date,
             "process_date": process_date
@@ -469,7 +654,7 @@ class BigQueryService:
             import time
             time.sleep(2)
             
-            if self.check_db_orders_table_exists(date):
+            if self.check_db_orders_date_exists(date):
                 result["status"] = "success"
                 result["message"] = f"Successfully extracted, processed, and uploaded db_orders for {date}"
                 result["action_taken"].append("upload")
@@ -16,6 +16,8 @@ sys.path.insert(0, str(project_root))
 from data_extraction import OEMDownloader
 from processing.processors import OEM_PROCESSORS
 from processing.bigquery_loader import BigQueryLoader
+from processing.load_jobs import LoadJobTracker, print_load_event
+from shared.config import FORD_ORDERS_TABLE
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 
@@ -67,7 +69,7 @@ class ProcessingService:
         try:
             check_query = f"""
             SELECT COUNT(*) as row_count
-            FROM `{self.project_id}.{self.dataset_id}.ford_oem_orders`
+            FROM `{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}`
             WHERE _source_file_date = '{date}'
             """
             query_job = self.client.query(check_query)
@@ -94,7 +96,7 @@ class ProcessingService:
         """
         data_query = f"""
         SELECT *
-        FROM `{self.project_id}.{self.dataset_id}.ford_oem_orders`
+        FROM `{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}`
         WHERE _source_file_date = '{date}'
         ORDER BY Order_Number, Body_Code, Model_Year
         """
@@ -121,7 +123,7 @@ class ProcessingService:
             # Get total count
             count_query = f"""
             SELECT COUNT(*) as total
-            FROM `{self.project_id}.{self.dataset_id}.ford_oem_orders`
+            FROM `{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}`
             WHERE _source_file_date = '{date}'
             """
             count_job = self.client.query(count_query)
@@ -310,6 +312,9 @@ class ProcessingService:
                     # Step 2: Process
                     result["steps"]["process"] = {"status": "in_progress", "message": ""}
                     processor = OEM_PROCESSORS["ford"]()
+                    # Submit the BigQuery load instead of waiting inside the processor;
+                    # its completion event gives the upload status below
+                    processor.load_jobs = LoadJobTracker()
                     
                     # Process the downloaded file
                     output_csv = processor.convert_excel_to_csv(
@@ -322,6 +327,25 @@ class ProcessingService:
                         "message": f"Processed: {output_csv.name}",
                         "output_file": str(output_csv)
                     }
+                    
+                    for event in processor.load_jobs.as_completed(timeout=600):
+                        print_load_event(event)
+                        if event["state"] == "done":
+                            result["steps"]["bigquery_upload"] = {
+                                "status": "success",
+                                "message": f"Data uploaded to BigQuery: {event['rows']} rows (load job {event['job_id']}, {event['seconds']:.1f}s)",
+                                "row_count": event["rows"],
+                                "job_id": event["job_id"],
+                                "source_file_date": date
+                            }
+                        else:
+                            result["steps"]["bigquery_upload"] = {
+                                "status": "warning",
+                                "message": f"BigQuery load job {event['job_id']} failed: {event['error']}",
+                                "job_id": event["job_id"],
+                                "source_file_date": date,
+                                "csv_file": str(output_csv)
+                            }
             
             # Step 3: Upload to BigQuery (should be automatic, but verify)
             # Only initialize if not already set (for existing CSV case, it's already handled)
@@ -330,7 +354,10 @@ class ProcessingService:
             
             # Extract date from output filename to check BigQuery
             date_match = re.search(r'(\d{4})(\d{2})(\d{2})', output_csv.name)
-            if date_match:
+            if "job_id" in result["steps"]["bigquery_upload"]:
+                # Status already set from the load job's completion event
+                pass
+            elif date_match:
                 year, month, day = date_match.groups()
                 source_file_date = f"{year}-{month}-{day}"
                 
@@ -347,7 +374,7 @@ class ProcessingService:
                     try:
                         verify_query = f"""
                         SELECT COUNT(*) as row_count
-                        FROM `{self.project_id}.{self.dataset_id}.ford_oem_orders`
+                        FROM `{self.project_id}.{self.dataset_id}.{FORD_ORDERS_TABLE}`
                         WHERE _source_file_date = '{source_file_date}'
                         """
                         query_job = self.client.query(verify_query)
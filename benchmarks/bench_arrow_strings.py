@@ -0,0 +1,120 @@
+"""
+Benchmark: default NumPy/object columns vs Arrow-backed, dictionary-encoded strings
+
+Runs each Ford Dealer Report in data/input through read + sanitize +
+apply_schema + process_dataframe + clean_dataframe_values + CSV write, once in
+the default mode and once with arrow_strings = True. Each run happens in its
+own subprocess so peak RSS (ru_maxrss) is measured per mode, not accumulated.
+Reports the DataFrame's deep memory usage, the clean step time (the
+escape_quotes CSV pass, skipped by default), peak RSS and checks that both
+modes write byte-identical CSV.
+
+The Excel cache is disabled so both modes pay the same read cost.
+
+Usage:
+    python benchmarks/bench_arrow_strings.py [--files N]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.processors import FordProcessor
+
+
+def run_mode(excel_file: Path, arrow_strings: bool) -> dict:
+    """Convert one file in this process and return its measurements"""
+    warnings.filterwarnings("ignore")
+    processor = FordProcessor()
+    processor.use_excel_cache = False
+    processor.arrow_strings = arrow_strings
+
+    with redirect_stdout(io.StringIO()):
+        df = processor.sanitize_dataframe_columns(processor.read_excel_file(excel_file))
+        df = processor.process_dataframe(processor.apply_schema(df))
+    memory = int(df.memory_usage(deep=True).sum())
+
+    start = time.perf_counter()
+    df = processor.clean_dataframe_values(df, inplace=True)
+    clean_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_csv = Path(tmp) / "out.csv"
+        processor.write_output(df, output_csv)
+        digest = hashlib.sha256(output_csv.read_bytes()).hexdigest()
+
+    return {
+        "rows": len(df),
+        "memory_mb": memory / 1024 / 1024,
+        "clean_seconds": clean_seconds,
+        "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "sha256": digest,
+    }
+
+
+def measure(excel_file: Path, arrow_strings: bool) -> dict:
+    """Run one mode in a fresh interpreter so peak RSS is per mode"""
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", str(excel_file)] + (["--arrow"] if arrow_strings else []),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, help="Only benchmark the N most recent reports")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--arrow", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(Path(args.worker), args.arrow)))
+        return
+
+    processor = FordProcessor()
+    excel_files = sorted(
+        processor.find_excel_files(),
+        key=lambda path: processor.extract_date_from_filename(path.name) or ""
+    )
+    if args.files:
+        excel_files = excel_files[-args.files:]
+    if not excel_files:
+        print(f"No Ford reports found in {processor.input_dir}")
+        sys.exit(1)
+
+    print(
+        f"{'File date':<12} {'Rows':>6} {'DF MB':>13} {'Clean (s)':>15} {'Peak RSS MB':>15}"
+    )
+    print(f"{'':<12} {'':>6} {'default/arrow':>13} {'default/arrow':>15} {'default/arrow':>15}")
+    for excel_file in excel_files:
+        default = measure(excel_file, arrow_strings=False)
+        arrow = measure(excel_file, arrow_strings=True)
+        if default["sha256"] != arrow["sha256"]:
+            print(f"✗ Output mismatch in {excel_file.name}")
+            sys.exit(1)
+
+        date_label = processor.extract_date_from_filename(excel_file.name) or excel_file.stem
+        print(
+            f"{date_label:<12} {default['rows']:>6} "
+            f"{default['memory_mb']:>6.1f}/{arrow['memory_mb']:<6.1f} "
+            f"{default['clean_seconds']:>7.3f}/{arrow['clean_seconds']:<7.3f} "
+            f"{default['maxrss_mb']:>7.0f}/{arrow['maxrss_mb']:<7.0f}"
+        )
+    print("✓ Outputs identical")
+
+
+if __name__ == "__main__":
+    main()
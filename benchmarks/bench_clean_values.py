@@ -0,0 +1,91 @@
+"""
+Benchmark: column-wise quote escaping vs the per-cell DataFrame.map lambda
+
+Reads every Ford Dealer Report in data/input (served from the Parquet cache
+after the first run) and runs it through sanitize + apply_schema + process_dataframe, then
+times BaseOEMProcessor.clean_dataframe_values against the original per-cell
+implementation and checks that the outputs match. The pass only runs for
+CSV output with escape_quotes set; by default the CSV writer does the
+escaping and it is skipped entirely.
+
+Usage:
+    python benchmarks/bench_clean_values.py [--repeat N]
+"""
+
+import argparse
+import io
+import sys
+import time
+import warnings
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.processors import FordProcessor
+
+
+def legacy_clean_values(df):
+    """Original per-cell implementation from BaseOEMProcessor.clean_dataframe_values"""
+    return df.map(lambda x: x.replace('"', '""') if isinstance(x, str) else x)
+
+
+def as_values(df):
+    """Object-dtype copy with missing values as None, ignoring dtype inference differences"""
+    values = df.astype(object)
+    return values.where(values.notna(), None)
+
+
+def time_it(func, repeat: int) -> float:
+    """Return the best wall-clock time of func() over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    processor = FordProcessor()
+    excel_files = sorted(processor.find_excel_files())
+    if not excel_files:
+        print(f"No Ford reports found in {processor.input_dir}")
+        sys.exit(1)
+
+    print(f"{'File date':<12} {'Rows':>7} {'Cells':>8} {'Legacy (s)':>11} {'Vectorized (s)':>15} {'Speedup':>8}")
+    total_legacy = total_vectorized = 0.0
+    for excel_file in excel_files:
+        with redirect_stdout(io.StringIO()):
+            df = processor.sanitize_dataframe_columns(processor.read_excel_file(excel_file))
+            df = processor.process_dataframe(processor.apply_schema(df))
+
+        legacy = time_it(lambda: legacy_clean_values(df), args.repeat)
+        vectorized = time_it(lambda: processor.clean_dataframe_values(df), args.repeat)
+
+        # DataFrame.map re-infers dtypes, so compare values rather than dtypes
+        if not as_values(legacy_clean_values(df)).equals(as_values(processor.clean_dataframe_values(df))):
+            print(f"✗ Output mismatch in {excel_file.name}")
+            sys.exit(1)
+
+        total_legacy += legacy
+        total_vectorized += vectorized
+        date_label = processor.extract_date_from_filename(excel_file.name) or excel_file.stem
+        print(
+            f"{date_label:<12} {len(df):>7} {df.size:>8} "
+            f"{legacy:>11.3f} {vectorized:>15.3f} {legacy / vectorized:>7.1f}x"
+        )
+
+    print(
+        f"{'Total':<12} {'':>7} {'':>8} {total_legacy:>11.3f} {total_vectorized:>15.3f} "
+        f"{total_legacy / total_vectorized:>7.1f}x"
+    )
+    print("✓ Outputs identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: vectorized date normalization vs the per-cell strptime closure
+
+Reads every Ford Dealer Report in data/input (served from the Parquet cache
+after the first run), then times FordProcessor's date conversion both ways
+and checks that the outputs match.
+
+Usage:
+    python benchmarks/bench_date_normalization.py [--repeat N]
+"""
+
+import argparse
+import io
+import sys
+import time
+import warnings
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.processors import FordProcessor
+from processing.processors.ford import FORD_SCHEMA
+from processing.utils import normalize_date_series
+
+
+def legacy_convert_date(value):
+    """Original per-cell implementation from FordProcessor.process_dataframe"""
+    if pd.isna(value) or value == '' or value is None:
+        return None
+    value_str = str(value).strip()
+    if not value_str:
+        return None
+    try:
+        date_obj = datetime.strptime(value_str, '%m/%d/%Y')
+        return date_obj.strftime('%Y-%m-%d')
+    except ValueError:
+        try:
+            datetime.strptime(value_str, '%Y-%m-%d')
+            return value_str
+        except ValueError:
+            return None
+
+
+def time_it(func, repeat: int) -> float:
+    """Return the best wall-clock time of func() over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    processor = FordProcessor()
+    excel_files = sorted(processor.find_excel_files())
+    if not excel_files:
+        print(f"No Ford reports found in {processor.input_dir}")
+        sys.exit(1)
+
+    print(f"{'File date':<12} {'Rows':>7} {'Cells':>8} {'Legacy (s)':>11} {'Vectorized (s)':>15} {'Speedup':>8}")
+    total_legacy = total_vectorized = 0.0
+    for excel_file in excel_files:
+        with redirect_stdout(io.StringIO()):
+            df = processor.sanitize_dataframe_columns(processor.read_excel_file(excel_file))
+        columns = [col for col in FORD_SCHEMA.columns_of_type("date") if col in df.columns]
+
+        legacy = time_it(lambda: [df[col].apply(legacy_convert_date) for col in columns], args.repeat)
+        vectorized = time_it(lambda: [normalize_date_series(df[col]) for col in columns], args.repeat)
+
+        for col in columns:
+            expected = df[col].apply(legacy_convert_date).astype(object)
+            actual = normalize_date_series(df[col])
+            if not expected.where(expected.notna(), None).equals(actual):
+                print(f"✗ Output mismatch in {excel_file.name}, column {col}")
+                sys.exit(1)
+
+        total_legacy += legacy
+        total_vectorized += vectorized
+        date_label = processor.extract_date_from_filename(excel_file.name) or excel_file.stem
+        print(
+            f"{date_label:<12} {len(df):>7} {len(df) * len(columns):>8} "
+            f"{legacy:>11.3f} {vectorized:>15.3f} {legacy / vectorized:>7.1f}x"
+        )
+
+    print(
+        f"{'Total':<12} {'':>7} {'':>8} {total_legacy:>11.3f} {total_vectorized:>15.3f} "
+        f"{total_legacy / total_vectorized:>7.1f}x"
+    )
+    print("✓ Outputs identical")
+
+
+if __name__ == "__main__":
+    main()
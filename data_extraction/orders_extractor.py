@@ -3,6 +3,7 @@ Orders Extractor - Export PostgreSQL orders data to CSV
 """
 
 import csv
+import gzip
 import sys
 from pathlib import Path
 from typing import Optional
@@ -17,7 +18,9 @@ from shared.config import (
     DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD,
     ORDERS_QUERY, OUTPUT_DIR
 )
-from processing.utils import clean_value, upload_to_gcs, get_timestamp_string, get_file_size_mb
+from processing.utils import (
+    clean_value, upload_to_gcs, get_timestamp_string, get_file_size_mb, get_gzip_uncompressed_size
+)
 from processing.bigquery_loader import BigQueryLoader
 
 
@@ -34,16 +37,20 @@ class OrdersExtractor:
         self.output_dir = output_dir or OUTPUT_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def export_to_csv(self, upload_to_gcs_flag: bool = True) -> Path:
+    def export_to_csv(self, upload_to_gcs_flag: bool = True, compression: Optional[str] = None) -> Path:
         """
         Export PostgreSQL orders data to CSV file
         
         Args:
             upload_to_gcs_flag: Whether to upload to GCS after export
+            compression: "gzip" to write a .csv.gz file, or None for plain CSV
             
         Returns:
             Path to the created CSV file
         """
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression '{compression}'")
+        
         print("=" * 60)
         print("PostgreSQL to CSV Export for BigQuery")
         print("=" * 60)
@@ -53,7 +60,8 @@ class OrdersExtractor:
         # This ensures only one file per day - rerunning overwrites
         from datetime import datetime
         date_only = datetime.now().strftime("%Y%m%d")
-        output_csv = self.output_dir / f"v_orders_api_bigquery_{date_only}.csv"
+        extension = "csv.gz" if compression == "gzip" else "csv"
+        output_csv = self.output_dir / f"v_orders_api_bigquery_{date_only}.{extension}"
         
         try:
             # Connect to PostgreSQL
@@ -96,7 +104,8 @@ class OrdersExtractor:
             
             # Write to CSV
             print(f"Writing to CSV file: {output_csv}")
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+            opener = gzip.open if compression == "gzip" else open
+            with opener(output_csv, 'wt', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
                 
                 # Write header
@@ -122,6 +131,9 @@ class OrdersExtractor:
             # Show file info
             file_size_mb = get_file_size_mb(output_csv)
             print(f"File size: {file_size_mb:.2f} MB")
+            if compression == "gzip" and file_size_mb:
+                uncompressed_mb = get_gzip_uncompressed_size(output_csv) / (1024 * 1024)
+                print(f"Uncompressed size: {uncompressed_mb:.2f} MB ({uncompressed_mb / file_size_mb:.1f}x compression)")
             print()
             
             # Upload to GCS
@@ -228,7 +228,7 @@ export default function FordDBComparison() {
             value={dbOrdersDate}
             onChange={(e) => setDbOrdersDate(e.target.value)}
             className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-primary-500"
-            title="Select the date for the db_orders table (e.g., db_orders_11_10_2025)"
+            title="Select the db_orders snapshot date to compare against"
           />
         </div>
         <div>
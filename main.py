@@ -12,6 +12,290 @@ sys.path.insert(0, str(project_root))
 
 from data_extraction import OrdersExtractor, OEMDownloader
 from processing.processors import OEM_PROCESSORS
+from processing.processors.base_oem import LOAD_MODES
+from processing.parallel import convert_files_parallel
+
+
+def add_conversion_arguments(parser: argparse.ArgumentParser):
+    """
+    Add Excel conversion options shared by the oem, ford and ford-pipeline commands
+    
+    Args:
+        parser: Subcommand parser to extend
+    """
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process Excel files in row chunks to keep memory flat on large reports"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Rows per chunk in --stream mode (default: EXCEL_CHUNK_SIZE or 50000)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse Excel files instead of using the Parquet cache"
+    )
+    parser.add_argument(
+        "--escape-quotes",
+        action="store_true",
+        help="Pre-double quotes in CSV values like older outputs, instead of leaving the escaping to "
+             "the CSV writer (files that are not loaded to BigQuery only)"
+    )
+    parser.add_argument(
+        "--arrow-strings",
+        action="store_true",
+        help="Hold text columns as Arrow strings, dictionary-encoding low-cardinality ones (lower memory)"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output file format: csv (default) or typed parquet with DATE columns, loaded to BigQuery as Parquet"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip"],
+        help="Write gzip-compressed CSV (.csv.gz) with minimal quoting (csv output only)"
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Don't reload a report whose rows match the previous loaded date; record a 'same as' alias instead"
+    )
+    parser.add_argument(
+        "--load-mode",
+        choices=LOAD_MODES,
+        help="Ford BigQuery load: append a full daily copy to ford_oem_orders, replace the date's "
+             "partition of ford_oem_orders (safe to rerun), merge changed rows into "
+             "ford_oem_orders_history, append only new/changed/removed rows to ford_oem_orders_delta, "
+             "or write the processed rows to ford_oem_orders with the Storage Write API, without GCS "
+             "(default: FORD_LOAD_MODE or append)"
+    )
+    parser.add_argument(
+        "--tie-break",
+        choices=["first", "last", "latest"],
+        help="Row kept when an order key repeats in a report: first or last in report order, or latest "
+             "by the OEM's update date column (default: ROW_KEY_TIE_BREAK or first)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Convert up to N files in parallel worker processes (multi-file runs only, default: 1)"
+    )
+
+
+def processor_settings(args: argparse.Namespace) -> dict:
+    """
+    Get processor attributes to override from add_conversion_arguments()
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Dictionary of attribute name -> value
+    """
+    settings = {}
+    if args.no_cache:
+        settings["use_excel_cache"] = False
+    if args.escape_quotes:
+        settings["escape_quotes"] = True
+    if args.arrow_strings:
+        settings["arrow_strings"] = True
+    if args.skip_unchanged:
+        settings["skip_unchanged"] = True
+    if args.load_mode:
+        settings["load_mode"] = args.load_mode
+    if args.tie_break:
+        settings["tie_break"] = args.tie_break
+    return settings
+
+
+def configure_processor(processor, args: argparse.Namespace):
+    """
+    Apply processor-level options from add_conversion_arguments()
+    
+    Args:
+        processor: OEM processor instance
+        args: Parsed command line arguments
+    """
+    for name, value in processor_settings(args).items():
+        setattr(processor, name, value)
+
+
+def conversion_options(args: argparse.Namespace) -> dict:
+    """
+    Get convert_excel_to_csv() keyword arguments from add_conversion_arguments()
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Dictionary of keyword arguments
+    """
+    return {
+        "streaming": args.stream,
+        "chunk_size": args.chunk_size,
+        "output_format": args.output_format,
+        "compression": args.compression,
+    }
+
+
+def convert_files(processor, oem_name: str, excel_files: list[Path], args: argparse.Namespace) -> int:
+    """
+    Convert several Excel files, in parallel worker processes when --jobs > 1
+    
+    With --jobs > 1, workers only convert; GCS upload and BigQuery load run
+    here in the parent once all conversions are done, batched into one load
+    job where the load mode allows it (see upload_outputs). Otherwise Ford
+    loads that can be submitted without waiting (see submits_loads) run while
+    the next file converts. Files are handled oldest report first, so
+    --skip-unchanged compares each one with the previous day.
+    
+    Args:
+        processor: Configured OEM processor (used directly, and for uploads)
+        oem_name: Key in OEM_PROCESSORS
+        excel_files: Excel files to convert
+        args: Parsed command line arguments
+        
+    Returns:
+        Number of files converted successfully
+    """
+    if hasattr(processor, 'extract_date_from_filename'):
+        excel_files = sorted(
+            excel_files,
+            key=lambda excel_file: (processor.extract_date_from_filename(Path(excel_file).name) or "", str(excel_file))
+        )
+    
+    if args.jobs <= 1 or len(excel_files) <= 1:
+        from processing.load_jobs import LoadJobTracker, print_load_event
+        
+        # Several files are uploaded together once converted (one batched BigQuery load),
+        # or each file's load job runs while the next file converts
+        batched = not args.no_upload and len(excel_files) > 1 and processor.batches_loads()
+        if not args.no_upload and len(excel_files) > 1 and not batched and processor.submits_loads():
+            processor.load_jobs = LoadJobTracker(ordered=True)
+        outputs = []
+        processed_count = 0
+        for excel_file in excel_files:
+            print(f"\nProcessing: {excel_file.name}")
+            print("-" * 60)
+            try:
+                output = processor.convert_excel_to_csv(
+                    excel_file=excel_file,
+                    upload_to_gcs_flag=not args.no_upload and not batched,
+                    **conversion_options(args)
+                )
+                outputs.append((output, processor.last_snapshot))
+                processed_count += 1
+            except SystemExit:
+                # convert_excel_to_csv() already printed the error
+                print(f"✗ Error processing {excel_file.name}")
+                continue
+            except Exception as e:
+                print(f"✗ Error processing {excel_file.name}: {e}")
+                continue
+            finally:
+                if processor.load_jobs is not None:
+                    for event in processor.load_jobs.poll():
+                        print_load_event(event)
+        if batched and outputs:
+            print()
+            print(f"Uploading {len(outputs)} converted file(s)...")
+            print("-" * 60)
+            processor.upload_outputs(outputs)
+        if processor.load_jobs is not None:
+            print()
+            print(f"Waiting for {len(processor.load_jobs)} load job(s)...")
+            for event in processor.load_jobs.as_completed():
+                print_load_event(event)
+            processor.load_jobs = None
+        return processed_count
+    
+    results = convert_files_parallel(
+        oem_name,
+        excel_files,
+        args.jobs,
+        input_dir=processor.input_dir,
+        output_dir=processor.output_dir,
+        settings=processor_settings(args),
+        options=conversion_options(args)
+    )
+    
+    converted = [result for result in results if not result["error"]]
+    failed = [result for result in results if result["error"]]
+    for result in failed:
+        print()
+        print(f"✗ Error processing {result['file'].name}: {result['error']}")
+        print(result["log"].rstrip())
+    
+    if converted and not args.no_upload:
+        print()
+        print(f"Uploading {len(converted)} converted file(s)...")
+        print("-" * 60)
+        processor.upload_outputs([(result["output"], result["snapshot"]) for result in converted])
+    
+    print()
+    print(f"Converted {len(converted)}/{len(results)} file(s)")
+    for result in results:
+        status = f"✗ {result['error']}" if result["error"] else f"✓ {result['output'].name}"
+        print(f"  {result['file'].name}: {status}")
+    return len(converted)
+
+
+def run_ford_diff(args: argparse.Namespace):
+    """
+    Compare two Ford snapshots locally and print (or save) the field changes
+    
+    Args:
+        args: Parsed ford-diff arguments
+    """
+    import time
+    from processing.diff import load_snapshot, diff_snapshots
+    
+    processor = OEM_PROCESSORS["ford"]()
+    if args.no_cache:
+        processor.use_excel_cache = False
+    
+    start = time.perf_counter()
+    snapshots = []
+    for label, path in (("Old", args.old), ("New", args.new)):
+        if not path.exists():
+            print(f"✗ Error: File not found: {path}")
+            sys.exit(1)
+        df = load_snapshot(path, processor)
+        print(f"✓ {label} snapshot: {path.name} ({len(df)} rows)")
+        snapshots.append(df)
+    load_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    changes = diff_snapshots(*snapshots, processor.ROW_KEY_COLUMNS, processor.ROW_HASH_COLUMNS)
+    diff_seconds = time.perf_counter() - start
+    
+    orders = changes[list(processor.ROW_KEY_COLUMNS)].drop_duplicates()
+    print()
+    print(f"Field changes: {len(changes)} across {len(orders)} order(s) "
+          f"({len(processor.ROW_HASH_COLUMNS)} fields compared)")
+    print(f"  Load: {load_seconds:.2f}s, diff: {diff_seconds:.2f}s")
+    
+    if len(changes):
+        print()
+        print("Changes per field:")
+        for field_name, count in changes["Field_Name"].value_counts().items():
+            print(f"  {field_name:<40} {count:>7}")
+    
+    if args.output:
+        changes.to_csv(args.output, index=False, encoding="utf-8")
+        print()
+        print(f"✓ Saved {len(changes)} change(s) to {args.output}")
+    elif len(changes) and args.show:
+        print()
+        print(changes.head(args.show).to_string(index=False))
+        if len(changes) > args.show:
+            print(f"... {len(changes) - args.show} more (use --output to save all)")
 
 
 def main():
@@ -38,6 +322,16 @@ def main():
         type=Path,
         help="Output directory for CSV files (default: data/output)"
     )
+    orders_parser.add_argument(
+        "--compression",
+        choices=["gzip"],
+        help="Write gzip-compressed CSV (.csv.gz)"
+    )
+    orders_parser.add_argument(
+        "--migrate-daily-tables",
+        action="store_true",
+        help="Copy the daily db_orders_MM_DD_YYYY tables into the partitioned db_orders table instead of exporting"
+    )
     
     # OEM command - dynamic for all OEMs
     oem_parser = subparsers.add_parser(
@@ -69,6 +363,12 @@ def main():
         action="store_true",
         help="Skip GCS upload after conversion"
     )
+    oem_parser.add_argument(
+        "--all-files",
+        action="store_true",
+        help="Convert every matching Excel file in the input directory, not just the most recent"
+    )
+    add_conversion_arguments(oem_parser)
     
     # Legacy Ford command (for backward compatibility)
     ford_parser = subparsers.add_parser("ford", help="Convert Ford Excel files to CSV (legacy)")
@@ -92,6 +392,22 @@ def main():
         action="store_true",
         help="Skip GCS upload after conversion"
     )
+    ford_parser.add_argument(
+        "--all-files",
+        action="store_true",
+        help="Convert every matching Excel file in the input directory, not just the most recent"
+    )
+    ford_parser.add_argument(
+        "--partition-table",
+        action="store_true",
+        help="Rebuild an unpartitioned ford_oem_orders table partitioned on _source_file_date instead of converting"
+    )
+    ford_parser.add_argument(
+        "--unescape-quotes",
+        action="store_true",
+        help="Un-double the quotes earlier CSV loads stored in the Ford tables instead of converting"
+    )
+    add_conversion_arguments(ford_parser)
     
     # Download command - Download OEM files from GCS
     download_parser = subparsers.add_parser(
@@ -159,6 +475,41 @@ def main():
         action="store_true",
         help="Skip GCS upload after processing"
     )
+    add_conversion_arguments(ford_pipeline_parser)
+    
+    # Ford diff command - Compare two snapshots locally
+    ford_diff_parser = subparsers.add_parser(
+        "ford-diff",
+        help="Compare two Ford snapshots locally (field changes, same output as the comparison query)"
+    )
+    ford_diff_parser.add_argument(
+        "--old",
+        type=Path,
+        required=True,
+        help="Older snapshot: processed .csv/.csv.gz/.parquet or a Ford Dealer Report .xlsx"
+    )
+    ford_diff_parser.add_argument(
+        "--new",
+        type=Path,
+        required=True,
+        help="Newer snapshot: processed .csv/.csv.gz/.parquet or a Ford Dealer Report .xlsx"
+    )
+    ford_diff_parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write all field changes to this CSV file"
+    )
+    ford_diff_parser.add_argument(
+        "--show",
+        type=int,
+        default=20,
+        help="Number of changes to print when --output is not given (default: 20)"
+    )
+    ford_diff_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse Excel files instead of using the Parquet cache"
+    )
     
     # All command
     all_parser = subparsers.add_parser("all", help="Run orders and all OEM processors")
@@ -175,9 +526,17 @@ def main():
         sys.exit(1)
     
     try:
-        if args.command == "orders":
+        if args.command == "orders" and args.migrate_daily_tables:
+            from processing.bigquery_loader import BigQueryLoader
+            if not BigQueryLoader().migrate_daily_orders_tables():
+                sys.exit(1)
+            
+        elif args.command == "orders":
             extractor = OrdersExtractor(output_dir=args.output_dir)
-            extractor.export_to_csv(upload_to_gcs_flag=not args.no_upload)
+            extractor.export_to_csv(
+                upload_to_gcs_flag=not args.no_upload,
+                compression=args.compression
+            )
             
         elif args.command == "oem":
             # Dynamic OEM processor
@@ -186,10 +545,31 @@ def main():
                 input_dir=args.input_dir,
                 output_dir=args.output_dir
             )
-            processor.convert_excel_to_csv(
-                excel_file=args.input_file,
-                upload_to_gcs_flag=not args.no_upload
-            )
+            configure_processor(processor, args)
+            if args.all_files:
+                excel_files = sorted(processor.find_excel_files())
+                if not excel_files:
+                    print(f"✗ No Excel files matching '{processor.file_pattern}' found in {processor.input_dir}")
+                    sys.exit(1)
+                processed_count = convert_files(processor, args.oem_name, excel_files, args)
+                if processed_count < len(excel_files):
+                    sys.exit(1)
+            else:
+                processor.convert_excel_to_csv(
+                    excel_file=args.input_file,
+                    upload_to_gcs_flag=not args.no_upload,
+                    **conversion_options(args)
+                )
+            
+        elif args.command == "ford" and args.partition_table:
+            from processing.bigquery_loader import BigQueryLoader
+            if not BigQueryLoader().partition_ford_orders_table():
+                sys.exit(1)
+            
+        elif args.command == "ford" and args.unescape_quotes:
+            from processing.bigquery_loader import BigQueryLoader
+            if not BigQueryLoader().unescape_ford_quotes():
+                sys.exit(1)
             
         elif args.command == "ford":
             # Legacy Ford command (backward compatibility)
@@ -198,10 +578,21 @@ def main():
                 input_dir=args.input_dir,
                 output_dir=args.output_dir
             )
-            processor.convert_excel_to_csv(
-                excel_file=args.input_file,
-                upload_to_gcs_flag=not args.no_upload
-            )
+            configure_processor(processor, args)
+            if args.all_files:
+                excel_files = sorted(processor.find_excel_files())
+                if not excel_files:
+                    print(f"✗ No Excel files matching '{processor.file_pattern}' found in {processor.input_dir}")
+                    sys.exit(1)
+                processed_count = convert_files(processor, "ford", excel_files, args)
+                if processed_count < len(excel_files):
+                    sys.exit(1)
+            else:
+                processor.convert_excel_to_csv(
+                    excel_file=args.input_file,
+                    upload_to_gcs_flag=not args.no_upload,
+                    **conversion_options(args)
+                )
             
         elif args.command == "download":
             # Download OEM files from GCS
@@ -272,22 +663,11 @@ def main():
             print("Step 2: Processing downloaded Ford files...")
             print("-" * 60)
             processor = OEM_PROCESSORS["ford"]()
+            configure_processor(processor, args)
             
             # Process each downloaded file
             if downloaded:
-                processed_count = 0
-                for excel_file in downloaded:
-                    print(f"\nProcessing: {excel_file.name}")
-                    print("-" * 60)
-                    try:
-                        processor.convert_excel_to_csv(
-                            excel_file=excel_file,
-                            upload_to_gcs_flag=not args.no_upload
-                        )
-                        processed_count += 1
-                    except Exception as e:
-                        print(f"✗ Error processing {excel_file.name}: {e}")
-                        continue
+                processed_count = convert_files(processor, "ford", downloaded, args)
                 
                 print()
                 print("=" * 60)
@@ -296,6 +676,9 @@ def main():
             else:
                 print("⚠ No files to process")
             
+        elif args.command == "ford-diff":
+            run_ford_diff(args)
+            
         elif args.command == "all":
             print("Processing orders...")
             print()
@@ -1,5 +1,5 @@
 """
-BigQuery loader - Load CSV files from GCS to BigQuery tables
+BigQuery loader - Load CSV and Parquet files from GCS to BigQuery tables
 """
 
 import os
@@ -16,6 +16,435 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.config import GCS_BUCKET_NAME, GCS_BUCKET_PATH, DOWNLOAD_PROJECT_ID
+from processing.utils import read_csv_header
+from processing.comparison_sql import unique_code_sql, parse_date_sql, ORDERS_SNAPSHOT_COLUMN
+
+# ford_oem_orders layout: one partition per report date, clustered on the
+# order code, so date-filtered reads and comparisons only scan those dates
+FORD_ORDERS_PARTITION_COLUMN = "_source_file_date"
+FORD_ORDERS_CLUSTERING_COLUMNS = ("Order_Number", "Body_Code", "Model_Year")
+
+# Ford history mode (see load_ford_oem_history): one row per order version with
+# valid_from / valid_to, instead of a full copy of every order per day
+FORD_HISTORY_TABLE = "ford_oem_orders_history"
+# Dates loaded into the history table, with their source file metadata
+FORD_HISTORY_LOADS_TABLE = "ford_oem_history_loads"
+# Scratch table holding the report being merged into the history table
+FORD_HISTORY_STAGING_TABLE = "ford_oem_orders_staging"
+# View exposing the history as per-date snapshots, like ford_oem_orders
+FORD_SNAPSHOTS_VIEW = "ford_oem_orders_snapshots"
+
+# Ford delta mode (see load_ford_oem_delta): only new / changed / removed rows
+# per date, with the snapshots rebuilt by a view
+FORD_DELTA_TABLE = "ford_oem_orders_delta"
+FORD_DELTA_LOADS_TABLE = "ford_oem_delta_loads"
+FORD_DELTA_SNAPSHOTS_VIEW = "ford_oem_orders_delta_snapshots"
+
+# Field changes between each loaded Ford date and the previous one, computed
+# at load time (see materialize_ford_field_changes), partitioned by new_date
+FORD_FIELD_CHANGES_TABLE = "ford_field_changes"
+# Date pairs materialized in the field changes table, with the source table
+FORD_FIELD_CHANGE_LOADS_TABLE = "ford_field_change_loads"
+
+# db_orders snapshots: one partition per extract date (ORDERS_SNAPSHOT_COLUMN),
+# clustered on the UniqueCode the Ford comparison joins on (see
+# write_orders_partition)
+ORDERS_TABLE = "db_orders"
+ORDERS_CLUSTERING_COLUMNS = ("UniqueCode",)
+# Scratch tables an orders extract is loaded into before its partition is
+# written, one per extract date (see orders_staging_table)
+ORDERS_STAGING_TABLE = "db_orders_staging"
+# Daily tables written before db_orders was partitioned (db_orders_MM_DD_YYYY)
+DAILY_ORDERS_TABLE_PATTERN = re.compile(r"^db_orders_(\d{2})_(\d{2})_(\d{4})$")
+# db_orders columns making up UniqueCode (orderNo||bodyCode||modelYear||oem)
+ORDERS_CODE_COLUMNS = ("orderNo", "bodyCode", "modelYear", "oem")
+# db_orders date columns stored as DATE
+ORDERS_DATE_COLUMNS = ("chassisEta", "finalEta", "orderDate")
+# Standard SQL names of the BigQuery schema field types
+SQL_TYPES = {"INTEGER": "INT64", "FLOAT": "FLOAT64", "BOOLEAN": "BOOL"}
+
+# Source file metadata columns, taken per date from the loads table in the view
+HISTORY_METADATA_COLUMNS = ("_source_filename", "_source_file_created_timestamp", "_source_file_date")
+
+
+def orders_staging_table(snapshot_date: str) -> str:
+    """
+    Get the scratch table an orders extract of one date is staged in
+    
+    Each date has its own staging table, so concurrent loads of different
+    extracts don't overwrite each other's rows before their partitions are
+    written.
+    
+    Args:
+        snapshot_date: Extract date in YYYY-MM-DD format
+    
+    Returns:
+        Table name (e.g., "db_orders_staging_20251105")
+    """
+    return f"{ORDERS_STAGING_TABLE}_{snapshot_date.replace('-', '')}"
+
+
+def orders_unique_code_sql() -> str:
+    """
+    Build the UniqueCode expression of a db_orders row (orderNo||bodyCode||modelYear||oem)
+    
+    The OEM name is lower-cased, like the code the Ford comparison builds
+    ('ford'), so rows stored as 'Ford' still match.
+    
+    Returns:
+        SQL STRING expression over the db_orders columns
+    """
+    return unique_code_sql(ORDERS_CODE_COLUMNS[:-1], "LOWER(COALESCE(CAST(oem AS STRING), ''))")
+
+
+def orders_snapshot_sql(
+    source_table: str,
+    columns: dict[str, str],
+    table_columns: Optional[dict[str, str]] = None
+) -> str:
+    """
+    Build the query turning a loaded orders extract into db_orders rows
+    
+    The rows get the order code the Ford comparison joins on precomputed as
+    UniqueCode, the date columns parsed to DATE and the extract date as
+    snapshot_date, so the cross-verification is an equality join and a DATE
+    comparison on one partition.
+    
+    Args:
+        source_table: Fully qualified table with the loaded extract
+        columns: Column -> BigQuery type of the loaded extract
+        table_columns: Column -> BigQuery type of the existing db_orders table:
+                       columns loaded with another type are cast to it (values
+                       that don't convert become NULL), columns the extract
+                       lacks are NULL
+    
+    Returns:
+        SQL query taking @snapshot_date (DATE)
+    """
+    table_columns = {
+        column: field_type for column, field_type in (table_columns or {}).items()
+        if column not in ORDERS_DATE_COLUMNS and column not in ("UniqueCode", ORDERS_SNAPSHOT_COLUMN)
+    }
+    replaced = [
+        f"SAFE_CAST({column} AS {SQL_TYPES.get(field_type, field_type)}) AS {column}"
+        for column, field_type in table_columns.items()
+        if column in columns and columns[column] != field_type
+    ]
+    replaced += [f"{parse_date_sql(column)} AS {column}" for column in ORDERS_DATE_COLUMNS if column in columns]
+    replace = ""
+    if replaced:
+        parsed = ",\n        ".join(replaced)
+        replace = f" REPLACE (\n        {parsed}\n    )"
+    absent = "".join(
+        f"\n    CAST(NULL AS {SQL_TYPES.get(field_type, field_type)}) AS {column},"
+        for column, field_type in table_columns.items()
+        if column not in columns
+    )
+    return f"""
+SELECT
+    *{replace},{absent}
+    {orders_unique_code_sql()} AS UniqueCode,
+    @snapshot_date AS {ORDERS_SNAPSHOT_COLUMN}
+FROM `{source_table}`
+"""
+
+
+def ford_orders_partition_sql(project_dataset: str, table: str) -> str:
+    """
+    Build the script rebuilding an unpartitioned Ford orders table as a partitioned one
+    
+    BigQuery cannot change the partitioning of an existing table, so the rows
+    are copied into {table}_partitioned (partitioned on _source_file_date,
+    clustered on Order_Number, Body_Code, Model_Year), the original is renamed
+    to {table}_unpartitioned as a backup and the copy takes its name.
+    Nothing is dropped; delete the backup once the new table is checked.
+    
+    Args:
+        project_dataset: Project and dataset of the table ("project.dataset")
+        table: Table name (e.g., "ford_oem_orders")
+    
+    Returns:
+        SQL script
+    """
+    partition = FORD_ORDERS_PARTITION_COLUMN
+    return f"""
+CREATE TABLE `{project_dataset}.{table}_partitioned`
+PARTITION BY {partition}
+CLUSTER BY {", ".join(FORD_ORDERS_CLUSTERING_COLUMNS)}
+AS
+SELECT * REPLACE (CAST({partition} AS DATE) AS {partition})
+FROM `{project_dataset}.{table}`;
+
+ALTER TABLE `{project_dataset}.{table}` RENAME TO {table}_unpartitioned;
+
+ALTER TABLE `{project_dataset}.{table}_partitioned` RENAME TO {table};
+"""
+
+
+def ford_unescape_quotes_sql(table: str, columns: list[str], string_columns: list[str]) -> str:
+    """
+    Build the statement un-doubling the quotes earlier CSV loads stored in a Ford table
+    
+    Outputs used to pre-double quotes before the QUOTE_ALL writer doubled
+    them again, so CSV loads stored '6.5"" Box' where Parquet and Storage
+    Write API loads store '6.5" Box'. Every STRING column gets '""' replaced
+    with '"'. In tables with row hash columns, the hashes of the affected
+    versions are recomputed from the un-doubled values; rows are matched on
+    their old (_row_key, _row_hash, _content_hash), so removed delta rows
+    (NULL values) follow the version they remove.
+    
+    Args:
+        table: Fully qualified table
+        columns: Columns of the table
+        string_columns: STRING report columns to un-double
+        
+    Returns:
+        UPDATE statement
+    """
+    from processing.processors.ford import FORD_KEY_COLUMNS, FORD_COMPARISON_FIELDS
+    from processing.row_hashes import content_hash_sql, hash_columns_sql
+    from processing.schema import METADATA_COLUMNS, DERIVED_COLUMNS
+    
+    def unescaped(column: str, prefix: str = "") -> str:
+        return f"REPLACE({prefix}{column}, '\"\"', '\"')"
+    
+    quoted = "\n    OR ".join(f"{column} LIKE '%\"\"%'" for column in string_columns)
+    derived_columns = [spec.name for spec in DERIVED_COLUMNS]
+    if not all(column in columns for column in derived_columns):
+        assignments = ",\n    ".join(f"{column} = {unescaped(column)}" for column in string_columns)
+        return f"""
+UPDATE `{table}`
+SET
+    {assignments}
+WHERE {quoted}
+"""
+    
+    skip = {spec.name for spec in METADATA_COLUMNS + DERIVED_COLUMNS} | {"valid_from", "valid_to", "_change_type"}
+    report_columns = [column for column in columns if column not in skip]
+    assignments = ",\n    ".join(
+        [f"{column} = {unescaped(column, 't.')}" for column in string_columns]
+        + [f"{column} = v.{column}" for column in derived_columns]
+    )
+    replacements = ",\n                ".join(f"{unescaped(column)} AS {column}" for column in string_columns)
+    indent = "\n        "
+    return f"""
+UPDATE `{table}` t
+SET
+    {assignments}
+FROM (
+    SELECT DISTINCT
+        old_row_key,
+        old_row_hash,
+        old_content_hash,
+        {hash_columns_sql(FORD_KEY_COLUMNS).replace(chr(10), indent)} AS _row_key,
+        {hash_columns_sql(FORD_COMPARISON_FIELDS).replace(chr(10), indent)} AS _row_hash,
+        {content_hash_sql(report_columns).replace(chr(10), indent)} AS _content_hash
+    FROM (
+        SELECT
+            _row_key AS old_row_key,
+            _row_hash AS old_row_hash,
+            _content_hash AS old_content_hash,
+            * EXCEPT ({", ".join(derived_columns)}) REPLACE (
+                {replacements}
+            )
+        FROM `{table}`
+        WHERE {quoted.replace(chr(10), indent)}
+    )
+) v
+WHERE t._row_key = v.old_row_key
+    AND t._row_hash = v.old_row_hash
+    AND t._content_hash = v.old_content_hash
+"""
+
+
+def _set_ford_orders_layout(job_config):
+    """
+    Make a job (or table definition) that creates the Ford orders table partition and cluster it
+    
+    Args:
+        job_config: LoadJobConfig or QueryJobConfig of a job creating the
+                    table, or a new bigquery.Table
+    """
+    job_config.time_partitioning = bigquery.TimePartitioning(
+        type_=bigquery.TimePartitioningType.DAY,
+        field=FORD_ORDERS_PARTITION_COLUMN
+    )
+    job_config.clustering_fields = list(FORD_ORDERS_CLUSTERING_COLUMNS)
+
+
+def batch_load_groups(files: list[Path]) -> list[list[Path]]:
+    """
+    Split output files into groups that can share one load job
+    
+    One load job reads all of its files with the same format and columns, so
+    consecutive files are grouped while their format and header (CSV) or
+    schema (Parquet) match. A report that gained or lost a column starts a
+    new group.
+    
+    Args:
+        files: Local output files (.csv, .csv.gz or .parquet), in load order
+        
+    Returns:
+        List of groups, each a list of files in load order
+    """
+    groups = []
+    previous_columns = None
+    for path in files:
+        path = Path(path)
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            columns = ("parquet", tuple(pq.read_schema(path).names))
+        else:
+            columns = ("csv", tuple(read_csv_header(path)))
+        if groups and columns == previous_columns:
+            groups[-1].append(path)
+        else:
+            groups.append([path])
+        previous_columns = columns
+    return groups
+
+
+def ford_history_merge_sql(history_table: str, staging_table: str, loads_table: str, columns: list[str]) -> str:
+    """
+    Build the script that merges a staged Ford report into the history table
+    
+    A version is identified by (_row_key, _content_hash): _content_hash
+    covers every report column, while _row_hash only covers the compared
+    fields and would miss changes to the others. Current versions
+    (valid_to IS NULL) missing from the report are closed on @snapshot_date,
+    report rows without a current version are inserted as new versions valid
+    from @snapshot_date, and unchanged rows are not touched. The date is
+    recorded in the loads table in the same transaction. Merging the same
+    date twice changes nothing.
+    
+    Args:
+        history_table: Fully qualified history table
+        staging_table: Fully qualified staging table holding the report
+        loads_table: Fully qualified loads table
+        columns: Columns of the staging table, inserted as-is
+        
+    Returns:
+        Multi-statement SQL script taking @snapshot_date (DATE); its last
+        statement returns inserted_versions and closed_versions
+    """
+    column_list = ", ".join(columns)
+    values = ", ".join(f"s.{column}" for column in columns)
+    return f"""
+BEGIN TRANSACTION;
+
+MERGE `{history_table}` h
+USING `{staging_table}` s
+ON h.valid_to IS NULL
+    AND h._row_key = s._row_key
+    AND h._content_hash = s._content_hash
+WHEN NOT MATCHED BY TARGET THEN
+    INSERT ({column_list}, valid_from, valid_to)
+    VALUES ({values}, @snapshot_date, NULL)
+WHEN NOT MATCHED BY SOURCE AND h.valid_to IS NULL THEN
+    UPDATE SET valid_to = @snapshot_date;
+
+INSERT INTO `{loads_table}`
+    (snapshot_date, source_filename, source_file_created_timestamp, row_count, loaded_at)
+SELECT
+    @snapshot_date,
+    ANY_VALUE(_source_filename),
+    ANY_VALUE(_source_file_created_timestamp),
+    COUNT(*),
+    CURRENT_TIMESTAMP()
+FROM `{staging_table}`;
+
+COMMIT TRANSACTION;
+
+SELECT
+    COUNTIF(valid_from = @snapshot_date) AS inserted_versions,
+    COUNTIF(valid_to = @snapshot_date) AS closed_versions
+FROM `{history_table}`;
+"""
+
+
+def ford_snapshots_view_sql(view: str, history_table: str, loads_table: str) -> str:
+    """
+    Build the view exposing the Ford history table as per-date snapshots
+    
+    Every loaded date gets the versions valid on it, with _source_file_date,
+    _source_filename and _source_file_created_timestamp of that date's
+    report, so queries filtering ford_oem_orders on _source_file_date work
+    unchanged against the view.
+    
+    Args:
+        view: Fully qualified view name
+        history_table: Fully qualified history table
+        loads_table: Fully qualified loads table
+        
+    Returns:
+        CREATE OR REPLACE VIEW statement
+    """
+    return f"""
+CREATE OR REPLACE VIEW `{view}` AS
+SELECT
+    h.* EXCEPT ({", ".join(HISTORY_METADATA_COLUMNS)}, valid_from, valid_to),
+    l.source_filename AS _source_filename,
+    l.source_file_created_timestamp AS _source_file_created_timestamp,
+    l.snapshot_date AS _source_file_date
+FROM `{history_table}` h
+JOIN (
+    -- Latest load of each date (a date may be merged again)
+    SELECT *
+    FROM `{loads_table}`
+    WHERE TRUE
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY snapshot_date ORDER BY loaded_at DESC) = 1
+) l
+    ON h.valid_from <= l.snapshot_date
+    AND (h.valid_to IS NULL OR l.snapshot_date < h.valid_to)
+"""
+
+
+def ford_delta_view_sql(view: str, delta_table: str, loads_table: str) -> str:
+    """
+    Build the view rebuilding per-date Ford snapshots from delta rows
+    
+    Each (_row_key, _content_hash) version alternates between appearing (a new
+    or changed row) and being removed, so a version is valid from the date of
+    its new/changed row until its next event. Every loaded date gets the
+    versions valid on it, with that date's source file metadata, like
+    ford_oem_orders.
+    
+    Args:
+        view: Fully qualified view name
+        delta_table: Fully qualified delta table
+        loads_table: Fully qualified delta loads table
+        
+    Returns:
+        CREATE OR REPLACE VIEW statement
+    """
+    return f"""
+CREATE OR REPLACE VIEW `{view}` AS
+WITH spans AS (
+    SELECT
+        _row_key,
+        _content_hash,
+        _source_file_date AS valid_from,
+        LEAD(_source_file_date) OVER (PARTITION BY _row_key, _content_hash ORDER BY _source_file_date) AS valid_to
+    FROM (
+        SELECT DISTINCT _row_key, _content_hash, _source_file_date
+        FROM `{delta_table}`
+    )
+)
+SELECT
+    d.* EXCEPT ({", ".join(HISTORY_METADATA_COLUMNS)}, _change_type),
+    l.source_filename AS _source_filename,
+    l.source_file_created_timestamp AS _source_file_created_timestamp,
+    l.snapshot_date AS _source_file_date
+FROM `{delta_table}` d
+INNER JOIN spans s
+    ON d._row_key = s._row_key
+    AND d._content_hash = s._content_hash
+    AND d._source_file_date = s.valid_from
+INNER JOIN `{loads_table}` l
+    ON s.valid_from <= l.snapshot_date
+    AND (s.valid_to IS NULL OR l.snapshot_date < s.valid_to)
+WHERE d._change_type != 'removed'
+"""
 
 
 class BigQueryLoader:
@@ -95,13 +524,14 @@ class BigQueryLoader:
             return f"{month}_{day}_{year}"
         return None
     
-    def load_oem_csv(self, csv_filename: str, oem_name: str) -> bool:
+    def load_oem_csv(self, csv_filename: str, oem_name: str, new_table_schema: Optional[list] = None) -> bool:
         """
         Load OEM CSV file to BigQuery
         
         Args:
             csv_filename: Name of CSV file (e.g., "Ford_Dealer_Report_clean_20251105.csv")
             oem_name: OEM name (e.g., "Ford", "Toyota")
+            new_table_schema: Explicit schema used if the table is created (default: autodetect)
             
         Returns:
             True if successful, False otherwise
@@ -123,7 +553,7 @@ class BigQueryLoader:
         gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{csv_filename}"
         
         # Load to BigQuery
-        return self.load_csv_to_bigquery(gcs_uri, table_id)
+        return self.load_csv_to_bigquery(gcs_uri, table_id, new_table_schema=new_table_schema)
     
     def _check_gcs_file_exists(self, gcs_uri: str) -> bool:
         """
@@ -160,16 +590,25 @@ class BigQueryLoader:
         gcs_uri: str,
         table_id: str,
         schema: Optional[list] = None,
-        write_disposition: str = "WRITE_TRUNCATE"
+        write_disposition: str = "WRITE_TRUNCATE",
+        new_table_schema: Optional[list] = None,
+        ford_layout: bool = False
     ) -> bool:
         """
         Load CSV file from GCS to BigQuery table
         
+        Gzip-compressed files (.csv.gz) are loaded the same way - BigQuery
+        decompresses them natively.
+        
         Args:
             gcs_uri: GCS URI (e.g., "gs://bucket/path/file.csv")
             table_id: BigQuery table ID
             schema: Optional schema definition
             write_disposition: WRITE_TRUNCATE (replace), WRITE_APPEND, or WRITE_EMPTY
+            new_table_schema: Explicit schema used only when the table is created,
+                              instead of autodetect (existing tables keep their schema)
+            ford_layout: Partition and cluster the table like ford_oem_orders if
+                         the load creates it
             
         Returns:
             True if successful, False otherwise
@@ -259,6 +698,21 @@ class BigQueryLoader:
                 print(f"  ℹ Schema update enabled - new columns will be added if present in CSV")
                 print(f"  ⚠ Note: If column types differ, BigQuery will attempt to cast values")
                 print(f"  ⚠ If casting fails, those rows will be marked as bad records")
+            elif new_table_schema and not table_exists:
+                # Create the table with the processor's declared schema
+                print(f"  ℹ Creating table with explicit schema ({len(new_table_schema)} fields)")
+                job_config = bigquery.LoadJobConfig(
+                    source_format=bigquery.SourceFormat.CSV,
+                    skip_leading_rows=1,
+                    schema=new_table_schema,
+                    autodetect=False,
+                    write_disposition=write_disposition,
+                    field_delimiter=",",
+                    quote_character='"',
+                    allow_quoted_newlines=True,
+                    encoding="UTF-8",
+                    max_bad_records=0,
+                )
             else:
                 # Use autodetect for new tables
                 job_config = bigquery.LoadJobConfig(
@@ -274,6 +728,10 @@ class BigQueryLoader:
                     max_bad_records=0,
                 )
             
+            if ford_layout and not table_exists:
+                _set_ford_orders_layout(job_config)
+                print(f"  ℹ New table will be partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+            
             print(f"Loading CSV to BigQuery table: {self.dataset_id}.{table_id}")
             print(f"  Source: {gcs_uri}")
             print(f"  Write disposition: {write_disposition}")
@@ -381,199 +839,392 @@ class BigQueryLoader:
             traceback.print_exc()
             return False
     
-    def load_orders_csv(self, csv_filename: str) -> bool:
+    def _orders_snapshot_date(self, filename: str) -> str:
         """
-        Load orders CSV file to BigQuery
+        Get the snapshot date of an orders extract from its filename
         
         Args:
-            csv_filename: Name of CSV file (e.g., "v_orders_api_bigquery_20251105.csv")
+            filename: Orders CSV filename (e.g., "v_orders_api_bigquery_20251105.csv")
             
         Returns:
-            True if successful, False otherwise
+            Date in YYYY-MM-DD format (today if the filename has no date)
         """
-        # Extract date from filename
-        date_str = self.extract_date_from_orders_filename(csv_filename)
+        date_str = self.extract_date_from_orders_filename(filename)
         
         if not date_str:
             # Fallback: use today's date
-            today = datetime.now()
-            date_str = today.strftime("%m_%d_%Y")
+            date_str = datetime.now().strftime("%m_%d_%Y")
             print(f"⚠ Could not extract date from filename, using today: {date_str}")
         
-        # Create table name: db_orders_MM_DD_YYYY
-        table_id = f"db_orders_{date_str}"
+        return datetime.strptime(date_str, "%m_%d_%Y").strftime("%Y-%m-%d")
+    
+    def load_orders_csv(self, csv_filename: str) -> bool:
+        """
+        Load orders CSV file to BigQuery - replaces its date's partition of db_orders
+        
+        The extract is loaded into its date's scratch table (see
+        orders_staging_table), written to db_orders (see
+        write_orders_partition) and the scratch table is dropped.
+        
+        Args:
+            csv_filename: Name of CSV file (e.g., "v_orders_api_bigquery_20251105.csv" or ".csv.gz")
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        snapshot_date = self._orders_snapshot_date(csv_filename)
+        staging_table = orders_staging_table(snapshot_date)
         
         # GCS URI
         gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{csv_filename}"
         
-        # Load to BigQuery
-        return self.load_csv_to_bigquery(gcs_uri, table_id)
+        # Stage the extract, then write its partition
+        try:
+            if not self.load_csv_to_bigquery(gcs_uri, staging_table):
+                return False
+            return self.write_orders_partition(staging_table, snapshot_date)
+        finally:
+            self._drop_orders_staging_table(staging_table)
     
     def load_orders_csv_from_local(self, csv_file_path: Path) -> bool:
         """
         Load orders CSV file to BigQuery from local file (when GCS upload fails)
         
         Args:
-            csv_file_path: Local path to CSV file
+            csv_file_path: Local path to CSV file (.csv or .csv.gz)
             
         Returns:
             True if successful, False otherwise
         """
-        from pathlib import Path
+        snapshot_date = self._orders_snapshot_date(csv_file_path.name)
+        staging_table = orders_staging_table(snapshot_date)
         
-        # Extract date from filename
-        date_str = self.extract_date_from_orders_filename(csv_file_path.name)
+        print(f"  Loading from local file: {csv_file_path.name}")
         
-        if not date_str:
-            # Fallback: use today's date
-            today = datetime.now()
-            date_str = today.strftime("%m_%d_%Y")
-            print(f"  ⚠ Could not extract date from filename, using today: {date_str}")
+        try:
+            try:
+                # Stage the extract (schema autodetected)
+                staging = self._load_file_to_table(Path(csv_file_path), staging_table, timeout=600)
+                print(f"✓ Staged {staging.num_rows} rows in {self.dataset_id}.{staging_table}")
+            except Exception as e:
+                print(f"✗ Error loading from local file: {e}")
+                import traceback
+                traceback.print_exc()
+                return False
+            
+            return self.write_orders_partition(staging_table, snapshot_date)
+        finally:
+            self._drop_orders_staging_table(staging_table)
+    
+    def _drop_orders_staging_table(self, staging_table: str):
+        """
+        Drop an orders scratch table once its partition is written (or the load failed)
         
-        # Create table name: db_orders_MM_DD_YYYY
-        table_id = f"db_orders_{date_str}"
+        Args:
+            staging_table: Table name (see orders_staging_table)
+        """
+        try:
+            self.client.delete_table(self.client.dataset(self.dataset_id).table(staging_table), not_found_ok=True)
+        except Exception as e:
+            print(f"⚠ Could not drop {self.dataset_id}.{staging_table}: {e}")
+    
+    def write_orders_partition(self, source_table: str, snapshot_date: str) -> bool:
+        """
+        Write a loaded orders extract into its snapshot_date partition of db_orders
         
-        print(f"  Loading from local file: {csv_file_path.name}")
+        db_orders is partitioned on snapshot_date and clustered on UniqueCode
+        (see orders_snapshot_sql), so the Ford DB comparison filters one
+        partition with @db_orders_date instead of naming a table per day, and
+        several snapshots can be queried together. The partition is replaced
+        (db_orders$YYYYMMDD with WRITE_TRUNCATE), so loading a date again
+        does not duplicate it. New extract columns are added to db_orders;
+        columns loaded with another type are cast to the db_orders type.
         
-        # Load directly from local file
+        Args:
+            source_table: Table with the loaded extract (e.g., "db_orders_staging_20251105")
+            snapshot_date: Extract date in YYYY-MM-DD format
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        dataset_ref = self.client.dataset(self.dataset_id)
         try:
-            dataset_ref = self.client.dataset(self.dataset_id)
-            table_ref = dataset_ref.table(table_id)
+            source = self.client.get_table(dataset_ref.table(source_table))
+            missing = [column for column in ORDERS_CODE_COLUMNS if column not in {field.name for field in source.schema}]
+            if missing:
+                print(f"✗ {source_table} has no {', '.join(missing)} column(s), cannot write it to {ORDERS_TABLE}")
+                return False
             
-            # Check if table exists
-            table_exists = False
-            existing_table = None
+            job_config = QueryJobConfig(query_parameters=[
+                ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+            ])
+            table_columns = None
             try:
-                existing_table = self.client.get_table(table_ref)
-                table_exists = True
-                print(f"  ℹ Table exists, will append {existing_table.num_rows} existing rows")
+                orders = self.client.get_table(dataset_ref.table(ORDERS_TABLE))
+                table_columns = {field.name: field.field_type for field in orders.schema}
+                job_config.destination = f"{project_dataset}.{ORDERS_TABLE}${snapshot_date.replace('-', '')}"
+                job_config.write_disposition = "WRITE_TRUNCATE"
+                job_config.schema_update_options = [
+                    bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
+                ]
             except NotFound:
-                print(f"  ℹ Table does not exist, will be created")
-            
-            # Create job config for loading from local file
-            # If table exists, build schema from CSV header that matches table schema
-            # If table doesn't exist, use autodetect to create schema
-            if table_exists and existing_table:
-                # Read CSV header to get actual columns in the CSV
-                import csv
-                with open(csv_file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    csv_header = next(reader)  # Get header row
-                    # Remove quotes from header if present
-                    csv_header = [col.strip('"') for col in csv_header]
-                
-                # Build schema that matches CSV columns by name from table schema
-                # This ensures we only use columns that exist in the CSV
-                csv_schema = []
-                table_schema_dict = {field.name: field for field in existing_table.schema}
-                missing_in_table = []
-                
-                for col_name in csv_header:
-                    if col_name in table_schema_dict:
-                        # Use the existing table's field definition (including type)
-                        csv_schema.append(table_schema_dict[col_name])
-                    else:
-                        # Column in CSV but not in table - will be added as new column
-                        missing_in_table.append(col_name)
-                
-                if missing_in_table:
-                    print(f"  ℹ CSV has {len(missing_in_table)} new columns not in table: {', '.join(missing_in_table[:5])}{'...' if len(missing_in_table) > 5 else ''}")
-                
-                print(f"  ℹ CSV has {len(csv_header)} columns, matched {len(csv_schema)} with table schema")
-                
-                # Use schema built from CSV columns (only columns that exist in CSV)
-                job_config = bigquery.LoadJobConfig(
-                    source_format=bigquery.SourceFormat.CSV,
-                    skip_leading_rows=1,
-                    schema=csv_schema,  # Use schema matching only CSV columns
-                    autodetect=False,  # Don't autodetect - use matched schema
-                    write_disposition="WRITE_TRUNCATE",  # Orders tables are date-specific, so truncate
-                    field_delimiter=",",
-                    quote_character='"',
-                    allow_quoted_newlines=True,
-                    encoding="UTF-8",
-                    ignore_unknown_values=False,  # Don't ignore - we want exact match
-                    max_bad_records=100,  # Allow some bad records
-                )
-                print(f"  ℹ Using schema with {len(csv_schema)} fields matching CSV columns")
-            else:
-                # Table doesn't exist, use autodetect to create schema
-                job_config = bigquery.LoadJobConfig(
-                    source_format=bigquery.SourceFormat.CSV,
-                    skip_leading_rows=1,
-                    autodetect=True,  # Auto-detect schema for new table
-                    write_disposition="WRITE_TRUNCATE",  # Orders tables are date-specific
-                    field_delimiter=",",
-                    quote_character='"',
-                    allow_quoted_newlines=True,
-                    encoding="UTF-8",
-                    ignore_unknown_values=True,
-                    max_bad_records=0,
+                print(f"ℹ Table {ORDERS_TABLE} does not exist, creating it partitioned on {ORDERS_SNAPSHOT_COLUMN}")
+                job_config.destination = f"{project_dataset}.{ORDERS_TABLE}"
+                job_config.write_disposition = "WRITE_EMPTY"
+                job_config.time_partitioning = bigquery.TimePartitioning(
+                    type_=bigquery.TimePartitioningType.DAY,
+                    field=ORDERS_SNAPSHOT_COLUMN
                 )
-                print(f"  ℹ Table doesn't exist, will auto-detect schema from CSV")
+                job_config.clustering_fields = list(ORDERS_CLUSTERING_COLUMNS)
             
-            # Load from local file
-            with open(csv_file_path, 'rb') as source_file:
-                load_job = self.client.load_table_from_file(
-                    source_file,
-                    table_ref,
-                    job_config=job_config
-                )
-                
-                print(f"  Waiting for load job to complete...")
-                load_job.result(timeout=600)  # 10 minute timeout for large files
-                
-                if load_job.errors:
-                    print(f"✗ Load job completed with errors:")
-                    for error in load_job.errors:
-                        print(f"  - {error}")
-                    return False
-                
-                # Get updated table info
-                table = self.client.get_table(table_ref)
-                rows_before = existing_table.num_rows if table_exists and existing_table else 0
-                rows_after = table.num_rows
-                rows_added = rows_after - rows_before
-                
-                print(f"✓ Successfully loaded {rows_added} rows to {self.dataset_id}.{table_id}")
-                print(f"  Table now contains {table.num_rows} total rows (was {rows_before})")
-                
-                return True
-                
+            self.client.query(
+                orders_snapshot_sql(
+                    f"{project_dataset}.{source_table}",
+                    {field.name: field.field_type for field in source.schema},
+                    table_columns
+                ),
+                job_config=job_config
+            ).result(timeout=600)
+            print(f"✓ Wrote {source.num_rows} rows to {self.dataset_id}.{ORDERS_TABLE} for {snapshot_date}")
+            return True
         except Exception as e:
-            print(f"✗ Error loading from local file: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"✗ Error writing {source_table} to {ORDERS_TABLE} ({snapshot_date}): {e}")
+            print(f"  Table: {project_dataset}.{ORDERS_TABLE}")
             return False
     
-    def load_ford_oem_csv(self, csv_filename: str) -> bool:
+    def migrate_daily_orders_tables(self) -> bool:
         """
-        Load Ford OEM CSV file to BigQuery - appends to single table
+        Copy the daily db_orders_MM_DD_YYYY tables into their db_orders partitions
         
-        All Ford files are loaded into the same table: ford_oem_orders
-        Each load appends new data (does not replace existing data)
-        Each order gets _source_file_date from the sheet name (filename date)
+        The daily tables are left in place; drop them once db_orders is checked.
+        Copying a date again replaces its partition.
         
-        NOTE: This will NOT reject duplicates. If you upload the same file twice,
-        it will create duplicate rows. Use deduplication queries if needed.
+        Returns:
+            True if every daily table was copied, False otherwise
+        """
+        tables = sorted(
+            table.table_id for table in self.client.list_tables(self.dataset_id)
+            if DAILY_ORDERS_TABLE_PATTERN.match(table.table_id)
+        )
+        if not tables:
+            print(f"ℹ No daily db_orders tables in {self.dataset_id}")
+            return True
+        
+        print(f"Copying {len(tables)} daily db_orders table(s) into {self.dataset_id}.{ORDERS_TABLE}...")
+        failed = []
+        for table_id in tables:
+            month, day, year = DAILY_ORDERS_TABLE_PATTERN.match(table_id).groups()
+            if not self.write_orders_partition(table_id, f"{year}-{month}-{day}"):
+                failed.append(table_id)
+        
+        if failed:
+            print(f"⚠ {len(failed)} table(s) not copied: {', '.join(failed)}")
+            return False
+        print(f"✓ Copied {len(tables)} daily table(s) into {ORDERS_TABLE}")
+        return True
+    
+    def _ford_orders_tables(self, table_id: str) -> dict:
+        """
+        Get the Ford orders table and the tables a partition migration leaves behind
         
         Args:
-            csv_filename: Name of CSV file (e.g., "Ford_Dealer_Report_clean_20251105.csv")
+            table_id: Ford orders table name
             
         Returns:
-            True if successful, False otherwise
+            Dictionary of table name -> Table (None if the table does not exist)
+            for table_id, {table_id}_partitioned and {table_id}_unpartitioned
         """
-        # Fixed table name for all Ford data
-        table_id = "ford_oem_orders"
+        tables = {}
+        for name in (table_id, f"{table_id}_partitioned", f"{table_id}_unpartitioned"):
+            try:
+                tables[name] = self.client.get_table(self.client.dataset(self.dataset_id).table(name))
+            except NotFound:
+                tables[name] = None
+        return tables
+    
+    def check_ford_orders_table(self, table_id: str = "ford_oem_orders", require_partitioned: bool = False) -> bool:
+        """
+        Check the Ford orders table before a load (nothing is migrated here)
         
-        # GCS URI
-        gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{csv_filename}"
+        Loads stop if a partition migration was interrupted: a
+        {table_id}_partitioned copy still exists, or the table itself is
+        missing while its {table_id}_unpartitioned backup exists (a load would
+        create a new, empty table in its place). Those tables have to be
+        renamed or dropped by hand. An unpartitioned table only gets a warning
+        pointing to `python main.py ford --partition-table` (see
+        partition_ford_orders_table), unless require_partitioned is set.
         
-        # Check if this exact file was already loaded (by checking for rows with same source file pattern)
-        # Extract date from filename to check
-        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', csv_filename)
-        if date_match:
-            year, month, day = date_match.groups()
+        Args:
+            table_id: Ford orders table name
+            require_partitioned: Fail if the table exists but is not
+                                 partitioned (partition replacement needs it)
+            
+        Returns:
+            True if the load can go ahead, False otherwise
+        """
+        tables = self._ford_orders_tables(table_id)
+        table = tables[table_id]
+        
+        if tables[f"{table_id}_partitioned"] is not None or (table is None and tables[f"{table_id}_unpartitioned"] is not None):
+            leftovers = [name for name, found in tables.items() if found is not None and name != table_id]
+            print(f"✗ A partition migration of {self.dataset_id}.{table_id} did not finish")
+            print(f"  {table_id}: {'exists' if table is not None else 'missing'}; also found {', '.join(leftovers)}")
+            print(f"  Rename or drop these tables by hand before loading (see backend/queries/ford_oem_orders_partition_migration.sql)")
+            return False
+        
+        if table is None:
+            return True
+        partitioning = table.time_partitioning
+        if partitioning and partitioning.field == FORD_ORDERS_PARTITION_COLUMN:
+            return True
+        
+        if require_partitioned:
+            print(f"✗ {table_id} is not partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+            print(f"  Run `python main.py ford --partition-table` first")
+            return False
+        print(f"⚠ {table_id} is not partitioned on {FORD_ORDERS_PARTITION_COLUMN}, date-filtered queries scan the whole table")
+        print(f"  Run `python main.py ford --partition-table` to migrate it")
+        return True
+    
+    def partition_ford_orders_table(self, table_id: str = "ford_oem_orders") -> bool:
+        """
+        Migrate an unpartitioned Ford orders table to the partitioned layout
+        
+        Tables created by the Ford loads are partitioned on _source_file_date
+        and clustered on Order_Number, Body_Code, Model_Year, so every query
+        filtering on _source_file_date (existence checks, snapshot reads,
+        comparisons) only scans the dates it asks for. A table created before
+        that is rebuilt with ford_orders_partition_sql(), keeping the old
+        table as {table_id}_unpartitioned.
+        
+        Run explicitly (`python main.py ford --partition-table`), never from a
+        load: the script is a full copy followed by two renames that are not
+        atomic, so it refuses to start if a {table_id}_partitioned or
+        {table_id}_unpartitioned table already exists (an earlier run that
+        failed part way, or a backup not dropped yet).
+        
+        Args:
+            table_id: Ford orders table name
+            
+        Returns:
+            True if the table is partitioned (or does not exist yet), False otherwise
+        """
+        tables = self._ford_orders_tables(table_id)
+        table = tables[table_id]
+        leftovers = [name for name, found in tables.items() if found is not None and name != table_id]
+        
+        if table is not None:
+            partitioning = table.time_partitioning
+            if partitioning and partitioning.field == FORD_ORDERS_PARTITION_COLUMN:
+                print(f"✓ {self.dataset_id}.{table_id} is already partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+                return True
+        
+        if leftovers:
+            print(f"✗ Not partitioning {self.dataset_id}.{table_id}: found {', '.join(leftovers)}")
+            print(f"  {table_id}: {'exists' if table is not None else 'missing'}")
+            print(f"  An earlier migration did not finish; rename or drop these tables by hand first")
+            return False
+        
+        if table is None:
+            print(f"ℹ {self.dataset_id}.{table_id} does not exist, the first Ford load creates it partitioned")
+            return True
+        
+        print(f"Partitioning {self.dataset_id}.{table_id} on {FORD_ORDERS_PARTITION_COLUMN} ({table.num_rows} rows)...")
+        try:
+            script = ford_orders_partition_sql(f"{self.project_id}.{self.dataset_id}", table_id)
+            self.client.query(script).result(timeout=600)
+            print(f"✓ {table_id} is now partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+            print(f"  clustered on {', '.join(FORD_ORDERS_CLUSTERING_COLUMNS)}")
+            print(f"  ℹ The previous table is kept as {table_id}_unpartitioned, drop it once the new table is checked")
+            return True
+        except Exception as e:
+            print(f"✗ Could not partition {table_id}: {e}")
+            print(f"  Check which of {table_id}, {table_id}_partitioned and {table_id}_unpartitioned exist")
+            print(f"  before loading again (see backend/queries/ford_oem_orders_partition_migration.sql)")
+            return False
+    
+    def unescape_ford_quotes(self) -> bool:
+        """
+        Un-double the quotes earlier CSV loads stored in the Ford tables
+        
+        Outputs used to pre-double quotes, so CSV loads stored '""' where
+        Parquet, Storage Write API and current CSV loads store '"'. Rewrites
+        ford_oem_orders, the history and delta tables and ford_field_changes
+        (those that exist) with ford_unescape_quotes_sql(), recomputing the
+        row hashes of the rows it changes.
+        
+        Run explicitly (`python main.py ford --unescape-quotes`), once, after
+        the row hashes are backfilled (backend/queries/
+        ford_oem_orders_add_row_hashes.sql and ford_versions_add_content_hash.sql):
+        rows still missing a hash are matched on it and would be left as is,
+        so the table is skipped while it has any.
+        
+        Returns:
+            True if every existing table was rewritten, False otherwise
+        """
+        from processing.schema import METADATA_COLUMNS, DERIVED_COLUMNS
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        metadata = {spec.name for spec in METADATA_COLUMNS}
+        derived_columns = [spec.name for spec in DERIVED_COLUMNS]
+        success = True
+        for table_id in ("ford_oem_orders", FORD_HISTORY_TABLE, FORD_DELTA_TABLE, FORD_FIELD_CHANGES_TABLE):
+            try:
+                table = self.client.get_table(f"{project_dataset}.{table_id}")
+            except NotFound:
+                continue
+            columns = [field.name for field in table.schema]
+            string_columns = [
+                field.name for field in table.schema if field.field_type == "STRING" and field.name not in metadata
+            ]
+            if not string_columns:
+                continue
+            
+            try:
+                if any(column in columns for column in derived_columns):
+                    # The rows with quotes need every row hash column set
+                    unhashed = not all(column in columns for column in derived_columns)
+                    if not unhashed:
+                        missing = " OR ".join(f"{column} IS NULL" for column in derived_columns)
+                        quoted = " OR ".join(f"{column} LIKE '%\"\"%'" for column in string_columns)
+                        row = next(iter(self.client.query(
+                            f"SELECT COUNT(*) AS count FROM `{project_dataset}.{table_id}` WHERE ({missing}) AND ({quoted})"
+                        ).result()))
+                        unhashed = row.count > 0
+                    if unhashed:
+                        print(f"✗ Not un-escaping {self.dataset_id}.{table_id}: rows with quotes are missing "
+                              f"{', '.join(derived_columns)}")
+                        print(f"  Backfill them first (see backend/queries/README.md)")
+                        success = False
+                        continue
+                
+                print(f"Un-escaping quotes in {self.dataset_id}.{table_id} ({len(string_columns)} text columns)...")
+                query_job = self.client.query(ford_unescape_quotes_sql(
+                    f"{project_dataset}.{table_id}", columns, string_columns
+                ))
+                query_job.result(timeout=600)
+                print(f"✓ Updated {query_job.num_dml_affected_rows or 0} row(s) of {table_id}")
+            except Exception as e:
+                print(f"✗ Could not un-escape quotes in {table_id}: {e}")
+                success = False
+        return success
+    
+    def _warn_if_ford_date_loaded(self, filename: str, table_id: str):
+        """
+        Warn if rows for the file's date are already in the Ford table
+        
+        Args:
+            filename: Output filename containing a YYYYMMDD date
+            table_id: Ford table name
+        """
+        # Check if this exact file was already loaded (by checking for rows with same source file pattern)
+        # Extract date from filename to check
+        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', filename)
+        if date_match:
+            year, month, day = date_match.groups()
             date_str = f"{year}-{month}-{day}"
             
             # Check if data for this date already exists
@@ -605,20 +1256,158 @@ class BigQueryLoader:
                 # If check fails, continue anyway (might be permission issue)
                 print(f"⚠ Could not check for existing data: {e}")
                 print(f"  Continuing with load...")
+    
+    def materialize_ford_field_changes(self, snapshot_date: str, orders_table: str = "ford_oem_orders") -> bool:
+        """
+        Compute the field changes from the previous loaded date to a date into ford_field_changes
+        
+        The comparison (see processing.comparison_sql.field_changes_refresh_sql)
+        runs once at load time and replaces the date's partition, so the
+        backend serves a consecutive date pair with a partition read. The pair
+        is recorded in ford_field_change_loads.
+        
+        Args:
+            snapshot_date: Newly loaded date in YYYY-MM-DD format
+            orders_table: Table or view with the Ford snapshots
+            
+        Returns:
+            True if successful (or there is no earlier date), False otherwise
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        from processing.comparison_sql import field_changes_refresh_sql
+        from processing.processors.ford import FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        try:
+            query = f"""
+            SELECT CAST(MAX(_source_file_date) AS STRING) AS previous
+            FROM `{project_dataset}.{orders_table}`
+            WHERE _source_file_date < @snapshot_date
+            """
+            job_config = QueryJobConfig(query_parameters=[
+                ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+            ])
+            row = next(iter(self.client.query(query, job_config=job_config).result()), None)
+            previous_date = row.previous if row else None
+            if not previous_date:
+                print(f"ℹ No date before {snapshot_date} in {orders_table}, no field changes to materialize")
+                return True
+            
+            print(f"Materializing field changes {previous_date} → {snapshot_date} into {self.dataset_id}.{FORD_FIELD_CHANGES_TABLE}...")
+            script = field_changes_refresh_sql(
+                f"{project_dataset}.{FORD_FIELD_CHANGES_TABLE}",
+                f"{project_dataset}.{FORD_FIELD_CHANGE_LOADS_TABLE}",
+                f"{project_dataset}.{orders_table}",
+                FORD_KEY_COLUMNS,
+                FORD_FIELD_MANIFEST
+            )
+            job_config = QueryJobConfig(query_parameters=[
+                ScalarQueryParameter("old_date", "DATE", previous_date),
+                ScalarQueryParameter("new_date", "DATE", snapshot_date),
+                ScalarQueryParameter("source_table", "STRING", orders_table),
+            ])
+            counts = next(iter(self.client.query(script, job_config=job_config).result(timeout=300)))
+            print(f"✓ Materialized {counts.change_count} field change(s) {previous_date} → {snapshot_date}")
+            return True
+            
+        except Exception as e:
+            print(f"⚠ Could not materialize field changes for {snapshot_date}: {e}")
+            print(f"  The comparison API falls back to comparing the snapshots")
+            return False
+    
+    def _refresh_ford_field_changes(self, filename: str, orders_table: str):
+        """
+        Materialize the field changes of a just-loaded Ford report (failures only warn)
+        
+        Args:
+            filename: Output filename containing a YYYYMMDD date
+            orders_table: Table or view with the Ford snapshots
+        """
+        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', filename)
+        if date_match:
+            self.materialize_ford_field_changes("-".join(date_match.groups()), orders_table)
+    
+    def _refresh_ford_field_changes_after_replace(self, snapshot_date: str, orders_table: str):
+        """
+        Materialize the field changes of a replaced date and of the next loaded date
+        
+        The next loaded date's pair was computed against the rows that were
+        replaced, so its ford_field_changes partition and ford_field_change_loads
+        row are recomputed too (failures only warn).
+        
+        Args:
+            snapshot_date: Replaced date in YYYY-MM-DD format
+            orders_table: Table or view with the Ford snapshots
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        self.materialize_ford_field_changes(snapshot_date, orders_table)
+        try:
+            query = f"""
+            SELECT CAST(MIN(_source_file_date) AS STRING) AS next_date
+            FROM `{self.project_id}.{self.dataset_id}.{orders_table}`
+            WHERE _source_file_date > @snapshot_date
+            """
+            job_config = QueryJobConfig(query_parameters=[
+                ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+            ])
+            row = next(iter(self.client.query(query, job_config=job_config).result()), None)
+        except Exception as e:
+            print(f"⚠ Could not find the date after {snapshot_date}: {e}")
+            print(f"  Its materialized field changes may still compare against the replaced rows")
+            return
+        if row and row.next_date:
+            self.materialize_ford_field_changes(row.next_date, orders_table)
+    
+    def load_ford_oem_csv(self, csv_filename: str, new_table_schema: Optional[list] = None) -> bool:
+        """
+        Load Ford OEM CSV file to BigQuery - appends to single table
+        
+        All Ford files are loaded into the same table: ford_oem_orders
+        Each load appends new data (does not replace existing data)
+        Each order gets _source_file_date from the sheet name (filename date)
+        The table is partitioned on _source_file_date and clustered on the order
+        code (see check_ford_orders_table)
+        
+        NOTE: This will NOT reject duplicates. If you upload the same file twice,
+        it will create duplicate rows. Use deduplication queries if needed.
+        
+        Args:
+            csv_filename: Name of CSV file (e.g., "Ford_Dealer_Report_clean_20251105.csv" or ".csv.gz")
+            new_table_schema: Explicit schema used if the table is created (default: autodetect)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        # Fixed table name for all Ford data
+        table_id = "ford_oem_orders"
+        
+        # GCS URI
+        gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{csv_filename}"
+        
+        if not self.check_ford_orders_table(table_id):
+            return False
+        self._warn_if_ford_date_loaded(csv_filename, table_id)
         
         # Load to BigQuery with APPEND mode (adds to existing table)
-        return self.load_csv_to_bigquery(
+        success = self.load_csv_to_bigquery(
             gcs_uri, 
             table_id, 
-            write_disposition="WRITE_APPEND"
+            write_disposition="WRITE_APPEND",
+            new_table_schema=new_table_schema,
+            ford_layout=True
         )
+        if success:
+            self._refresh_ford_field_changes(csv_filename, table_id)
+        return success
     
-    def load_ford_oem_csv_from_local(self, csv_file_path: Path) -> bool:
+    def load_ford_oem_csv_from_local(self, csv_file_path: Path, new_table_schema: Optional[list] = None) -> bool:
         """
         Load Ford OEM CSV file to BigQuery from local file (when GCS upload fails)
         
         Args:
-            csv_file_path: Local path to CSV file
+            csv_file_path: Local path to CSV file (.csv or .csv.gz)
+            new_table_schema: Explicit schema used if the table is created (default: autodetect)
             
         Returns:
             True if successful, False otherwise
@@ -629,6 +1418,9 @@ class BigQueryLoader:
         
         print(f"  Loading from local file: {csv_file_path.name}")
         
+        if not self.check_ford_orders_table(table_id):
+            return False
+        
         # Load directly from local file
         try:
             dataset_ref = self.client.dataset(self.dataset_id)
@@ -649,17 +1441,13 @@ class BigQueryLoader:
             # If table doesn't exist, use autodetect to create schema
             if table_exists and existing_table:
                 # Read CSV header to get actual columns in the CSV
-                import csv
-                with open(csv_file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    csv_header = next(reader)  # Get header row
-                    # Remove quotes from header if present
-                    csv_header = [col.strip('"') for col in csv_header]
+                csv_header = read_csv_header(csv_file_path)
                 
                 # Build schema that matches CSV columns by name from table schema
-                # This ensures we only use columns that exist in the CSV
+                # CSV columns are loaded by position, so every CSV column gets a field
                 csv_schema = []
                 table_schema_dict = {field.name: field for field in existing_table.schema}
+                new_schema_dict = {field.name: field for field in new_table_schema or []}
                 missing_in_table = []
                 
                 for col_name in csv_header:
@@ -669,11 +1457,16 @@ class BigQueryLoader:
                     else:
                         # Column in CSV but not in table - will be added as new column
                         missing_in_table.append(col_name)
+                        csv_schema.append(bigquery.SchemaField(
+                            col_name,
+                            new_schema_dict[col_name].field_type if col_name in new_schema_dict else "STRING",
+                            mode="NULLABLE"
+                        ))
                 
                 if missing_in_table:
                     print(f"  ℹ CSV has {len(missing_in_table)} new columns not in table: {', '.join(missing_in_table[:5])}{'...' if len(missing_in_table) > 5 else ''}")
                 
-                print(f"  ℹ CSV has {len(csv_header)} columns, matched {len(csv_schema)} with table schema")
+                print(f"  ℹ CSV has {len(csv_header)} columns, matched {len(csv_header) - len(missing_in_table)} with table schema")
                 
                 # Use schema built from CSV columns (only columns that exist in CSV)
                 job_config = bigquery.LoadJobConfig(
@@ -694,6 +1487,21 @@ class BigQueryLoader:
                 )
                 print(f"  ℹ Using schema with {len(csv_schema)} fields matching CSV columns")
                 print(f"  ℹ Schema update enabled - new columns will be added if present in CSV")
+            elif new_table_schema:
+                # Table doesn't exist, create it with the processor's declared schema
+                job_config = bigquery.LoadJobConfig(
+                    source_format=bigquery.SourceFormat.CSV,
+                    skip_leading_rows=1,
+                    schema=new_table_schema,
+                    autodetect=False,
+                    write_disposition="WRITE_APPEND",
+                    field_delimiter=",",
+                    quote_character='"',
+                    allow_quoted_newlines=True,
+                    encoding="UTF-8",
+                    max_bad_records=0,
+                )
+                print(f"  ℹ Table doesn't exist, will create it with explicit schema ({len(new_table_schema)} fields)")
             else:
                 # Table doesn't exist, use autodetect to create schema
                 job_config = bigquery.LoadJobConfig(
@@ -710,6 +1518,10 @@ class BigQueryLoader:
                 )
                 print(f"  ℹ Table doesn't exist, will auto-detect schema from CSV")
             
+            if not table_exists:
+                _set_ford_orders_layout(job_config)
+                print(f"  ℹ New table will be partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+            
             # Load from local file
             with open(csv_file_path, 'rb') as source_file:
                 load_job = self.client.load_table_from_file(
@@ -736,6 +1548,7 @@ class BigQueryLoader:
                 print(f"✓ Successfully appended {rows_added} rows to {self.dataset_id}.{table_id}")
                 print(f"  Table now contains {table.num_rows} total rows (was {rows_before})")
                 
+                self._refresh_ford_field_changes(csv_file_path.name, table_id)
                 return True
                 
         except Exception as e:
@@ -744,6 +1557,1049 @@ class BigQueryLoader:
             traceback.print_exc()
             return False
     
+    def load_parquet_to_bigquery(
+        self,
+        source,
+        table_id: str,
+        write_disposition: str = "WRITE_APPEND",
+        ford_layout: bool = False
+    ) -> bool:
+        """
+        Load a Parquet file to a BigQuery table
+        
+        Parquet files carry their own typed schema (including DATE columns), so
+        there is no autodetect, CSV parsing or bad-record tolerance involved.
+        When appending, new columns in the file are added to the table.
+        
+        Args:
+            source: GCS URI (e.g., "gs://bucket/path/file.parquet") or local Path
+            table_id: BigQuery table ID
+            write_disposition: WRITE_APPEND (default), WRITE_TRUNCATE, or WRITE_EMPTY
+            ford_layout: Partition and cluster the table like ford_oem_orders if
+                         the load creates it
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        is_local = isinstance(source, Path)
+        try:
+            if not is_local and not self._check_gcs_file_exists(source):
+                print(f"✗ File not found in GCS: {source}")
+                return False
+            
+            dataset_ref = self.client.dataset(self.dataset_id)
+            table_ref = dataset_ref.table(table_id)
+            
+            # Check if table exists
+            existing_table = None
+            try:
+                existing_table = self.client.get_table(table_ref)
+                print(f"ℹ Table {table_id} already exists ({existing_table.num_rows} rows)")
+            except NotFound:
+                print(f"ℹ Table {table_id} does not exist, will be created from the Parquet schema")
+            
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=write_disposition,
+            )
+            if existing_table and write_disposition == "WRITE_APPEND":
+                job_config.schema_update_options = [
+                    bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
+                ]
+            if ford_layout and existing_table is None:
+                _set_ford_orders_layout(job_config)
+                print(f"  ℹ New table will be partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+            
+            print(f"Loading Parquet to BigQuery table: {self.dataset_id}.{table_id}")
+            print(f"  Source: {source}")
+            print(f"  Write disposition: {write_disposition}")
+            
+            if is_local:
+                with open(source, 'rb') as source_file:
+                    load_job = self.client.load_table_from_file(
+                        source_file,
+                        table_ref,
+                        job_config=job_config
+                    )
+                    print(f"  Waiting for load job to complete...")
+                    load_job.result(timeout=300)
+            else:
+                load_job = self.client.load_table_from_uri(
+                    source,
+                    table_ref,
+                    job_config=job_config
+                )
+                print(f"  Waiting for load job to complete...")
+                load_job.result(timeout=300)
+            
+            if load_job.errors:
+                print(f"✗ Load job completed with errors:")
+                for error in load_job.errors:
+                    print(f"  - {error}")
+                return False
+            
+            table = self.client.get_table(table_ref)
+            rows_before = existing_table.num_rows if existing_table else 0
+            print(f"✓ Successfully loaded {load_job.output_rows} rows to {self.dataset_id}.{table_id}")
+            print(f"  Table now contains {table.num_rows} total rows (was {rows_before})")
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error loading Parquet to BigQuery: {e}")
+            print(f"  Source: {source}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            print()
+            print("  Common causes:")
+            print("    - BigQuery service account lacks permissions")
+            print("    - Parquet column types differ from an existing (CSV-loaded) table")
+            print("    - Network timeout or BigQuery quota exceeded")
+            print()
+            import traceback
+            print("Full error details:")
+            traceback.print_exc()
+            return False
+    
+    def load_oem_parquet(self, parquet_filename: str, oem_name: str) -> bool:
+        """
+        Load OEM Parquet file to BigQuery (same table naming as load_oem_csv)
+        
+        Args:
+            parquet_filename: Name of Parquet file (e.g., "Ford_Dealer_Report_clean_20251105.parquet")
+            oem_name: OEM name (e.g., "Ford", "Toyota")
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        date_str = self.extract_date_from_oem_filename(parquet_filename)
+        
+        if not date_str:
+            # Fallback: use today's date
+            date_str = datetime.now().strftime("%m_%d_%Y")
+            print(f"⚠ Could not extract date from filename, using today: {date_str}")
+        
+        table_id = f"db_{oem_name.lower()}_{date_str}"
+        gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{parquet_filename}"
+        return self.load_parquet_to_bigquery(gcs_uri, table_id, write_disposition="WRITE_TRUNCATE")
+    
+    def load_ford_oem_parquet(self, parquet_filename: str) -> bool:
+        """
+        Load Ford OEM Parquet file to BigQuery - appends to ford_oem_orders
+        
+        Parquet counterpart of load_ford_oem_csv(). Date fields arrive as
+        native DATE columns.
+        
+        Args:
+            parquet_filename: Name of Parquet file (e.g., "Ford_Dealer_Report_clean_20251105.parquet")
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        table_id = "ford_oem_orders"
+        gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{parquet_filename}"
+        
+        if not self.check_ford_orders_table(table_id):
+            return False
+        self._warn_if_ford_date_loaded(parquet_filename, table_id)
+        
+        success = self.load_parquet_to_bigquery(gcs_uri, table_id, write_disposition="WRITE_APPEND", ford_layout=True)
+        if success:
+            self._refresh_ford_field_changes(parquet_filename, table_id)
+        return success
+    
+    def load_ford_oem_parquet_from_local(self, parquet_file_path: Path) -> bool:
+        """
+        Load Ford OEM Parquet file to BigQuery from local file (when GCS upload fails)
+        
+        Args:
+            parquet_file_path: Local path to Parquet file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        table_id = "ford_oem_orders"
+        print(f"  Loading from local file: {parquet_file_path.name}")
+        
+        if not self.check_ford_orders_table(table_id):
+            return False
+        self._warn_if_ford_date_loaded(parquet_file_path.name, table_id)
+        
+        success = self.load_parquet_to_bigquery(
+            Path(parquet_file_path),
+            table_id,
+            write_disposition="WRITE_APPEND",
+            ford_layout=True
+        )
+        if success:
+            self._refresh_ford_field_changes(parquet_file_path.name, table_id)
+        return success
+    
+    def load_ford_oem_partition(self, source, new_table_schema: Optional[list] = None) -> bool:
+        """
+        Load a Ford report into ford_oem_orders, replacing the rows of its date
+        
+        The report is loaded into its _source_file_date partition
+        (ford_oem_orders$YYYYMMDD) with WRITE_TRUNCATE: BigQuery swaps the
+        partition when the job commits, so loading a date again replaces it
+        instead of adding a second copy, and other dates are untouched. No
+        existence check is run before the load. The field changes of the
+        date and of the next loaded date are materialized again.
+        
+        Args:
+            source: Name of the output file in GCS (e.g.,
+                    "Ford_Dealer_Report_clean_20251105.csv"), or a local Path
+                    when the GCS upload failed
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        table_id = "ford_oem_orders"
+        name = source.name if isinstance(source, Path) else source
+        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', name)
+        if not date_match:
+            print(f"✗ Could not extract the report date from {name}")
+            return False
+        snapshot_date = "-".join(date_match.groups())
+        if not isinstance(source, Path):
+            source = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{source}"
+        
+        try:
+            if not self.check_ford_orders_table(table_id, require_partitioned=True):
+                print(f"✗ Cannot replace {snapshot_date}")
+                return False
+            try:
+                self.client.get_table(self.client.dataset(self.dataset_id).table(table_id))
+            except NotFound:
+                # First load: create the partitioned table with this date
+                print(f"ℹ Table {table_id} does not exist, creating it partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+                table = self._load_file_to_table(
+                    source, table_id, new_table_schema, write_disposition="WRITE_APPEND", ford_layout=True
+                )
+                print(f"✓ Loaded {table.num_rows} rows for {snapshot_date} into {self.dataset_id}.{table_id}")
+                self.materialize_ford_field_changes(snapshot_date, table_id)
+                return True
+            
+            partition = f"{table_id}${''.join(date_match.groups())}"
+            print(f"Replacing partition {self.dataset_id}.{partition} with {name}...")
+            loaded = self._load_file_to_table(source, partition, new_table_schema)
+            print(f"✓ Loaded {loaded.num_rows} rows for {snapshot_date} into {self.dataset_id}.{table_id}")
+            print(f"  Rows previously loaded for {snapshot_date} were replaced")
+            self._refresh_ford_field_changes_after_replace(snapshot_date, table_id)
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error replacing the {snapshot_date} partition: {e}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            print(f"  Every row of the report must have _source_file_date = {snapshot_date}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def write_ford_oem_arrow(
+        self,
+        table,
+        schema: list,
+        label: str,
+        writer=None,
+        mode: str = "pending"
+    ) -> bool:
+        """
+        Append a processed Ford report to ford_oem_orders with the Storage Write API
+        
+        Storage-write counterpart of the append loads: the processed rows go
+        from an Arrow table straight into the table (see
+        processing/storage_writer.py), without an output file in GCS or a
+        load job. In "pending" mode the report's rows are committed at once
+        when the write finishes, so a failed write leaves no partial date.
+        The Storage Write API does not create tables or add columns, so
+        ford_oem_orders is created here (partitioned and clustered) or given
+        the report's new columns first.
+        
+        Args:
+            table: pyarrow Table of the processed report (see BaseOEMProcessor.to_arrow_table)
+            schema: BigQuery schema of the report's columns (see get_bigquery_schema)
+            label: Output filename, for the date check and logs
+            writer: StorageWriter or FakeStorageWriter (default: StorageWriter for this dataset)
+            mode: "pending" (atomic per report) or "committed"
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        from processing.storage_writer import StorageWriter
+        
+        table_id = "ford_oem_orders"
+        dataset_ref = self.client.dataset(self.dataset_id)
+        table_ref = dataset_ref.table(table_id)
+        try:
+            if not self.check_ford_orders_table(table_id):
+                return False
+            try:
+                orders = self.client.get_table(table_ref)
+                self._warn_if_ford_date_loaded(label, table_id)
+                known = {field.name for field in orders.schema}
+                new_fields = [field for field in schema if field.name not in known]
+                if new_fields:
+                    orders.schema = list(orders.schema) + [
+                        bigquery.SchemaField(field.name, field.field_type, mode="NULLABLE") for field in new_fields
+                    ]
+                    self.client.update_table(orders, ["schema"])
+                    print(f"  ℹ Added {len(new_fields)} new column(s) to {table_id}")
+            except NotFound:
+                print(f"ℹ Table {table_id} does not exist, creating it partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+                orders = bigquery.Table(table_ref, schema=schema)
+                _set_ford_orders_layout(orders)
+                self.client.create_table(orders)
+            
+            writer = writer or StorageWriter(self.project_id, self.dataset_id)
+            print(f"Writing {table.num_rows} rows to {self.dataset_id}.{table_id} with the Storage Write API ({mode} stream)...")
+            rows = writer.write_table(table_id, table, mode)
+            print(f"✓ Wrote {rows} rows from {label} to {self.dataset_id}.{table_id}")
+        except Exception as e:
+            print(f"✗ Error writing {label} to {table_id}: {e}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            import traceback
+            traceback.print_exc()
+            return False
+        
+        self._refresh_ford_field_changes(label, table_id)
+        return True
+    
+    def load_files_batch(
+        self,
+        sources: list,
+        table_id: str,
+        new_table_schema: Optional[list] = None,
+        ford_layout: bool = False,
+        count_column: str = "_source_filename"
+    ) -> Optional[dict]:
+        """
+        Append several output files to a table with one load job
+        
+        Loading a backfill file by file runs one load job (and its wait and
+        schema checks) per date. Here every GCS URI goes into a single
+        multi-URI load job (wildcard URIs work too) into a {table_id}_batch_staging
+        scratch table, which one query job then appends to the table. A
+        failed load leaves the table untouched, and the files count as one
+        load job against the table's quotas. Local files (GCS upload failed)
+        cannot share a job: each is appended to the scratch table by its own
+        load job.
+        
+        Rows are counted per file with one GROUP BY on count_column of the
+        scratch table, so every file's row count is reported even though the
+        load job only returns a total.
+        
+        Args:
+            sources: GCS URIs or local Paths of .csv, .csv.gz or .parquet files,
+                     all of one format and with the same columns (see
+                     batch_load_groups)
+            table_id: Table to append to
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            ford_layout: Partition and cluster the table like ford_oem_orders if
+                         the batch creates it
+            count_column: Column identifying each file's rows (e.g.
+                          _source_filename or _source_file_date)
+            
+        Returns:
+            Dictionary of count_column value -> rows appended, or None on failure
+        """
+        from google.cloud.bigquery import QueryJobConfig
+        
+        uris = [source for source in sources if not isinstance(source, Path)]
+        local_files = [source for source in sources if isinstance(source, Path)]
+        formats = {str(source).endswith(".parquet") for source in sources}
+        if not sources or len(formats) > 1:
+            print(f"✗ A batch load needs files of one format (got {len(sources)} file(s))")
+            return None
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        staging_table = f"{table_id}_batch_staging"
+        dataset_ref = self.client.dataset(self.dataset_id)
+        try:
+            print(f"Loading {len(sources)} file(s) into {self.dataset_id}.{staging_table} "
+                  f"({1 if uris else 0} multi-file job, {len(local_files)} local file job(s))...")
+            write_disposition = "WRITE_TRUNCATE"
+            if uris:
+                self._load_file_to_table(uris, staging_table, new_table_schema, timeout=600)
+                write_disposition = "WRITE_APPEND"
+            for local_file in local_files:
+                print(f"  Loading from local file: {local_file.name}")
+                self._load_file_to_table(local_file, staging_table, new_table_schema, write_disposition, timeout=600)
+                write_disposition = "WRITE_APPEND"
+            
+            query = f"""
+            SELECT CAST({count_column} AS STRING) AS source, COUNT(*) AS row_count
+            FROM `{project_dataset}.{staging_table}`
+            GROUP BY source
+            ORDER BY source
+            """
+            row_counts = {row.source: row.row_count for row in self.client.query(query).result()}
+            
+            job_config = QueryJobConfig(destination=f"{project_dataset}.{table_id}")
+            try:
+                self.client.get_table(dataset_ref.table(table_id))
+                job_config.write_disposition = "WRITE_APPEND"
+                job_config.schema_update_options = [
+                    bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
+                ]
+            except NotFound:
+                print(f"ℹ Table {table_id} does not exist, creating it")
+                job_config.write_disposition = "WRITE_EMPTY"
+                if ford_layout:
+                    _set_ford_orders_layout(job_config)
+            self.client.query(
+                f"SELECT * FROM `{project_dataset}.{staging_table}`", job_config=job_config
+            ).result(timeout=600)
+        except Exception as e:
+            print(f"✗ Error batch loading into {table_id}: {e}")
+            print(f"  Table: {project_dataset}.{table_id}")
+            import traceback
+            traceback.print_exc()
+            return None
+        
+        print(f"✓ Appended {sum(row_counts.values())} rows from {len(sources)} file(s) to {self.dataset_id}.{table_id}")
+        for source, row_count in row_counts.items():
+            print(f"  {source}: {row_count} rows")
+        return row_counts
+    
+    def load_ford_oem_batch(self, sources: list, new_table_schema: Optional[list] = None) -> Optional[dict]:
+        """
+        Append several Ford reports to ford_oem_orders with one load job (backfills)
+        
+        Batch counterpart of load_ford_oem_csv / load_ford_oem_parquet (append
+        mode): dates that are already loaded are checked with one query, the
+        reports are appended by load_files_batch, then the field changes of
+        each date are materialized in date order.
+        
+        Args:
+            sources: Names of output files in GCS (e.g.,
+                     "Ford_Dealer_Report_clean_20251105.csv") or local Paths when
+                     the GCS upload failed, of one format and with the same columns
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            
+        Returns:
+            Dictionary of _source_file_date (YYYY-MM-DD) -> rows appended, or None on failure
+        """
+        from google.cloud.bigquery import QueryJobConfig, ArrayQueryParameter
+        
+        table_id = "ford_oem_orders"
+        if not self.check_ford_orders_table(table_id):
+            return None
+        
+        dates = []
+        for source in sources:
+            date_match = re.search(r'(\d{4})(\d{2})(\d{2})', source.name if isinstance(source, Path) else source)
+            if date_match:
+                dates.append("-".join(date_match.groups()))
+        
+        try:
+            query = f"""
+            SELECT CAST(_source_file_date AS STRING) AS loaded_date, COUNT(*) AS row_count
+            FROM `{self.project_id}.{self.dataset_id}.{table_id}`
+            WHERE _source_file_date IN UNNEST(@dates)
+            GROUP BY loaded_date
+            ORDER BY loaded_date
+            """
+            job_config = QueryJobConfig(query_parameters=[ArrayQueryParameter("dates", "DATE", dates)])
+            for row in self.client.query(query, job_config=job_config).result():
+                print(f"⚠ Warning: Data for date {row.loaded_date} already exists in table ({row.row_count} rows)")
+                print(f"  Appending it again will create duplicates")
+        except NotFound:
+            # Table doesn't exist yet, first load - that's fine
+            pass
+        except Exception as e:
+            print(f"⚠ Could not check for existing data: {e}")
+            print(f"  Continuing with load...")
+        
+        uris = [
+            source if isinstance(source, Path) else f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{source}"
+            for source in sources
+        ]
+        row_counts = self.load_files_batch(
+            uris, table_id, new_table_schema, ford_layout=True, count_column="_source_file_date"
+        )
+        if row_counts is None:
+            return None
+        for snapshot_date in sorted(row_counts):
+            self.materialize_ford_field_changes(snapshot_date, table_id)
+        return row_counts
+    
+    def record_snapshot_alias(
+        self,
+        oem_name: str,
+        snapshot_date: str,
+        same_as_date: str,
+        fingerprint: str,
+        row_count: int
+    ) -> bool:
+        """
+        Record that an OEM snapshot is identical to an already loaded one
+        
+        Instead of appending the same rows again, an unchanged daily report is
+        stored as one row in {oem}_oem_snapshot_aliases (e.g.
+        ford_oem_snapshot_aliases). Readers look a date up there first and
+        query the same_as_date rows instead.
+        
+        Args:
+            oem_name: OEM name (e.g., "Ford")
+            snapshot_date: Date of the unchanged report (YYYY-MM-DD)
+            same_as_date: Date whose rows are identical (YYYY-MM-DD)
+            fingerprint: Row-set fingerprint shared by both dates
+            row_count: Number of rows in the snapshot
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        table_id = f"{oem_name.lower()}_oem_snapshot_aliases"
+        try:
+            table_ref = self.client.dataset(self.dataset_id).table(table_id)
+            job_config = bigquery.LoadJobConfig(
+                schema=[
+                    bigquery.SchemaField("snapshot_date", "DATE", mode="REQUIRED"),
+                    bigquery.SchemaField("same_as_date", "DATE", mode="REQUIRED"),
+                    bigquery.SchemaField("row_fingerprint", "STRING"),
+                    bigquery.SchemaField("row_count", "INT64"),
+                    bigquery.SchemaField("recorded_at", "TIMESTAMP"),
+                ],
+                write_disposition="WRITE_APPEND",
+            )
+            row = {
+                "snapshot_date": snapshot_date,
+                "same_as_date": same_as_date,
+                "row_fingerprint": fingerprint,
+                "row_count": row_count,
+                "recorded_at": datetime.now().isoformat(),
+            }
+            load_job = self.client.load_table_from_json([row], table_ref, job_config=job_config)
+            load_job.result(timeout=120)
+            print(f"✓ Recorded {snapshot_date} as same as {same_as_date} in {self.dataset_id}.{table_id}")
+            return True
+        except Exception as e:
+            print(f"✗ Error recording snapshot alias: {e}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            return False
+    
+    def record_snapshot_fingerprint(
+        self,
+        oem_name: str,
+        snapshot_date: str,
+        fingerprint: str,
+        row_count: int,
+        same_as_date: Optional[str] = None
+    ) -> bool:
+        """
+        Record the fingerprint of a loaded (or aliased) OEM snapshot in BigQuery
+        
+        {oem}_oem_snapshot_fingerprints (e.g. ford_oem_snapshot_fingerprints)
+        is the shared copy of the local snapshot registry: every host that
+        loads reports (CLI, API) checks it for the previous date's
+        fingerprint (see previous_snapshot_fingerprint), so skipping unchanged
+        reports does not depend on which host loaded that date. A date
+        recorded again keeps its latest row.
+        
+        Args:
+            oem_name: OEM name (e.g., "Ford")
+            snapshot_date: Snapshot date (YYYY-MM-DD)
+            fingerprint: Row-set fingerprint (see processing/snapshots.py)
+            row_count: Number of rows in the snapshot
+            same_as_date: Date holding the rows if the snapshot was recorded as an alias
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        table_id = f"{oem_name.lower()}_oem_snapshot_fingerprints"
+        try:
+            table_ref = self.client.dataset(self.dataset_id).table(table_id)
+            job_config = bigquery.LoadJobConfig(
+                schema=[
+                    bigquery.SchemaField("snapshot_date", "DATE", mode="REQUIRED"),
+                    bigquery.SchemaField("row_fingerprint", "STRING", mode="REQUIRED"),
+                    bigquery.SchemaField("row_count", "INT64"),
+                    bigquery.SchemaField("same_as_date", "DATE"),
+                    bigquery.SchemaField("recorded_at", "TIMESTAMP"),
+                ],
+                write_disposition="WRITE_APPEND",
+            )
+            row = {
+                "snapshot_date": snapshot_date,
+                "row_fingerprint": fingerprint,
+                "row_count": row_count,
+                "same_as_date": same_as_date,
+                "recorded_at": datetime.now().isoformat(),
+            }
+            load_job = self.client.load_table_from_json([row], table_ref, job_config=job_config)
+            load_job.result(timeout=120)
+            return True
+        except Exception as e:
+            print(f"⚠ Could not record the {snapshot_date} fingerprint in BigQuery: {e}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            return False
+    
+    def previous_snapshot_fingerprint(self, oem_name: str, snapshot_date: str) -> Optional[dict]:
+        """
+        Get the fingerprint of the latest snapshot recorded in BigQuery before a date
+        
+        Args:
+            oem_name: OEM name (e.g., "Ford")
+            snapshot_date: Snapshot date (YYYY-MM-DD)
+            
+        Returns:
+            Dictionary with date, fingerprint and same_as (YYYY-MM-DD or None),
+            or None if no earlier snapshot is recorded (or the table does not exist)
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        query = f"""
+        SELECT
+            CAST(snapshot_date AS STRING) AS snapshot_date,
+            row_fingerprint,
+            CAST(same_as_date AS STRING) AS same_as_date
+        FROM `{self.project_id}.{self.dataset_id}.{oem_name.lower()}_oem_snapshot_fingerprints`
+        WHERE snapshot_date < @snapshot_date
+        ORDER BY snapshot_date DESC, recorded_at DESC
+        LIMIT 1
+        """
+        job_config = QueryJobConfig(query_parameters=[
+            ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+        ])
+        try:
+            row = next(iter(self.client.query(query, job_config=job_config).result()), None)
+        except NotFound:
+            return None
+        if row is None:
+            return None
+        return {"date": row.snapshot_date, "fingerprint": row.row_fingerprint, "same_as": row.same_as_date}
+    
+    def submit_file_load(
+        self,
+        source,
+        table_id: str,
+        schema: Optional[list] = None,
+        write_disposition: str = "WRITE_TRUNCATE",
+        ford_layout: bool = False
+    ):
+        """
+        Start loading an output file into a table without waiting for the job
+        
+        A local file is uploaded with the request (this call returns once it
+        is sent); the load itself runs in BigQuery. Track the job with a
+        processing.load_jobs.LoadJobTracker or wait with job.result().
+        
+        Args:
+            source: GCS URI or local Path of a .csv, .csv.gz or .parquet file, or
+                    a list of GCS URIs (wildcards allowed) of one format
+                    loaded by a single job
+            table_id: Table to load into, or one partition of it ("table$YYYYMMDD")
+            schema: Explicit schema for CSV files (default: autodetect)
+            write_disposition: WRITE_TRUNCATE (replace) or WRITE_APPEND (new
+                               columns in the file are added to the table, as
+                               when replacing a partition)
+            ford_layout: Partition and cluster the table like ford_oem_orders if
+                         the load creates it
+            
+        Returns:
+            The submitted LoadJob
+        """
+        table_ref = self.client.dataset(self.dataset_id).table(table_id)
+        first = source[0] if isinstance(source, list) else source
+        name = first.name if isinstance(first, Path) else first
+        if name.endswith(".parquet"):
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=write_disposition,
+            )
+        else:
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.CSV,
+                skip_leading_rows=1,
+                schema=schema,
+                autodetect=schema is None,
+                write_disposition=write_disposition,
+                field_delimiter=",",
+                quote_character='"',
+                allow_quoted_newlines=True,
+                encoding="UTF-8",
+                max_bad_records=0,
+            )
+        if write_disposition == "WRITE_APPEND" or "$" in table_id:
+            job_config.schema_update_options = [
+                bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
+            ]
+        if ford_layout:
+            _set_ford_orders_layout(job_config)
+        
+        if isinstance(source, Path):
+            with open(source, 'rb') as source_file:
+                return self.client.load_table_from_file(source_file, table_ref, job_config=job_config)
+        return self.client.load_table_from_uri(source, table_ref, job_config=job_config)
+    
+    def _load_file_to_table(
+        self,
+        source,
+        table_id: str,
+        schema: Optional[list] = None,
+        write_disposition: str = "WRITE_TRUNCATE",
+        ford_layout: bool = False,
+        timeout: int = 300
+    ):
+        """
+        Load an output file into a table, replacing (default) or appending to it
+        
+        Args:
+            source: File(s) to load (see submit_file_load)
+            table_id: Table to load into, or one partition of it ("table$YYYYMMDD")
+            schema: Explicit schema for CSV files (default: autodetect)
+            write_disposition: WRITE_TRUNCATE or WRITE_APPEND
+            ford_layout: Partition and cluster the table like ford_oem_orders if
+                         the load creates it
+            timeout: Seconds to wait for the load job
+            
+        Returns:
+            The loaded table (or partition)
+        """
+        load_job = self.submit_file_load(source, table_id, schema, write_disposition, ford_layout)
+        load_job.result(timeout=timeout)
+        return self.client.get_table(self.client.dataset(self.dataset_id).table(table_id))
+    
+    def submit_ford_oem_load(
+        self,
+        tracker,
+        source,
+        new_table_schema: Optional[list] = None,
+        replace: bool = False,
+        on_done=None
+    ) -> bool:
+        """
+        Submit a Ford report load to a LoadJobTracker instead of waiting for it
+        
+        Non-blocking counterpart of the append loads (load_ford_oem_csv and
+        friends) and, with replace, of load_ford_oem_partition: the caller can
+        convert the next report while this one loads. When the job finishes,
+        the tracker runs the follow-up (field changes of the date, then
+        on_done). Use a tracker with ordered=True when submitting several
+        dates, so each date's field changes see the previous date loaded.
+        
+        The load that creates ford_oem_orders is waited on, so concurrent
+        jobs never race to create the table.
+        
+        Args:
+            tracker: processing.load_jobs.LoadJobTracker
+            source: Name of the output file in GCS (e.g.,
+                    "Ford_Dealer_Report_clean_20251105.csv"), or a local Path
+                    when the GCS upload failed
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            replace: Replace the report date's partition instead of appending
+            on_done: Called with the completion event after the follow-up
+            
+        Returns:
+            True if the job was submitted, False otherwise
+        """
+        table_id = "ford_oem_orders"
+        name = source.name if isinstance(source, Path) else source
+        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', name)
+        snapshot_date = "-".join(date_match.groups()) if date_match else None
+        if replace and not snapshot_date:
+            print(f"✗ Could not extract the report date from {name}")
+            return False
+        if not isinstance(source, Path):
+            source = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{source}"
+        
+        try:
+            if not self.check_ford_orders_table(table_id, require_partitioned=replace):
+                if replace:
+                    print(f"✗ Cannot replace {snapshot_date}")
+                return False
+            try:
+                self.client.get_table(self.client.dataset(self.dataset_id).table(table_id))
+                exists = True
+            except NotFound:
+                exists = False
+            
+            target = table_id
+            write_disposition = "WRITE_APPEND"
+            if exists and replace:
+                target = f"{table_id}${snapshot_date.replace('-', '')}"
+                write_disposition = "WRITE_TRUNCATE"
+            elif exists:
+                self._warn_if_ford_date_loaded(name, table_id)
+            
+            load_job = self.submit_file_load(
+                source, target, new_table_schema, write_disposition, ford_layout=True
+            )
+            if not exists:
+                print(f"ℹ Table {table_id} does not exist, creating it partitioned on {FORD_ORDERS_PARTITION_COLUMN}")
+                load_job.result(timeout=300)
+        except Exception as e:
+            print(f"✗ Error submitting the load of {name}: {e}")
+            print(f"  Table: {self.project_id}.{self.dataset_id}.{table_id}")
+            return False
+        
+        def follow_up(event: dict):
+            if event["state"] == "done" and snapshot_date and write_disposition == "WRITE_TRUNCATE":
+                self._refresh_ford_field_changes_after_replace(snapshot_date, table_id)
+            elif event["state"] == "done" and snapshot_date:
+                self.materialize_ford_field_changes(snapshot_date, table_id)
+            if on_done:
+                on_done(event)
+        
+        tracker.submit(name, load_job, follow_up)
+        print(f"✓ Submitted load job {load_job.job_id} for {name} ({self.dataset_id}.{target})")
+        return True
+    
+    def _ensure_ford_history_tables(self, staging_schema: list):
+        """
+        Create the history and loads tables, adding new report columns to history
+        
+        Args:
+            staging_schema: Schema of the staged report
+        """
+        dataset_ref = self.client.dataset(self.dataset_id)
+        history_ref = dataset_ref.table(FORD_HISTORY_TABLE)
+        try:
+            history = self.client.get_table(history_ref)
+            known = {field.name for field in history.schema}
+            new_fields = [field for field in staging_schema if field.name not in known]
+            if new_fields:
+                history.schema = list(history.schema) + [
+                    bigquery.SchemaField(field.name, field.field_type, mode="NULLABLE") for field in new_fields
+                ]
+                self.client.update_table(history, ["schema"])
+                print(f"  ℹ Added {len(new_fields)} new column(s) to {FORD_HISTORY_TABLE}")
+        except NotFound:
+            history = bigquery.Table(history_ref, schema=list(staging_schema) + [
+                bigquery.SchemaField("valid_from", "DATE", mode="REQUIRED"),
+                bigquery.SchemaField("valid_to", "DATE"),
+            ])
+            # MERGE matches versions on _row_key
+            history.clustering_fields = ["_row_key"]
+            self.client.create_table(history)
+            print(f"  ℹ Created {self.dataset_id}.{FORD_HISTORY_TABLE}")
+        
+        loads = bigquery.Table(dataset_ref.table(FORD_HISTORY_LOADS_TABLE), schema=[
+            bigquery.SchemaField("snapshot_date", "DATE", mode="REQUIRED"),
+            bigquery.SchemaField("source_filename", "STRING"),
+            bigquery.SchemaField("source_file_created_timestamp", "TIMESTAMP"),
+            bigquery.SchemaField("row_count", "INT64"),
+            bigquery.SchemaField("loaded_at", "TIMESTAMP"),
+        ])
+        self.client.create_table(loads, exists_ok=True)
+    
+    def _latest_load_date(self, loads_table: str) -> Optional[str]:
+        """Get the latest snapshot date recorded in a loads table (YYYY-MM-DD), or None"""
+        query = f"""
+        SELECT CAST(MAX(snapshot_date) AS STRING) AS latest
+        FROM `{self.project_id}.{self.dataset_id}.{loads_table}`
+        """
+        try:
+            row = next(iter(self.client.query(query).result()), None)
+        except NotFound:
+            return None
+        return row.latest if row else None
+    
+    def load_ford_oem_history(self, source, new_table_schema: Optional[list] = None) -> bool:
+        """
+        Merge a Ford report into the history table instead of appending it
+        
+        ford_oem_orders_history holds one row per order version with
+        valid_from / valid_to, so storage and comparison scans grow with the
+        number of changes rather than the number of days. The report is
+        loaded into a staging table, then merged (see ford_history_merge_sql)
+        and the date is recorded in ford_oem_history_loads. The
+        ford_oem_orders_snapshots view serves the same per-date snapshots as
+        ford_oem_orders.
+        
+        Dates must be merged in order: a report older than the latest merged
+        date is rejected (re-merging the latest date is a no-op).
+        
+        Args:
+            source: Name of the output file in GCS (e.g.,
+                    "Ford_Dealer_Report_clean_20251105.csv"), or a local Path
+                    when the GCS upload failed
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        name = source.name if isinstance(source, Path) else source
+        date_match = re.search(r'(\d{4})(\d{2})(\d{2})', name)
+        if not date_match:
+            print(f"✗ Could not extract the report date from {name}")
+            return False
+        snapshot_date = "-".join(date_match.groups())
+        if not isinstance(source, Path):
+            source = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{source}"
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        try:
+            latest = self._latest_load_date(FORD_HISTORY_LOADS_TABLE)
+            if latest and snapshot_date < latest:
+                print(f"✗ {snapshot_date} is older than the latest merged date {latest}")
+                print(f"  History mode needs reports merged in date order")
+                return False
+            
+            print(f"Loading {name} into staging table {self.dataset_id}.{FORD_HISTORY_STAGING_TABLE}...")
+            staging = self._load_file_to_table(source, FORD_HISTORY_STAGING_TABLE, new_table_schema)
+            columns = [field.name for field in staging.schema]
+            missing = [column for column in ("_row_key", "_content_hash") + HISTORY_METADATA_COLUMNS if column not in columns]
+            if missing:
+                print(f"✗ Report is missing columns required by history mode: {', '.join(missing)}")
+                return False
+            print(f"  ✓ Staged {staging.num_rows} rows")
+            
+            self._ensure_ford_history_tables(staging.schema)
+            
+            print(f"Merging {snapshot_date} into {self.dataset_id}.{FORD_HISTORY_TABLE}...")
+            from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+            script = ford_history_merge_sql(
+                f"{project_dataset}.{FORD_HISTORY_TABLE}",
+                f"{project_dataset}.{FORD_HISTORY_STAGING_TABLE}",
+                f"{project_dataset}.{FORD_HISTORY_LOADS_TABLE}",
+                columns
+            )
+            job_config = QueryJobConfig(query_parameters=[
+                ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+            ])
+            query_job = self.client.query(script, job_config=job_config)
+            counts = next(iter(query_job.result(timeout=300)))
+            
+            # Recreate the view so it picks up columns added to the history table
+            self.client.query(ford_snapshots_view_sql(
+                f"{project_dataset}.{FORD_SNAPSHOTS_VIEW}",
+                f"{project_dataset}.{FORD_HISTORY_TABLE}",
+                f"{project_dataset}.{FORD_HISTORY_LOADS_TABLE}"
+            )).result(timeout=120)
+            
+            print(f"✓ Merged {snapshot_date}: {counts.inserted_versions} new version(s), "
+                  f"{counts.closed_versions} closed, {staging.num_rows - counts.inserted_versions} unchanged")
+            print(f"  Snapshots view: {project_dataset}.{FORD_SNAPSHOTS_VIEW}")
+            self.materialize_ford_field_changes(snapshot_date, FORD_SNAPSHOTS_VIEW)
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error merging into history table: {e}")
+            print(f"  Table: {project_dataset}.{FORD_HISTORY_TABLE}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def latest_ford_delta_date(self) -> Optional[str]:
+        """
+        Get the latest date loaded in delta mode
+        
+        Returns:
+            Date in YYYY-MM-DD format, or None if nothing was loaded yet
+        """
+        return self._latest_load_date(FORD_DELTA_LOADS_TABLE)
+    
+    def fetch_ford_delta_versions(self, snapshot_date: str) -> list[tuple[int, int]]:
+        """
+        Get the (_row_key, _content_hash) versions of a date loaded in delta mode
+        
+        Used as the delta baseline when the local copy (processing/delta.py
+        SnapshotKeyCache) is missing.
+        
+        Args:
+            snapshot_date: Date in YYYY-MM-DD format
+            
+        Returns:
+            List of (_row_key, _content_hash) tuples
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        query = f"""
+        SELECT DISTINCT _row_key, _content_hash
+        FROM `{self.project_id}.{self.dataset_id}.{FORD_DELTA_SNAPSHOTS_VIEW}`
+        WHERE _source_file_date = @snapshot_date
+        """
+        job_config = QueryJobConfig(query_parameters=[
+            ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+        ])
+        return [(row._row_key, row._content_hash) for row in self.client.query(query, job_config=job_config).result()]
+    
+    def load_ford_oem_delta(self, source, load_info: dict, new_table_schema: Optional[list] = None) -> bool:
+        """
+        Append a Ford delta file to ford_oem_orders_delta and record the date
+        
+        The delta rows (see processing/delta.py) are appended, the date is
+        recorded in ford_oem_delta_loads and the ford_oem_orders_delta_snapshots
+        view is recreated (see ford_delta_view_sql). Rows left by an earlier,
+        unfinished load of the same date are deleted first, so a failed load
+        can simply be retried.
+        
+        Args:
+            source: Name of the delta file in GCS, a local Path when the GCS
+                    upload failed, or None if nothing changed
+            load_info: date, baseline_date, source_filename,
+                       source_file_created_timestamp, rows and delta_rows
+            new_table_schema: Explicit schema for CSV files (default: autodetect)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
+        
+        project_dataset = f"{self.project_id}.{self.dataset_id}"
+        snapshot_date = load_info["date"]
+        try:
+            if source is not None:
+                try:
+                    self.client.query(
+                        f"DELETE FROM `{project_dataset}.{FORD_DELTA_TABLE}` WHERE _source_file_date = @snapshot_date",
+                        job_config=QueryJobConfig(query_parameters=[
+                            ScalarQueryParameter("snapshot_date", "DATE", snapshot_date),
+                        ])
+                    ).result(timeout=300)
+                except NotFound:
+                    # First delta load creates the table
+                    pass
+                
+                if not isinstance(source, Path):
+                    source = f"gs://{GCS_BUCKET_NAME}/{GCS_BUCKET_PATH}/{source}"
+                print(f"Appending {load_info['delta_rows']} delta rows to {self.dataset_id}.{FORD_DELTA_TABLE}...")
+                self._load_file_to_table(source, FORD_DELTA_TABLE, new_table_schema, write_disposition="WRITE_APPEND")
+            
+            table_ref = self.client.dataset(self.dataset_id).table(FORD_DELTA_LOADS_TABLE)
+            job_config = bigquery.LoadJobConfig(
+                schema=[
+                    bigquery.SchemaField("snapshot_date", "DATE", mode="REQUIRED"),
+                    bigquery.SchemaField("baseline_date", "DATE"),
+                    bigquery.SchemaField("source_filename", "STRING"),
+                    bigquery.SchemaField("source_file_created_timestamp", "TIMESTAMP"),
+                    bigquery.SchemaField("row_count", "INT64"),
+                    bigquery.SchemaField("delta_row_count", "INT64"),
+                    bigquery.SchemaField("loaded_at", "TIMESTAMP"),
+                ],
+                write_disposition="WRITE_APPEND",
+            )
+            row = {
+                "snapshot_date": snapshot_date,
+                "baseline_date": load_info.get("baseline_date"),
+                "source_filename": load_info.get("source_filename"),
+                "source_file_created_timestamp": load_info.get("source_file_created_timestamp"),
+                "row_count": load_info["rows"],
+                "delta_row_count": load_info["delta_rows"],
+                "loaded_at": datetime.now().isoformat(),
+            }
+            self.client.load_table_from_json([row], table_ref, job_config=job_config).result(timeout=120)
+            
+            self.client.query(ford_delta_view_sql(
+                f"{project_dataset}.{FORD_DELTA_SNAPSHOTS_VIEW}",
+                f"{project_dataset}.{FORD_DELTA_TABLE}",
+                f"{project_dataset}.{FORD_DELTA_LOADS_TABLE}"
+            )).result(timeout=120)
+            
+            print(f"✓ Loaded {snapshot_date} as {load_info['delta_rows']} delta rows "
+                  f"(snapshot has {load_info['rows']} rows)")
+            print(f"  Snapshots view: {project_dataset}.{FORD_DELTA_SNAPSHOTS_VIEW}")
+            self.materialize_ford_field_changes(snapshot_date, FORD_DELTA_SNAPSHOTS_VIEW)
+            return True
+            
+        except Exception as e:
+            print(f"✗ Error loading delta rows: {e}")
+            print(f"  Table: {project_dataset}.{FORD_DELTA_TABLE}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
     def create_table_from_query(
         self,
         query: str,
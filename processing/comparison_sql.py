@@ -0,0 +1,495 @@
+"""
+Comparison SQL - BigQuery queries comparing Ford snapshots, generated from the field list
+
+The compared fields are packed into one ARRAY<STRUCT<name, value>> per row, so
+a query handles any number of fields with a single UNNEST instead of one CASE
+column and one UNION ALL branch per field. Values are compared as
+CAST(... AS STRING) with NULL as 'NULL', like the hand-written comparison
+queries in backend/queries.
+
+The two-date comparison queries (field comparison and db_orders
+cross-verification) are generated from a field manifest: one ComparisonField
+per compared field with its db_orders counterpart and compare mode, so adding
+a field is a one-line manifest change.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.row_hashes import hash_columns_sql
+
+# How a Ford value is checked against its db_orders value:
+# text compares the strings, date also matches the same day in another format
+COMPARE_MODES = ("text", "date")
+
+
+@dataclass(frozen=True)
+class ComparisonField:
+    """One compared field of an OEM snapshot"""
+
+    name: str
+    # db_orders column holding the same value (None: not in db_orders)
+    db_field: Optional[str] = None
+    compare: str = "text"
+
+    def __post_init__(self):
+        if self.compare not in COMPARE_MODES:
+            raise ValueError(f"Unsupported compare mode '{self.compare}' for field {self.name}")
+
+
+def field_values_sql(fields: Iterable[str], table_alias: Optional[str] = None) -> str:
+    """
+    Build an ARRAY<STRUCT<name STRING, value STRING>> of a row's fields
+
+    Args:
+        fields: Field (column) names, in output order
+        table_alias: Optional table alias to qualify the column names with
+
+    Returns:
+        SQL array expression
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    values = ",\n            ".join(
+        f"STRUCT('{field}' AS name, CAST({prefix}{field} AS STRING) AS value)" for field in fields
+    )
+    return f"[\n            {values}\n        ]"
+
+
+def row_hash_columns_sql(key_columns: Sequence[str], hash_fields: Sequence[str]) -> list[str]:
+    """
+    Select _row_key and _row_hash, computed in SQL for rows loaded without them
+
+    Rows loaded before the processor emitted the columns have them NULL
+    until backend/queries/ford_oem_orders_add_row_hashes.sql is run; for
+    those the values are computed with the processor's hash (see
+    processing.row_hashes.hash_columns_sql), so they still join and compare.
+
+    Args:
+        key_columns: Columns hashed into _row_key (the processor's ROW_KEY_COLUMNS)
+        hash_fields: Columns hashed into _row_hash (the processor's ROW_HASH_COLUMNS)
+
+    Returns:
+        The two select-list expressions
+    """
+    # Indented to sit in a select list
+    row_key = hash_columns_sql(key_columns).replace("\n", "\n        ")
+    row_hash = hash_columns_sql(hash_fields).replace("\n", "\n        ")
+    return [
+        f"COALESCE(_row_key, {row_key}) AS _row_key",
+        f"COALESCE(_row_hash, {row_hash}) AS _row_hash",
+    ]
+
+
+def change_feed_sql(
+    table: str,
+    key_columns: Sequence[str],
+    fields: Sequence[str],
+    hash_fields: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Build the query listing every field change between consecutive snapshots in a date range
+
+    One scan over @start_date..@end_date: rows are partitioned by _row_key
+    (the composite key) and ordered by _source_file_date, and LAG() gives each
+    row the previous snapshot of the same order. Rows whose _row_hash is
+    unchanged are skipped before the fields are unnested. An order missing on
+    some dates is compared with the last date it was present; orders whose
+    key occurs more than once on a date are paired by _row_hash order.
+
+    Args:
+        table: Fully qualified table or view with the Ford snapshots
+        key_columns: Key columns to return with each change
+        fields: Fields to compare
+        hash_fields: Fields hashed into _row_hash (default: fields), used
+                     for rows loaded without it (see row_hash_columns_sql)
+
+    Returns:
+        SQL taking @start_date and @end_date (DATE), @limit and @offset
+        (INT64); rows are key columns, Field_Name, Old_Value, New_Value,
+        old_date, new_date and total_count (changes in the whole range)
+    """
+    key_columns = list(key_columns)
+    fields = list(fields)
+    keys = ",\n        ".join(key_columns)
+    row_hashes = ",\n        ".join(row_hash_columns_sql(key_columns, hash_fields or fields))
+    return f"""
+WITH snapshot_rows AS (
+    SELECT
+        {keys},
+        {row_hashes},
+        _source_file_date,
+        {field_values_sql(fields)} AS field_values
+    FROM `{table}`
+    WHERE _source_file_date BETWEEN @start_date AND @end_date
+),
+
+snapshots AS (
+    SELECT
+        *,
+        ROW_NUMBER() OVER (PARTITION BY _row_key, _source_file_date ORDER BY _row_hash) AS duplicate_number
+    FROM snapshot_rows
+),
+
+versions AS (
+    SELECT
+        *,
+        LAG(_source_file_date) OVER snapshot_order AS previous_date,
+        LAG(_row_hash) OVER snapshot_order AS previous_row_hash,
+        LAG(field_values) OVER snapshot_order AS previous_field_values
+    FROM snapshots
+    WINDOW snapshot_order AS (PARTITION BY _row_key, duplicate_number ORDER BY _source_file_date)
+),
+
+changes AS (
+    SELECT
+        {", ".join(f"v.{column}" for column in key_columns)},
+        field.name AS Field_Name,
+        v.previous_field_values[OFFSET(position)].value AS Old_Value,
+        field.value AS New_Value,
+        CAST(v.previous_date AS STRING) AS old_date,
+        CAST(v._source_file_date AS STRING) AS new_date
+    FROM versions v,
+        UNNEST(v.field_values) AS field WITH OFFSET position
+    WHERE v.previous_row_hash != v._row_hash
+        AND COALESCE(v.previous_field_values[OFFSET(position)].value, 'NULL') != COALESCE(field.value, 'NULL')
+)
+
+SELECT
+    *,
+    COUNT(*) OVER () AS total_count
+FROM changes
+ORDER BY new_date, {", ".join(key_columns)}, Field_Name
+LIMIT @limit
+OFFSET @offset
+"""
+
+
+def _snapshot_sql(table: str, columns: Sequence[str], date_parameter: str) -> str:
+    """Select only the given columns of one snapshot date"""
+    projection = ",\n        ".join(columns)
+    return f"""SELECT
+        {projection}
+    FROM `{table}`
+    WHERE _source_file_date = {date_parameter}"""
+
+
+def _field_changes_sql(
+    table: str,
+    key_columns: Sequence[str],
+    fields: Sequence[str],
+    changes_table: Optional[str] = None
+) -> str:
+    """
+    Build the CTEs finding the changed fields of orders present on @old_date and @new_date
+
+    Both snapshots are read with only the key, row hash and compared columns.
+    Rows are joined on _row_key and skipped when _row_hash is unchanged; the
+    remaining pairs are unnested into one row per field. Rows loaded without
+    the hash columns get them computed (see row_hash_columns_sql). With changes_table,
+    the changes are read from the materialized table instead (see
+    field_changes_refresh_sql()).
+    """
+    key_columns = list(key_columns)
+    if changes_table:
+        columns = ",\n        ".join(key_columns + ["Field_Name", "Old_Value", "New_Value"])
+        return f"""WITH field_changes AS (
+    SELECT
+        {columns}
+    FROM `{changes_table}`
+    WHERE new_date = @new_date
+        AND old_date = @old_date
+)"""
+
+    fields = list(fields)
+    row_hashes = row_hash_columns_sql(key_columns, fields)
+    old_columns = list(dict.fromkeys(key_columns + row_hashes + fields))
+    new_columns = list(dict.fromkeys(row_hashes + fields))
+    pairs = ",\n            ".join(
+        f"STRUCT('{field}' AS name, CAST(o.{field} AS STRING) AS old_value, CAST(n.{field} AS STRING) AS new_value)"
+        for field in fields
+    )
+    keys = ",\n        ".join(f"o.{column}" for column in key_columns)
+    return f"""WITH old_data AS (
+    {_snapshot_sql(table, old_columns, "@old_date")}
+),
+
+new_data AS (
+    {_snapshot_sql(table, new_columns, "@new_date")}
+),
+
+field_changes AS (
+    SELECT
+        {keys},
+        field.name AS Field_Name,
+        field.old_value AS Old_Value,
+        field.new_value AS New_Value
+    FROM old_data o
+    INNER JOIN new_data n
+        ON o._row_key = n._row_key
+    CROSS JOIN UNNEST([
+            {pairs}
+        ]) AS field
+    WHERE o._row_hash != n._row_hash
+        AND COALESCE(field.old_value, 'NULL') != COALESCE(field.new_value, 'NULL')
+)"""
+
+
+def field_comparison_sql(
+    table: str,
+    key_columns: Sequence[str],
+    manifest: Sequence[ComparisonField],
+    changes_table: Optional[str] = None
+) -> str:
+    """
+    Build the query listing the field changes between two snapshot dates
+
+    Args:
+        table: Fully qualified table or view with the snapshots
+        key_columns: Key columns to return with each change
+        manifest: Compared fields, in output order
+        changes_table: Materialized changes table holding this date pair
+                       (default: compare the snapshots)
+
+    Returns:
+        SQL taking @old_date and @new_date (DATE); rows are key columns,
+        Field_Name, Old_Value, New_Value, old_date and new_date
+    """
+    columns = ",\n    ".join(list(key_columns) + ["Field_Name", "Old_Value", "New_Value"])
+    return f"""{_field_changes_sql(table, key_columns, [field.name for field in manifest], changes_table)}
+
+SELECT
+    {columns},
+    CAST(@old_date AS STRING) AS old_date,
+    CAST(@new_date AS STRING) AS new_date
+FROM field_changes
+ORDER BY {", ".join(key_columns)}, Field_Name
+"""
+
+
+def unique_code_sql(columns: Iterable[str], suffix: str, table_alias: Optional[str] = None) -> str:
+    """
+    Build the order code matching snapshot rows to db_orders rows (values joined with '||')
+
+    Args:
+        columns: Columns making up the code, in order
+        suffix: SQL expression appended as the last part (the OEM name)
+        table_alias: Optional table alias to qualify the column names with
+
+    Returns:
+        SQL STRING expression
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    parts = [f"COALESCE(CAST({prefix}{column} AS STRING), '')" for column in columns] + [suffix]
+    return "CONCAT(" + ", '||', ".join(parts) + ")"
+
+
+def parse_date_sql(expression: str) -> str:
+    """
+    Build an expression parsing a YYYY-MM-DD, timestamp or MM/DD/YYYY value to DATE
+
+    Args:
+        expression: SQL expression of any type castable to STRING
+
+    Returns:
+        SQL DATE expression (NULL if the value is not a date)
+    """
+    text = f"CAST({expression} AS STRING)"
+    return (
+        f"COALESCE(SAFE_CAST({text} AS DATE), DATE(SAFE_CAST({text} AS TIMESTAMP)), "
+        f"SAFE.PARSE_DATE('%m/%d/%Y', {text}))"
+    )
+
+
+# Snapshot date column of the partitioned db_orders table (see
+# BigQueryLoader.write_orders_partition)
+ORDERS_SNAPSHOT_COLUMN = "snapshot_date"
+
+
+def db_comparison_sql(
+    table: str,
+    db_orders_table: str,
+    key_columns: Sequence[str],
+    manifest: Sequence[ComparisonField],
+    code_fields: Sequence[str],
+    oem: str,
+    changes_table: Optional[str] = None
+) -> str:
+    """
+    Build the query cross-verifying the field changes between two snapshot dates with db_orders
+
+    Changes are matched to the @db_orders_date partition of the db_orders
+    table on UniqueCode, the code of code_fields plus the OEM name
+    (orderNo||bodyCode||modelYear||oem for Ford, OEM name in lower case)
+    precomputed at load time. Only the OEM's rows and the columns the
+    manifest maps are read from db_orders. Its date columns are typed as
+    DATE, so a date field matches when the Ford value parses to the same
+    DATE.
+
+    Args:
+        table: Fully qualified table or view with the snapshots
+        db_orders_table: Fully qualified db_orders table, partitioned on snapshot_date
+        key_columns: Key columns to return with each change
+        manifest: Compared fields, in output order
+        code_fields: Snapshot fields making up the db_orders code
+        oem: OEM name as stored in db_orders.oem, lower case (e.g., "ford")
+        changes_table: Materialized changes table holding this date pair
+                       (default: compare the snapshots)
+
+    Returns:
+        SQL taking @old_date, @new_date and @db_orders_date (DATE); rows are
+        UniqueCode, key columns, Ford_Field_Name, DB_Orders_Field_Name,
+        Ford_Old_Value, Ford_New_Value, DB_Orders_Value, Sync_Status (MATCH,
+        MISMATCH or NO_MAPPING), old_date and new_date
+    """
+    mapped = [field for field in manifest if field.db_field]
+
+    keys = ",\n    ".join(key_columns)
+    mappings = "\n            ".join(
+        f"WHEN '{field.name}' THEN STRUCT('{field.db_field}' AS name, "
+        f"CAST(db.{field.db_field} AS STRING) AS value, '{field.compare}' AS compare_mode)"
+        for field in mapped
+    )
+    db_columns = ",\n        ".join(dict.fromkeys(["UniqueCode"] + [field.db_field for field in mapped]))
+    return f"""{_field_changes_sql(table, key_columns, [field.name for field in manifest], changes_table)},
+
+ford_changes_with_code AS (
+    SELECT
+        *,
+        {unique_code_sql(code_fields, f"'{oem}'")} AS UniqueCode
+    FROM field_changes
+),
+
+db_orders_data AS (
+    SELECT
+        {db_columns}
+    FROM `{db_orders_table}`
+    WHERE {ORDERS_SNAPSHOT_COLUMN} = @db_orders_date
+        AND LOWER(oem) = '{oem}'
+),
+
+-- Ford field -> db_orders column, value and compare mode (NULL: no mapping)
+field_mapping AS (
+    SELECT
+        fc.* EXCEPT (Field_Name, Old_Value, New_Value),
+        fc.Field_Name AS Ford_Field_Name,
+        fc.Old_Value AS Ford_Old_Value,
+        fc.New_Value AS Ford_New_Value,
+        CASE fc.Field_Name
+            {mappings}
+        END AS db_mapping
+    FROM ford_changes_with_code fc
+    LEFT JOIN db_orders_data db
+        ON fc.UniqueCode = db.UniqueCode
+),
+
+db_values AS (
+    SELECT
+        * EXCEPT (db_mapping),
+        db_mapping.name AS DB_Orders_Field_Name,
+        db_mapping.value AS DB_Orders_Value,
+        db_mapping.compare_mode AS Compare_Mode
+    FROM field_mapping
+)
+
+SELECT
+    UniqueCode,
+    {keys},
+    Ford_Field_Name,
+    DB_Orders_Field_Name,
+    Ford_Old_Value,
+    Ford_New_Value,
+    DB_Orders_Value,
+    CASE
+        WHEN DB_Orders_Value IS NULL THEN 'NO_MAPPING'
+        WHEN Compare_Mode = 'date'
+             AND {parse_date_sql('Ford_New_Value')} = SAFE_CAST(DB_Orders_Value AS DATE)
+        THEN 'MATCH'
+        WHEN COALESCE(Ford_New_Value, 'NULL') = COALESCE(DB_Orders_Value, 'NULL') THEN 'MATCH'
+        ELSE 'MISMATCH'
+    END AS Sync_Status,
+    CAST(@old_date AS STRING) AS old_date,
+    CAST(@new_date AS STRING) AS new_date
+FROM db_values
+ORDER BY {", ".join(code_fields)}, Ford_Field_Name
+"""
+
+
+def field_changes_refresh_sql(
+    changes_table: str,
+    loads_table: str,
+    table: str,
+    key_columns: Sequence[str],
+    manifest: Sequence[ComparisonField]
+) -> str:
+    """
+    Build the script materializing the field changes of one date pair
+
+    The changes from @old_date to @new_date replace the @new_date partition
+    of changes_table (partitioned by new_date), and the pair replaces any
+    earlier @new_date row of loads_table, with @source_table and the change
+    count, so a rerun leaves one row per new date. Readers use the
+    table only for a pair recorded there, since a pair without changes has no
+    rows in it.
+
+    Args:
+        changes_table: Fully qualified changes table (created if missing)
+        loads_table: Fully qualified table of materialized pairs (created if missing)
+        table: Fully qualified table or view with the snapshots
+        key_columns: Key columns to store with each change
+        manifest: Compared fields
+
+    Returns:
+        SQL script taking @old_date and @new_date (DATE) and @source_table
+        (STRING); its result is the change_count of the pair
+    """
+    keys = ",\n    ".join(key_columns)
+    changes = f"""{_field_changes_sql(table, key_columns, [field.name for field in manifest])}
+SELECT
+    {keys},
+    Field_Name,
+    Old_Value,
+    New_Value,
+    @old_date AS old_date,
+    @new_date AS new_date
+FROM field_changes"""
+    return f"""
+CREATE TABLE IF NOT EXISTS `{changes_table}`
+PARTITION BY new_date
+CLUSTER BY old_date, Field_Name
+AS
+SELECT * FROM (
+{changes}
+)
+WHERE FALSE;
+
+CREATE TABLE IF NOT EXISTS `{loads_table}` (
+    new_date DATE NOT NULL,
+    old_date DATE NOT NULL,
+    source_table STRING,
+    change_count INT64,
+    computed_at TIMESTAMP
+);
+
+BEGIN TRANSACTION;
+
+DELETE FROM `{changes_table}` WHERE new_date = @new_date;
+
+DELETE FROM `{loads_table}` WHERE new_date = @new_date;
+
+INSERT INTO `{changes_table}`
+{changes};
+
+INSERT INTO `{loads_table}` (new_date, old_date, source_table, change_count, computed_at)
+SELECT @new_date, @old_date, @source_table, COUNT(*), CURRENT_TIMESTAMP()
+FROM `{changes_table}`
+WHERE new_date = @new_date;
+
+COMMIT TRANSACTION;
+
+SELECT COUNT(*) AS change_count
+FROM `{changes_table}`
+WHERE new_date = @new_date;
+"""
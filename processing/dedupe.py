@@ -0,0 +1,76 @@
+"""
+Row dedupe - One row per composite key per report
+
+A daily OEM report can list the same order key more than once (repeated rows,
+orders sharing a blank VIN). In BigQuery every duplicate multiplies the rows of
+a key join between two dates, so comparisons cost more and report the same
+change several times. The processor keeps one row per _row_key (hash of the
+key columns) and reports the collisions of each file.
+
+Tie-break rules for the row kept:
+- "first": first row of the key in report order
+- "last": last row of the key in report order
+- "latest": row with the latest value of the processor's TIE_BREAK_COLUMN
+  (e.g. Last_Updated), the first of those on a tie
+"""
+
+from typing import Optional
+
+import pandas as pd
+
+TIE_BREAKS = ("first", "last", "latest")
+
+# Key column the rows are deduplicated on (see processing/row_hashes.py)
+KEY_COLUMN = "_row_key"
+
+
+def dedupe_rows(
+    df: pd.DataFrame,
+    tie_break: str = "first",
+    order_column: Optional[str] = None,
+    seen_keys: Optional[set] = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Keep one row per _row_key
+
+    Args:
+        df: Processed DataFrame with a _row_key column
+        tie_break: "first", "last" or "latest" (see module docstring)
+        order_column: Column compared by the "latest" rule
+        seen_keys: Keys kept from earlier chunks of the same report; rows
+                   with these keys are dropped and the set is updated
+                   (only with the "first" rule)
+
+    Returns:
+        Tuple of (deduplicated DataFrame in report order, every row of the
+        keys that collided, with a _kept column)
+    """
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"Unsupported tie-break '{tie_break}' (expected one of {TIE_BREAKS})")
+    if tie_break == "latest" and (order_column is None or order_column not in df.columns):
+        raise ValueError(f"Tie-break 'latest' needs an order column present in the report (got {order_column})")
+    if seen_keys is not None and tie_break != "first":
+        raise ValueError("Keys of earlier chunks can only be applied with the 'first' tie-break")
+
+    keys = df[KEY_COLUMN]
+    if tie_break == "latest":
+        # Latest value first (missing values last), report order among equals
+        ranked = df[order_column].sort_values(ascending=False, na_position="last", kind="stable")
+        kept = ~keys.loc[ranked.index].duplicated(keep="first")
+        kept = kept.reindex(df.index)
+    else:
+        kept = ~keys.duplicated(keep=tie_break)
+
+    if seen_keys is not None:
+        kept &= ~keys.isin(seen_keys)
+        seen_keys.update(keys[kept].tolist())
+
+    colliding = keys.duplicated(keep=False)
+    if seen_keys is not None:
+        colliding |= ~kept
+    collisions = df[colliding].copy()
+    collisions["_kept"] = kept[colliding]
+
+    if kept.all():
+        return df, collisions
+    return df[kept].reset_index(drop=True), collisions
@@ -0,0 +1,147 @@
+"""
+Delta loads - Upload only the rows of a daily report that changed since the previous date
+
+Most rows of a daily OEM report are identical to the previous day's. In delta
+mode the processor keeps the (_row_key, _content_hash) pairs of the last
+loaded snapshot locally and uploads only:
+- "new" rows: a version (_row_key, _content_hash) whose order was not in the
+  previous snapshot
+- "changed" rows: a new version of an order that was in the previous snapshot
+- "removed" rows: a previous version that is gone (an order that disappeared,
+  or the old version of a changed order). Only _row_key, _content_hash and
+  the source file metadata are set on these rows
+
+Versions are identified by _content_hash, which covers every report column:
+_row_hash only covers the compared fields, so a change to any other column
+would not produce a delta row.
+
+A version is valid from the date of its new/changed row until the date of its
+next removed row, so every loaded date can be reconstructed from the deltas
+(see BigQueryLoader.load_ford_oem_delta and the ford_oem_orders_delta_snapshots
+view).
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.config import SNAPSHOT_KEYS_DIR
+from processing.schema import METADATA_COLUMNS
+
+# Column holding new / changed / removed on delta rows
+CHANGE_TYPE_COLUMN = "_change_type"
+CHANGE_NEW = "new"
+CHANGE_CHANGED = "changed"
+CHANGE_REMOVED = "removed"
+
+# Columns identifying a row version
+VERSION_COLUMNS = ["_row_key", "_content_hash"]
+
+
+def snapshot_versions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get the distinct (_row_key, _content_hash) versions of a processed snapshot
+
+    Args:
+        df: Processed snapshot with row hash columns (int64, or text read from CSV)
+
+    Returns:
+        DataFrame with int64 _row_key and _content_hash columns
+    """
+    versions = df[VERSION_COLUMNS].astype("int64").drop_duplicates()
+    return versions.reset_index(drop=True)
+
+
+def compute_delta(df: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the delta rows between the previous snapshot's versions and a snapshot
+
+    Args:
+        df: Processed snapshot (output file contents, with metadata columns)
+        previous: Versions of the previous snapshot (see snapshot_versions()),
+                  empty if there is none
+
+    Returns:
+        New and changed rows of df followed by one removed row per dropped
+        version, with a _change_type column
+    """
+    current = df[VERSION_COLUMNS].astype("int64")
+    current_index = pd.MultiIndex.from_frame(current)
+    previous_index = pd.MultiIndex.from_frame(previous[VERSION_COLUMNS])
+
+    appeared = ~current_index.isin(previous_index)
+    delta = df[appeared].copy()
+    delta[CHANGE_TYPE_COLUMN] = CHANGE_NEW
+    delta.loc[current["_row_key"][appeared].isin(previous["_row_key"]).to_numpy(), CHANGE_TYPE_COLUMN] = CHANGE_CHANGED
+
+    removed = previous[~previous_index.isin(current_index)]
+    if removed.empty:
+        return delta.reset_index(drop=True)
+
+    # All-null rows with df's dtypes, then the version and source file metadata
+    removed_rows = df.iloc[:0].reindex(range(len(removed)))
+    for column in VERSION_COLUMNS:
+        removed_rows[column] = pd.Series(removed[column].to_numpy()).astype(df[column].dtype)
+    # Removed rows belong to this snapshot's date and file
+    for spec in METADATA_COLUMNS:
+        if spec.name in df.columns and len(df):
+            removed_rows[spec.name] = df[spec.name].iloc[[0] * len(removed)].reset_index(drop=True)
+    removed_rows[CHANGE_TYPE_COLUMN] = CHANGE_REMOVED
+    return pd.concat([delta, removed_rows], ignore_index=True)
+
+
+class SnapshotKeyCache:
+    """Local Parquet files of the row versions of loaded snapshots, per OEM and date"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize snapshot key cache
+
+        Args:
+            directory: Cache directory. Defaults to config SNAPSHOT_KEYS_DIR
+        """
+        self.directory = Path(directory or SNAPSHOT_KEYS_DIR)
+
+    def _path(self, oem_name: str, snapshot_date: str) -> Path:
+        """Get the cache file of a snapshot (date in YYYY-MM-DD format)"""
+        return self.directory / f"{oem_name.lower()}_{snapshot_date.replace('-', '')}.parquet"
+
+    def load(self, oem_name: str, snapshot_date: str) -> Optional[pd.DataFrame]:
+        """
+        Load the versions of a snapshot
+
+        Args:
+            oem_name: OEM name (e.g., "Ford")
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+
+        Returns:
+            DataFrame with _row_key and _content_hash, or None if not cached
+            (or cached with other version columns by an older version)
+        """
+        path = self._path(oem_name, snapshot_date)
+        if not path.exists():
+            return None
+        versions = pd.read_parquet(path)
+        if list(versions.columns) != VERSION_COLUMNS:
+            return None
+        return versions
+
+    def save(self, oem_name: str, snapshot_date: str, versions: pd.DataFrame):
+        """
+        Save the versions of a loaded snapshot, replacing older snapshots of the OEM
+
+        Args:
+            oem_name: OEM name
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+            versions: DataFrame with _row_key and _content_hash
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(oem_name, snapshot_date)
+        versions[VERSION_COLUMNS].to_parquet(path, index=False)
+        # Only the latest loaded snapshot is a delta baseline
+        for old_path in self.directory.glob(f"{oem_name.lower()}_*.parquet"):
+            if old_path.name < path.name:
+                old_path.unlink()
@@ -0,0 +1,145 @@
+"""
+Snapshot diff - Local field-level comparison of two OEM report snapshots
+
+Produces the same Order_Number / Body_Code / Model_Year / Customer_Name / VIN /
+Field_Name / Old_Value / New_Value rows as
+backend/queries/ford_orders_field_comparison_parameterized.sql, without
+loading anything into BigQuery:
+
+- Rows are matched on the composite key (NULL keys match '', as in the query),
+  via one integer join instead of per-row string comparisons
+- All compared fields are checked in a single pass with a 2-D inequality mask
+- Like the query's _row_hash filter, a row pair is only reported if its fields
+  differ with NULL treated as ''; within such a pair, a field differs if its
+  values differ with NULL treated as the string 'NULL'
+
+Snapshots can be processor output files (.csv, .csv.gz, .parquet) or Excel
+reports, which go through the processor pipeline first.
+"""
+
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.row_hashes import canonical_strings
+
+
+def load_snapshot(path: Path, processor) -> pd.DataFrame:
+    """
+    Load a snapshot file as a processed DataFrame
+
+    CSV files are read as text. Output files and Excel reports all hold the
+    raw values (the CSV reader un-escapes the quotes the writer doubled), so
+    all formats of the same report compare equal. CSV written with
+    processor.escape_quotes holds pre-doubled quotes, which are un-doubled.
+
+    Args:
+        path: .csv, .csv.gz, .parquet, .xlsx or .xls file
+        processor: OEM processor used for Excel reports
+
+    Returns:
+        DataFrame with sanitized column names
+    """
+    path = Path(path)
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+
+    if suffixes[-1:] == [".parquet"]:
+        return pd.read_parquet(path)
+    if suffixes[-1:] == [".csv"] or suffixes[-2:] == [".csv", ".gz"]:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+        if processor.escape_quotes:
+            for column in df.columns:
+                has_quote = df[column].str.contains('""', regex=False, na=False)
+                if has_quote.any():
+                    df.loc[has_quote, column] = df.loc[has_quote, column].str.replace('""', '"', regex=False)
+        return df
+    if suffixes[-1:] in ([".xlsx"], [".xls"]):
+        df = processor.sanitize_dataframe_columns(processor.read_excel_file(path))
+        return processor.process_dataframe(processor.apply_schema(df))
+    raise ValueError(f"Unsupported snapshot file type: {path.name}")
+
+
+def _text_matrix(df: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+    """
+    Render columns as a 2-D object array of strings (None for NULL)
+
+    Columns missing from df are all NULL, like a table column a report lacks.
+    """
+    matrix = np.full((len(df), len(columns)), None, dtype=object)
+    for position, column in enumerate(columns):
+        if column in df.columns:
+            values = canonical_strings(df[column], missing=None).to_numpy()
+            # where() may leave NaN instead of None for missing cells
+            matrix[:, position] = np.where(pd.isna(values), None, values)
+    return matrix
+
+
+def _key_codes(old_keys: np.ndarray, new_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Map the composite keys of both snapshots to shared integer codes"""
+    def joined(keys: np.ndarray) -> pd.Series:
+        parts = [pd.Series(keys[:, position]).fillna("") for position in range(keys.shape[1])]
+        return parts[0].str.cat(parts[1:], sep="\x1f") if len(parts) > 1 else parts[0]
+
+    codes, _ = pd.factorize(pd.concat([joined(old_keys), joined(new_keys)], ignore_index=True))
+    return codes[:len(old_keys)], codes[len(old_keys):]
+
+
+def diff_snapshots(
+    old_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    key_columns: Sequence[str],
+    fields: Sequence[str]
+) -> pd.DataFrame:
+    """
+    Compare two processed snapshots field by field
+
+    Args:
+        old_df: Older snapshot
+        new_df: Newer snapshot
+        key_columns: Composite key matching rows across snapshots
+        fields: Fields to compare, in output order
+
+    Returns:
+        DataFrame with the key columns, Field_Name, Old_Value and New_Value,
+        one row per changed field, sorted like the comparison query (key
+        columns, then Field_Name)
+    """
+    key_columns = list(key_columns)
+    fields = list(fields)
+
+    old_keys = _text_matrix(old_df, key_columns)
+    new_keys = _text_matrix(new_df, key_columns)
+    old_codes, new_codes = _key_codes(old_keys, new_keys)
+
+    # Every (old row, new row) pair sharing a key, like the query's inner join
+    pairs = pd.merge(
+        pd.DataFrame({"code": old_codes, "old_row": np.arange(len(old_codes))}),
+        pd.DataFrame({"code": new_codes, "new_row": np.arange(len(new_codes))}),
+        on="code"
+    )
+    old_rows = pairs["old_row"].to_numpy()
+    new_rows = pairs["new_row"].to_numpy()
+
+    old_values = _text_matrix(old_df, fields)[old_rows]
+    new_values = _text_matrix(new_df, fields)[new_rows]
+
+    # Pairs whose fields only differ by NULL vs '' are skipped (_row_hash filter)
+    old_missing = pd.isna(old_values)
+    new_missing = pd.isna(new_values)
+    changed_pairs = (np.where(old_missing, "", old_values) != np.where(new_missing, "", new_values)).any(axis=1)
+
+    # Field-level changes, NULL compared as 'NULL' like the query's CASE
+    changed = np.where(old_missing, "NULL", old_values) != np.where(new_missing, "NULL", new_values)
+    changed &= changed_pairs[:, None]
+
+    pair_index, field_index = np.nonzero(changed)
+    result = pd.DataFrame(old_keys[old_rows[pair_index]], columns=key_columns)
+    result["Field_Name"] = np.asarray(fields, dtype=object)[field_index]
+    result["Old_Value"] = old_values[pair_index, field_index]
+    result["New_Value"] = new_values[pair_index, field_index]
+
+    return result.sort_values(key_columns + ["Field_Name"], na_position="first", kind="stable").reset_index(drop=True)
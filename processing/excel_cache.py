@@ -0,0 +1,166 @@
+"""
+Excel cache - Content-addressed Parquet cache of parsed Excel reports
+
+Parsing a Ford Dealer Report with openpyxl takes seconds, while reading the
+same data back from Parquet takes milliseconds. Parsed DataFrames are stored
+under the SHA-256 of the source file's content, so a re-downloaded or renamed
+copy of the same report is still a cache hit, and a changed report never is.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.config import EXCEL_CACHE_DIR, EXCEL_CACHE_MAX_MB
+
+# Bump when the way Excel files are parsed changes, so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_file_content(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's content
+
+    Args:
+        file_path: Path to file
+        block_size: Bytes read per iteration
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExcelCache:
+    """Parquet cache of raw parsed Excel DataFrames with size-based LRU eviction"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: Optional[float] = None):
+        """
+        Initialize Excel cache
+
+        Args:
+            cache_dir: Directory for cached Parquet files. Defaults to config EXCEL_CACHE_DIR
+            max_size_mb: Maximum total cache size in MB. Defaults to config EXCEL_CACHE_MAX_MB
+        """
+        self.cache_dir = Path(cache_dir or EXCEL_CACHE_DIR)
+        self.max_size_bytes = int((max_size_mb if max_size_mb is not None else EXCEL_CACHE_MAX_MB) * 1024 * 1024)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, content_hash: str, variant: Optional[str] = None) -> Path:
+        """Get the cache file path for a content hash (and optional read variant)"""
+        suffix = f"_{variant}" if variant else ""
+        return self.cache_dir / f"v{CACHE_FORMAT_VERSION}_{content_hash}{suffix}.parquet"
+
+    def get(
+        self,
+        excel_file: Path,
+        content_hash: Optional[str] = None,
+        variant: Optional[str] = None,
+        arrow: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get the parsed DataFrame for an Excel file if it is cached
+
+        Args:
+            excel_file: Path to Excel file
+            content_hash: Precomputed content hash (computed if not provided)
+            variant: Identifies how the file was read (e.g. a column projection)
+            arrow: Return Arrow-backed columns instead of NumPy-backed ones
+
+        Returns:
+            Cached DataFrame, or None on a cache miss
+        """
+        entry = self._entry_path(content_hash or hash_file_content(excel_file), variant)
+        if not entry.exists():
+            return None
+
+        try:
+            if arrow:
+                # Arrow-backed columns straight from the Parquet file, no NumPy copy
+                df = pd.read_parquet(entry, dtype_backend="pyarrow")
+            else:
+                df = pd.read_parquet(entry)
+        except Exception as e:
+            # Corrupt or unreadable entry - drop it and re-parse the Excel file
+            print(f"⚠ Warning: Could not read cache entry {entry.name}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for LRU eviction
+        os.utime(entry)
+        return df
+
+    def put(
+        self,
+        excel_file: Path,
+        df: pd.DataFrame,
+        content_hash: Optional[str] = None,
+        variant: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Store the parsed DataFrame for an Excel file
+
+        Args:
+            excel_file: Path to Excel file
+            df: Raw parsed DataFrame (before any processing)
+            content_hash: Precomputed content hash (computed if not provided)
+            variant: Identifies how the file was read (e.g. a column projection)
+
+        Returns:
+            Path to the cache entry, or None if it could not be written
+        """
+        entry = self._entry_path(content_hash or hash_file_content(excel_file), variant)
+        tmp_entry = entry.with_suffix('.parquet.tmp')
+
+        try:
+            df.to_parquet(tmp_entry, index=False)
+            os.replace(tmp_entry, entry)
+        except Exception as e:
+            # Caching is an optimization - never fail the conversion because of it
+            print(f"⚠ Warning: Could not write cache entry for {excel_file.name}: {e}")
+            tmp_entry.unlink(missing_ok=True)
+            return None
+
+        self.evict()
+        return entry
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_size_mb
+
+        Returns:
+            Number of entries removed
+        """
+        # Stat once up front; entries may be removed concurrently by other
+        # processes sharing the cache (e.g. parallel conversion workers)
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(key=lambda entry: entry[0])
+        total_size = sum(size for _, size, _ in entries)
+
+        removed = 0
+        while entries and total_size > self.max_size_bytes:
+            _, size, oldest = entries.pop(0)
+            total_size -= size
+            oldest.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove all cache entries"""
+        for entry in self.cache_dir.glob("*.parquet"):
+            entry.unlink(missing_ok=True)
@@ -0,0 +1,193 @@
+"""
+Load job tracking - Submit BigQuery jobs now, collect their results later
+
+The loader methods wait on every job with result(timeout=...), so a run
+spends the whole load time of each file before converting the next one.
+Jobs submitted to a LoadJobTracker are not waited on: one thread (or one
+asyncio task) polls all of them and turns each finished job into a
+completion event, while the caller keeps converting.
+
+A completion event is a dictionary with:
+- label: What was loaded (e.g. the output filename)
+- job_id: BigQuery job ID
+- state: "done" or "failed"
+- rows: Rows written by the job (output_rows), None if it failed
+- error: Error message of a failed job, None otherwise
+- seconds: Time from submission to the poll that saw the job finish
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+
+
+class LoadJobHandle:
+    """A submitted job and the callback to run when it finishes"""
+    
+    def __init__(self, label: str, job, on_done: Optional[Callable[[dict], None]] = None):
+        """
+        Initialize a job handle
+        
+        Args:
+            label: What the job loads (e.g. the output filename)
+            job: Submitted BigQuery job (LoadJob, QueryJob, ...)
+            on_done: Called with the completion event once the job finishes
+        """
+        self.label = label
+        self.job = job
+        self.on_done = on_done
+        self.submitted_at = time.perf_counter()
+        self.event = None
+    
+    @property
+    def job_id(self) -> str:
+        """BigQuery job ID"""
+        return self.job.job_id
+    
+    def done(self) -> bool:
+        """Check (with one API call) whether the job has finished"""
+        return self.job.done()
+    
+    def completion_event(self) -> dict:
+        """Build the completion event of a finished job"""
+        error = self.job.error_result
+        return {
+            "label": self.label,
+            "job_id": self.job.job_id,
+            "state": STATE_FAILED if error else STATE_DONE,
+            "rows": None if error else self.job.output_rows,
+            "error": error.get("message", str(error)) if error else None,
+            "seconds": time.perf_counter() - self.submitted_at,
+        }
+
+
+class LoadJobTracker:
+    """Jobs submitted without waiting, polled together from a single thread"""
+    
+    def __init__(self, ordered: bool = False):
+        """
+        Initialize load job tracker
+        
+        Args:
+            ordered: Release completion events in submission order. A job
+                     finishing early is held until the jobs submitted before
+                     it have finished, so callbacks that depend on earlier
+                     dates (e.g. Ford field changes) see them loaded
+        """
+        self.ordered = ordered
+        self.pending: list[LoadJobHandle] = []
+    
+    def submit(self, label: str, job, on_done: Optional[Callable[[dict], None]] = None) -> LoadJobHandle:
+        """
+        Track a submitted job
+        
+        Args:
+            label: What the job loads (e.g. the output filename)
+            job: Submitted BigQuery job (not waited on)
+            on_done: Called with the completion event once the job finishes
+                     (exceptions are reported and don't stop the tracker)
+        
+        Returns:
+            Handle of the job
+        """
+        handle = LoadJobHandle(label, job, on_done)
+        self.pending.append(handle)
+        return handle
+    
+    def __len__(self) -> int:
+        """Number of jobs not reported yet"""
+        return len(self.pending)
+    
+    def poll(self) -> list[dict]:
+        """
+        Check every pending job once, without waiting
+        
+        Returns:
+            Completion events of the jobs that finished since the last poll
+        """
+        events = []
+        for handle in list(self.pending):
+            if not handle.done():
+                if self.ordered:
+                    break
+                continue
+            handle.event = handle.completion_event()
+            self.pending.remove(handle)
+            if handle.on_done:
+                try:
+                    handle.on_done(handle.event)
+                except Exception as e:
+                    print(f"⚠ Follow-up of {handle.label} failed: {e}")
+            events.append(handle.event)
+        return events
+    
+    def as_completed(self, timeout: Optional[float] = None, interval: float = 2.0) -> Iterator[dict]:
+        """
+        Yield completion events until every pending job has finished
+        
+        Args:
+            timeout: Seconds to wait for all jobs (default: no limit)
+            interval: Seconds between polls
+        
+        Yields:
+            Completion events, as the jobs finish
+        
+        Raises:
+            TimeoutError: If jobs are still running after timeout seconds
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.pending:
+            yield from self.poll()
+            if not self.pending:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                raise TimeoutError(f"{len(self.pending)} load job(s) still running after {timeout}s")
+            time.sleep(interval)
+    
+    async def as_completed_async(self, timeout: Optional[float] = None, interval: float = 2.0):
+        """
+        Async version of as_completed() for an asyncio task
+        
+        Polls run in a worker thread (each poll makes blocking API calls), so
+        the event loop stays free while jobs run.
+        
+        Args:
+            timeout: Seconds to wait for all jobs (default: no limit)
+            interval: Seconds between polls
+        
+        Yields:
+            Completion events, as the jobs finish
+        
+        Raises:
+            TimeoutError: If jobs are still running after timeout seconds
+        """
+        import asyncio
+        
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.pending:
+            for event in await asyncio.to_thread(self.poll):
+                yield event
+            if not self.pending:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                raise TimeoutError(f"{len(self.pending)} load job(s) still running after {timeout}s")
+            await asyncio.sleep(interval)
+
+
+def print_load_event(event: dict):
+    """
+    Print a completion event as a log line
+    
+    Args:
+        event: Completion event from LoadJobTracker
+    """
+    if event["state"] == STATE_DONE:
+        print(f"✓ Load job finished: {event['label']} ({event['rows']} rows, {event['seconds']:.1f}s, job {event['job_id']})")
+    else:
+        print(f"✗ Load job failed: {event['label']}: {event['error']} (job {event['job_id']})")
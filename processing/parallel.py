@@ -0,0 +1,133 @@
+"""
+Parallel conversion - Convert several OEM Excel files in a process pool
+
+Each file is converted in its own worker process (one CPU core per file).
+Workers only read Excel and write local output files; GCS upload and
+BigQuery load are left to the parent process, so cloud calls happen from a
+single place after all conversions finish.
+"""
+
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _convert_file_worker(
+    oem_name: str,
+    excel_file: Path,
+    input_dir: Optional[Path],
+    output_dir: Optional[Path],
+    settings: dict,
+    options: dict
+) -> dict:
+    """
+    Convert one Excel file without uploading (runs in a worker process)
+    
+    Output is captured instead of printed, so logs from concurrent workers
+    don't interleave. convert_excel_to_csv() exits on errors, so SystemExit is
+    turned into a per-file error result rather than killing the worker.
+    
+    Args:
+        oem_name: Key in OEM_PROCESSORS
+        excel_file: Path to Excel file
+        input_dir: Processor input directory
+        output_dir: Processor output directory
+        settings: Processor attributes to set (e.g. use_excel_cache)
+        options: Extra convert_excel_to_csv() keyword arguments
+    
+    Returns:
+        Result dictionary with file, output, snapshot, error, seconds and log
+    """
+    from processing.processors import OEM_PROCESSORS
+    
+    start = time.perf_counter()
+    log = io.StringIO()
+    output = None
+    snapshot = None
+    error = None
+    try:
+        with redirect_stdout(log):
+            processor = OEM_PROCESSORS[oem_name](input_dir=input_dir, output_dir=output_dir)
+            for name, value in settings.items():
+                setattr(processor, name, value)
+            output = processor.convert_excel_to_csv(
+                excel_file=excel_file,
+                upload_to_gcs_flag=False,
+                **options
+            )
+            snapshot = processor.last_snapshot
+    except SystemExit:
+        error = "Conversion failed (see log)"
+    except Exception as e:
+        error = str(e)
+    
+    return {
+        "file": Path(excel_file),
+        "output": output,
+        "snapshot": snapshot,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "log": log.getvalue(),
+    }
+
+
+def convert_files_parallel(
+    oem_name: str,
+    excel_files: list[Path],
+    jobs: int,
+    input_dir: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+    settings: Optional[dict] = None,
+    options: Optional[dict] = None
+) -> list[dict]:
+    """
+    Convert Excel files concurrently, one worker process per file
+    
+    Args:
+        oem_name: Key in OEM_PROCESSORS
+        excel_files: Excel files to convert
+        jobs: Maximum number of worker processes
+        input_dir: Processor input directory
+        output_dir: Processor output directory
+        settings: Processor attributes to set in each worker
+        options: Extra convert_excel_to_csv() keyword arguments
+    
+    Returns:
+        List of result dictionaries (see _convert_file_worker), in input order
+    """
+    settings = settings or {}
+    options = options or {}
+    workers = max(1, min(jobs, len(excel_files)))
+    
+    print(f"ℹ Converting {len(excel_files)} file(s) with {workers} worker process(es)")
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _convert_file_worker, oem_name, Path(excel_file), input_dir, output_dir, settings, options
+            ): Path(excel_file)
+            for excel_file in excel_files
+        }
+        for future in as_completed(futures):
+            excel_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker process died (e.g. out of memory)
+                result = {
+                    "file": excel_file, "output": None, "snapshot": None, "error": str(e), "seconds": 0.0, "log": ""
+                }
+            results[excel_file] = result
+            
+            if result["error"]:
+                print(f"  ✗ {excel_file.name}: {result['error']} ({result['seconds']:.1f}s)")
+            else:
+                print(f"  ✓ {excel_file.name} → {result['output'].name} ({result['seconds']:.1f}s)")
+    
+    return [results[Path(excel_file)] for excel_file in excel_files]
@@ -2,25 +2,73 @@
 Base OEM processor class - Common functionality for all OEM processors
 """
 
+import csv
 import glob
+import gzip
 import os
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from shared.config import INPUT_DIR, OUTPUT_DIR
-from processing.utils import upload_to_gcs, get_timestamp_string, get_file_size_mb, sanitize_column_name
+from shared.config import (
+    INPUT_DIR, OUTPUT_DIR, EXCEL_CHUNK_SIZE, EXCEL_CACHE_ENABLED, ARROW_STRINGS_ENABLED, FORD_LOAD_MODE,
+    ROW_KEY_TIE_BREAK, FORD_STORAGE_WRITE_MODE
+)
+from processing.utils import (
+    upload_to_gcs, get_timestamp_string, get_file_size_mb, get_gzip_uncompressed_size,
+    sanitize_column_name, read_csv_header
+)
+from processing.schema import OEMSchema, METADATA_COLUMNS, DERIVED_COLUMNS
+from processing.row_hashes import hash_columns, content_hash
+from processing.dedupe import TIE_BREAKS, dedupe_rows
+from processing.snapshots import SnapshotRegistry, fingerprint_rows, row_hashes
+
+# Supported output file formats (file extension without the dot)
+OUTPUT_FORMATS = ("csv", "parquet")
+# Supported compression for CSV output
+COMPRESSIONS = ("gzip",)
+# Supported ways of loading Ford reports to BigQuery (see upload_output)
+LOAD_MODES = ("append", "replace", "history", "delta", "storage-write")
+
+
+def _convert_excel_cell(value):
+    """
+    Convert an openpyxl cell value the same way pandas.read_excel does
+    
+    Empty cells become "" (treated as NaN by the parser) and whole-number
+    floats become ints, so "2026.0" is read as "2026".
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
 
 
 class BaseOEMProcessor(ABC):
     """Base class for all OEM processors"""
     
+    # Declarative ingestion schema (see processing/schema.py). The default only
+    # types the metadata columns; report columns stay strings
+    SCHEMA = OEMSchema([])
+    
+    # Columns hashed into _row_key (identify an order across snapshots) and
+    # _row_hash (compared between snapshots). Empty key / None hash columns
+    # mean every report column, in file order
+    ROW_KEY_COLUMNS: tuple = ()
+    ROW_HASH_COLUMNS: Optional[tuple] = None
+    # Column whose latest value wins the "latest" tie-break between rows
+    # sharing a ROW_KEY_COLUMNS key (see dedupe_key_collisions)
+    TIE_BREAK_COLUMN: Optional[str] = None
+    
     def __init__(
         self,
         oem_name: str,
@@ -43,6 +91,40 @@ class BaseOEMProcessor(ABC):
         self.output_dir = output_dir or OUTPUT_DIR
         self.input_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Serve repeat reads of the same report from the Parquet cache
+        self.use_excel_cache = EXCEL_CACHE_ENABLED
+        self._excel_cache = None
+        # Pre-double quotes in CSV values (clean_dataframe_values), as outputs
+        # written before the CSV writer did the escaping. Such files can't be
+        # loaded to BigQuery, which stores the raw quotes; by default the
+        # writer escapes quotes and the cleaning pass is skipped
+        self.escape_quotes = False
+        # Hold strings in Arrow-backed columns (dictionary-encoded where the
+        # schema says so) from read through write
+        self.arrow_strings = ARROW_STRINGS_ENABLED
+        # Record an alias instead of reloading a report whose rows match the
+        # previous loaded date (see processing/snapshots.py)
+        self.skip_unchanged = False
+        # Date, row-set fingerprint and row count of the last converted report
+        self.last_snapshot = None
+        # Ford BigQuery load: "append" to ford_oem_orders, merge into "history",
+        # or upload only the "delta" rows
+        self.load_mode = FORD_LOAD_MODE
+        # "storage-write" loads: stream type, and the writer (None = StorageWriter;
+        # a processing.storage_writer.FakeStorageWriter keeps the rows in memory)
+        self.storage_write_mode = FORD_STORAGE_WRITE_MODE
+        self.storage_writer = None
+        # Row kept when a ROW_KEY_COLUMNS key repeats in a report: "first",
+        # "last" or "latest" (by TIE_BREAK_COLUMN)
+        self.tie_break = ROW_KEY_TIE_BREAK
+        # Duplicate keys and dropped rows of the last converted report
+        self.last_key_collisions = None
+        # processing.load_jobs.LoadJobTracker: when set, Ford append / replace
+        # loads are submitted to it instead of waited on (see submits_loads)
+        self.load_jobs = None
+        # Result of the last Storage Write API write done during conversion
+        # (None if the frame was not written there)
+        self.last_storage_write = None
     
     def find_excel_files(self) -> list[Path]:
         """
@@ -72,13 +154,84 @@ class BaseOEMProcessor(ABC):
         """
         Read Excel file into DataFrame
         
+        When use_excel_cache is enabled, the raw parsed DataFrame is cached as
+        Parquet keyed on the file's content hash, so reprocessing the same
+        report skips the openpyxl parse entirely.
+        
+        Columns the schema drops are excluded with usecols, so they are never
+        materialized.
+        
         Args:
             excel_file: Path to Excel file
             
         Returns:
             DataFrame with data
         """
-        return pd.read_excel(excel_file, dtype=str)
+        dropped = self.SCHEMA.dropped_columns()
+        usecols = None
+        if dropped:
+            usecols = lambda header: self.SCHEMA.is_kept(sanitize_column_name(str(header)))
+        
+        string_dtype = pd.StringDtype("pyarrow") if self.arrow_strings else str
+        if not self.use_excel_cache:
+            return pd.read_excel(excel_file, dtype=string_dtype, usecols=usecols)
+        
+        from processing.excel_cache import ExcelCache, hash_file_content
+        if self._excel_cache is None:
+            self._excel_cache = ExcelCache()
+        
+        # Projected reads are cached separately from full reads
+        variant = None
+        if dropped:
+            import hashlib
+            variant = "drop" + hashlib.sha256(",".join(sorted(dropped)).encode()).hexdigest()[:8]
+        
+        content_hash = hash_file_content(excel_file)
+        df = self._excel_cache.get(excel_file, content_hash, variant, arrow=self.arrow_strings)
+        if df is not None:
+            print(f"ℹ Loaded parsed report from cache (sha256 {content_hash[:12]})")
+            return df
+        
+        df = pd.read_excel(excel_file, dtype=string_dtype, usecols=usecols)
+        self._excel_cache.put(excel_file, df, content_hash, variant)
+        return df
+    
+    def read_excel_chunks(self, excel_file: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Read Excel file in fixed-size row chunks using openpyxl's read-only mode
+        
+        Rows are streamed from the worksheet XML instead of building the whole
+        sheet in memory. Each chunk is parsed the same way as read_excel_file
+        (all values as strings, same NA handling), so downstream steps behave
+        identically in both modes.
+        
+        Args:
+            excel_file: Path to Excel file
+            chunk_size: Number of data rows per chunk
+        
+        Yields:
+            DataFrame chunks with the original (unsanitized) column names
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = list(header)
+            
+            batch = []
+            for row in rows:
+                batch.append([_convert_excel_cell(value) for value in row])
+                if len(batch) >= chunk_size:
+                    yield TextParser([header] + batch, header=0, dtype=str).read()
+                    batch = []
+            if batch:
+                yield TextParser([header] + batch, header=0, dtype=str).read()
+        finally:
+            workbook.close()
     
     def sanitize_dataframe_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -112,20 +265,91 @@ class BaseOEMProcessor(ABC):
         df.columns = new_columns
         return df
     
-    def clean_dataframe_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def clean_dataframe_values(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Clean data values (escape quotes, etc.)
         
+        Only used by write_output() for CSV files when escape_quotes is set:
+        by default the frame keeps the raw values, which Parquet output and
+        the Storage Write API store as-is, and the QUOTE_ALL / QUOTE_MINIMAL
+        CSV writer doubles embedded quotes itself.
+        
+        Works column by column: only object/string columns are inspected, columns
+        without a double quote are left untouched, and only the cells that contain
+        one are rewritten. Non-string values are preserved as-is.
+        
         Args:
             df: DataFrame to clean
+            inplace: Modify df directly instead of returning an updated copy
             
         Returns:
             Cleaned DataFrame
         """
-        # Replace problematic characters in data (double quotes)
-        df = df.map(lambda x: x.replace('"', '""') if isinstance(x, str) else x)
+        if not inplace:
+            # Shallow copy - only the columns that change get new data
+            df = df.copy(deep=False)
+        
+        for column in df.columns[[self._is_text_dtype(dtype) for dtype in df.dtypes]]:
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Dictionary-encoded column: escape the (few) categories, not every cell
+                categories = series.cat.categories
+                if categories.str.contains('"', regex=False).any():
+                    df[column] = series.cat.rename_categories(categories.str.replace('"', '""', regex=False))
+                continue
+            try:
+                # NaN for non-string cells in object columns, treated as no quote
+                has_quote = series.str.contains('"', regex=False, na=False)
+            except AttributeError:
+                # Object column without any string values
+                continue
+            if not has_quote.any():
+                continue
+            
+            # Replace problematic characters in data (double quotes)
+            escaped = series.astype(object)
+            escaped[has_quote] = series[has_quote].str.replace('"', '""', regex=False)
+            df[column] = escaped.astype(series.dtype)
         return df
     
+    @staticmethod
+    def _is_text_dtype(dtype) -> bool:
+        """Check whether a column dtype can hold Python strings"""
+        if isinstance(dtype, pd.CategoricalDtype):
+            return BaseOEMProcessor._is_text_dtype(dtype.categories.dtype)
+        if isinstance(dtype, pd.ArrowDtype):
+            import pyarrow as pa
+            return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+        return dtype == object or isinstance(dtype, pd.StringDtype)
+    
+    def apply_schema(self, df: pd.DataFrame, warn_unknown: bool = True) -> pd.DataFrame:
+        """
+        Apply the processor's SCHEMA: drop unkept columns and convert dtypes
+        
+        Runs right after column sanitization, so process_dataframe() sees typed
+        columns (datetime64 dates, Int64 integers) rather than strings.
+        
+        Args:
+            df: DataFrame with sanitized column names
+            warn_unknown: Warn about columns not declared in the schema
+            
+        Returns:
+            Typed DataFrame
+        """
+        return self.SCHEMA.apply(df, warn_unknown=warn_unknown, arrow_strings=self.arrow_strings)
+    
+    def get_bigquery_schema(self, columns: list[str]) -> list:
+        """
+        Get an explicit BigQuery schema for output columns from the SCHEMA
+        
+        Args:
+            columns: Output column names, in file order
+            
+        Returns:
+            List of bigquery.SchemaField
+        """
+        return self.SCHEMA.bigquery_schema(columns)
+    
     @abstractmethod
     def process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -142,10 +366,1002 @@ class BaseOEMProcessor(ABC):
         """
         pass
     
+    
+    def get_source_file_date(self, excel_file: Path, date_from_file: Optional[str]) -> str:
+        """
+        Determine the sheet date (YYYY-MM-DD) applied to every row as _source_file_date
+        
+        IMPORTANT: This uses the date from the SOURCE FILE (sheet name), NOT today's date
+        
+        Args:
+            excel_file: Path to the source Excel file
+            date_from_file: Date extracted by extract_date_from_filename() (YYYYMMDD), if any
+            
+        Returns:
+            Date string in YYYY-MM-DD format
+        """
+        from datetime import datetime
+        import re
+        
+        if date_from_file:
+            # Convert YYYYMMDD to YYYY-MM-DD format for better readability
+            return f"{date_from_file[:4]}-{date_from_file[4:6]}-{date_from_file[6:8]}"
+        
+        # Fallback: Try to extract from filename using alternative patterns
+        patterns = [
+            r'(\d{4})(\d{2})(\d{2})',  # YYYYMMDD
+            r'(\d{2})/(\d{2})/(\d{4})',  # MM/DD/YYYY
+            r'(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD
+        ]
+        
+        for pattern in patterns:
+            match = re.search(pattern, excel_file.name)
+            if match:
+                if pattern == r'(\d{4})(\d{2})(\d{2})':
+                    # YYYYMMDD
+                    year, month, day = match.groups()
+                    return f"{year}-{month}-{day}"
+                elif pattern == r'(\d{2})/(\d{2})/(\d{4})':
+                    # MM/DD/YYYY
+                    month, day, year = match.groups()
+                    return f"{year}-{month}-{day}"
+                else:
+                    # YYYY-MM-DD
+                    return match.group(0)
+        
+        # Last resort: use file modification date
+        try:
+            file_date = datetime.fromtimestamp(os.path.getmtime(excel_file))
+            source_date = file_date.strftime("%Y-%m-%d")
+            print(f"⚠ Could not extract date from filename, using file modification date: {source_date}")
+        except OSError:
+            # Final fallback: today's date (but this shouldn't happen)
+            source_date = datetime.now().strftime("%Y-%m-%d")
+            print(f"⚠ Could not extract date, using today's date: {source_date}")
+        return source_date
+    
+    def get_source_metadata(self, excel_file: Path, date_from_file: Optional[str]) -> dict:
+        """
+        Build the metadata columns added to every row for BigQuery tracking
+        
+        Args:
+            excel_file: Path to the source Excel file
+            date_from_file: Date extracted by extract_date_from_filename() (YYYYMMDD), if any
+            
+        Returns:
+            Dictionary of column name -> value
+        """
+        from datetime import datetime
+        
+        # Add file creation timestamp (when the source file was created)
+        try:
+            # Get file creation time (ctime) or modification time (mtime) as fallback
+            file_created_time = os.path.getctime(excel_file)
+            file_created_timestamp = datetime.fromtimestamp(file_created_time).isoformat()
+        except (OSError, ValueError):
+            # If can't get file time, use current time as fallback
+            file_created_timestamp = datetime.now().isoformat()
+        
+        return {
+            # Source filename (which file this data came from)
+            '_source_filename': excel_file.name,
+            '_source_file_created_timestamp': file_created_timestamp,
+            # Sheet date from filename - each order gets this
+            '_source_file_date': self.get_source_file_date(excel_file, date_from_file),
+        }
+    
+    def add_metadata_columns(self, df: pd.DataFrame, metadata: dict) -> pd.DataFrame:
+        """
+        Add metadata columns to every row of the DataFrame
+        
+        Args:
+            df: DataFrame to update
+            metadata: Column name -> value mapping from get_source_metadata()
+            
+        Returns:
+            DataFrame with metadata columns
+        """
+        for column, value in metadata.items():
+            df[column] = value
+        return df
+    
+    def add_row_hash_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add the _row_key, _row_hash and _content_hash columns (see processing/row_hashes.py)
+        
+        Hashes are computed from the raw values, which every load stores in
+        BigQuery (CSV files are un-escaped by the CSV parser).
+        _row_hash only covers ROW_HASH_COLUMNS and is for the comparison
+        queries; _content_hash covers every report column and identifies
+        row versions (history and delta loads).
+        
+        Args:
+            df: Processed DataFrame
+            
+        Returns:
+            DataFrame with _row_key, _row_hash and _content_hash columns
+        """
+        skip = {spec.name for spec in METADATA_COLUMNS + DERIVED_COLUMNS}
+        report_columns = [column for column in df.columns if column not in skip]
+        compared_columns = self.ROW_HASH_COLUMNS if self.ROW_HASH_COLUMNS is not None else report_columns
+        
+        df["_row_key"] = hash_columns(df, self.ROW_KEY_COLUMNS or report_columns)
+        df["_row_hash"] = hash_columns(df, compared_columns)
+        df["_content_hash"] = content_hash(df, report_columns)
+        return df
+    
+    def dedupe_key_collisions(self, df: pd.DataFrame, seen_keys: Optional[set] = None) -> pd.DataFrame:
+        """
+        Keep one row per ROW_KEY_COLUMNS key and report the collisions
+        
+        Comparison queries join two dates on _row_key, so a key repeated in
+        one report would multiply the joined rows. Processors without
+        ROW_KEY_COLUMNS (key = every column) are left as is.
+        
+        Args:
+            df: DataFrame with the _row_key column
+            seen_keys: Keys kept from earlier chunks (streaming mode), updated
+            
+        Returns:
+            DataFrame with one row per key
+        """
+        if not self.ROW_KEY_COLUMNS:
+            return df
+        
+        tie_break = self.tie_break
+        if seen_keys is not None and tie_break != "first":
+            # Earlier chunks are already written, so the first row has to win
+            if self.last_key_collisions is None:
+                print(f"⚠ Tie-break '{tie_break}' needs the whole report, using 'first' in streaming mode")
+            tie_break = "first"
+        
+        deduped, collisions = dedupe_rows(df, tie_break, self.TIE_BREAK_COLUMN, seen_keys)
+        totals = self.last_key_collisions or {"keys": 0, "dropped_rows": 0}
+        if not collisions.empty:
+            dropped = len(df) - len(deduped)
+            keys = collisions.loc[~collisions["_kept"], "_row_key"].nunique()
+            totals = {"keys": totals["keys"] + keys, "dropped_rows": totals["dropped_rows"] + dropped}
+            key_columns = [column for column in self.ROW_KEY_COLUMNS if column in collisions.columns]
+            print(f"⚠ Key collisions: {keys} key(s) of ({', '.join(self.ROW_KEY_COLUMNS)}) repeated, "
+                  f"dropped {dropped} row(s) (tie-break: {tie_break})")
+            for values in collisions[key_columns].drop_duplicates().head(5).itertuples(index=False):
+                print(f"  - {' | '.join('' if pd.isna(value) else str(value) for value in values)}")
+        self.last_key_collisions = totals
+        return deduped
+    
+    def get_output_path(
+        self,
+        date_from_file: Optional[str],
+        output_format: str = "csv",
+        compression: Optional[str] = None
+    ) -> Path:
+        """
+        Get the output file path for a source file date
+        
+        Args:
+            date_from_file: Date from source file (YYYYMMDD), or None to use today's date
+            output_format: Output format / file extension ("csv" or "parquet")
+            compression: "gzip" to add a .gz extension, or None
+            
+        Returns:
+            Path to the output file
+        """
+        extension = f"{output_format}.gz" if compression == "gzip" else output_format
+        
+        # Use date from filename, or fall back to today's date (no timestamp)
+        if date_from_file:
+            print(f"ℹ Using date from source file: {date_from_file}")
+            return self.output_dir / f"{self.oem_name}_Dealer_Report_clean_{date_from_file}.{extension}"
+        
+        from datetime import datetime
+        date_only = datetime.now().strftime("%Y%m%d")
+        print(f"ℹ Using today's date: {date_only}")
+        return self.output_dir / f"{self.oem_name}_Dealer_Report_clean_{date_only}.{extension}"
+    
+    def get_arrow_type(self, column: str):
+        """
+        Get the Parquet (Arrow) type for an output column
+        
+        Args:
+            column: Sanitized column name
+            
+        Returns:
+            pyarrow DataType
+        """
+        import pyarrow as pa
+        
+        spec = self.SCHEMA.get(column)
+        dtype = spec.dtype if spec else "string"
+        return {
+            "string": pa.string(),
+            "int64": pa.int64(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp('us'),
+        }[dtype]
+    
+    def to_arrow_table(self, df: pd.DataFrame):
+        """
+        Convert a processed DataFrame to a typed Arrow table for Parquet output
+        
+        Every column gets an explicit type from get_arrow_type(), so chunks of
+        the same report always produce the same schema (an all-empty column is
+        still a string column, not a null column). Values that don't fit their
+        type become null.
+        
+        Arrow-backed columns (string[pyarrow], categoricals, ArrowDtype) are
+        handed to Arrow as-is and only cast, without a round trip through
+        Python objects; dictionary-encoded columns are decoded to plain strings.
+        
+        Args:
+            df: Processed DataFrame
+            
+        Returns:
+            pyarrow Table
+        """
+        import pyarrow as pa
+        
+        arrays = []
+        fields = []
+        for column in df.columns:
+            arrow_type = self.get_arrow_type(column)
+            series = df[column]
+            if self._is_arrow_native(series.dtype, arrow_type):
+                array = pa.array(series, from_pandas=True)
+                if isinstance(array.type, pa.DictionaryType):
+                    array = array.dictionary_decode()
+                array = array.cast(arrow_type)
+            elif pa.types.is_date32(arrow_type):
+                values = pd.to_datetime(series, format='%Y-%m-%d', errors='coerce')
+                array = pa.array(values, from_pandas=True).cast(arrow_type)
+            elif pa.types.is_timestamp(arrow_type):
+                values = pd.to_datetime(series, errors='coerce').astype('datetime64[us]')
+                array = pa.array(values, from_pandas=True, type=arrow_type)
+            elif pa.types.is_integer(arrow_type):
+                values = pd.to_numeric(series, errors='coerce').astype('Int64')
+                array = pa.array(values, from_pandas=True, type=arrow_type)
+            else:
+                values = series.astype(object).where(series.notna(), None)
+                array = pa.array(values.map(str, na_action='ignore'), type=arrow_type)
+            arrays.append(array)
+            fields.append(pa.field(column, arrow_type))
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+    
+    @staticmethod
+    def _is_arrow_native(dtype, arrow_type) -> bool:
+        """Check whether a column can go to Arrow without converting its values"""
+        import pyarrow as pa
+        
+        if isinstance(dtype, pd.ArrowDtype):
+            return dtype.pyarrow_dtype == arrow_type
+        if pa.types.is_string(arrow_type):
+            if isinstance(dtype, pd.CategoricalDtype):
+                dtype = dtype.categories.dtype
+            return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+        return False
+    
+    def write_output(self, df: pd.DataFrame, output_csv: Path, append: bool = False, handle=None):
+        """
+        Write a processed DataFrame to the output file
+        
+        The format follows the file extension: .parquet files are written as
+        typed Parquet (see to_arrow_table()), .csv.gz as gzip-compressed CSV with
+        minimal quoting, anything else as QUOTE_ALL CSV. Streamed Parquet chunks
+        are written with a ParquetWriter instead. Parquet holds the raw values;
+        CSV quotes are doubled by the writer, or pre-doubled with escape_quotes.
+        
+        Args:
+            df: Processed DataFrame
+            output_csv: Path to the output file
+            append: Append rows without a header (CSV only, used for streamed chunks)
+            handle: Open text file to write to instead of output_csv (used to
+                    stream chunks into a single gzip member)
+        """
+        if output_csv.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(self.to_arrow_table(df), output_csv)
+            return
+        
+        if self.escape_quotes:
+            df = self.clean_dataframe_values(df)
+        
+        # Compressed output is new, so it uses the smaller minimal quoting
+        is_gzip = output_csv.suffix == ".gz"
+        quoting = csv.QUOTE_MINIMAL if is_gzip else csv.QUOTE_ALL
+        
+        if handle is not None:
+            df.to_csv(handle, header=not append, index=False, quoting=quoting)
+            return
+        
+        df.to_csv(
+            output_csv,
+            mode="a" if append else "w",
+            header=not append,
+            index=False,
+            quoting=quoting,
+            encoding="utf-8",
+            compression="gzip" if is_gzip else None
+        )
+    
+    def _convert_in_memory(
+        self,
+        excel_file: Path,
+        output_csv: Path,
+        metadata: Optional[dict],
+        snapshot_date: Optional[str] = None
+    ) -> tuple[int, list, str]:
+        """
+        Read the whole Excel file, process it and write the output CSV
+        
+        In storage-write mode (snapshot_date given) the processed frame is
+        written to BigQuery (see write_frame) before the output file, and
+        the result is kept in last_storage_write.
+        
+        Args:
+            excel_file: Path to Excel file
+            output_csv: Path to the output CSV file
+            metadata: Metadata columns to add, or None to skip
+            snapshot_date: Report date (YYYY-MM-DD) when the frame is written
+                           to BigQuery directly, None otherwise
+            
+        Returns:
+            Tuple of (row_count, column_names, row_set_fingerprint)
+        """
+        # Read Excel file
+        df = self.read_excel_file(excel_file)
+        
+        print(f"✓ Successfully read Excel file")
+        print(f"  Rows: {len(df)}")
+        print(f"  Columns: {len(df.columns)}")
+        print()
+        
+        # Sanitize column names FIRST (before processing, so OEM processors can use sanitized names)
+        print("Sanitizing column names for BigQuery compatibility...")
+        df = self.sanitize_dataframe_columns(df)
+        print("✓ Column names sanitized")
+        print()
+        
+        # Drop unused columns and convert to schema types
+        df = self.apply_schema(df)
+        
+        # OEM-specific processing (after sanitization, so column names are consistent)
+        print(f"Processing {self.oem_name} data...")
+        df = self.process_dataframe(df)
+        fingerprint = fingerprint_rows(df.columns, row_hashes(df))
+        print(f"✓ Data processed")
+        print()
+        
+        # Metadata first: the row hash columns go last, after the columns older tables have
+        if metadata:
+            df = self.add_metadata_columns(df, metadata)
+        
+        df = self.add_row_hash_columns(df)
+        df = self.dedupe_key_collisions(df)
+        
+        if snapshot_date is not None:
+            snapshot = {"date": snapshot_date, "fingerprint": fingerprint, "rows": len(df)}
+            if self.skip_unchanged and self.record_unchanged_snapshot(snapshot):
+                self.last_storage_write = True
+            else:
+                self.last_storage_write = self.write_frame(df, output_csv.name, snapshot)
+        
+        # Save as clean CSV UTF-8 (or typed Parquet)
+        print(f"Writing to output file: {output_csv}")
+        self.write_output(df, output_csv)
+        return len(df), df.columns.tolist(), fingerprint
+    
+    def _convert_streaming(
+        self,
+        excel_file: Path,
+        output_csv: Path,
+        metadata: Optional[dict],
+        chunk_size: int
+    ) -> tuple[int, list, str]:
+        """
+        Stream the Excel file through sanitize → process → write in row chunks
+        
+        Only one chunk is held in memory at a time, so peak memory stays flat
+        regardless of how many rows the report has. The Parquet cache is not
+        used in this mode.
+        
+        Args:
+            excel_file: Path to Excel file
+            output_csv: Path to the output CSV file
+            metadata: Metadata columns to add, or None to skip
+            chunk_size: Number of rows per chunk
+            
+        Returns:
+            Tuple of (row_count, column_names, row_set_fingerprint)
+        """
+        print(f"ℹ Streaming mode: processing {chunk_size} rows per chunk")
+        print(f"Writing to output file: {output_csv}")
+        
+        is_parquet = output_csv.suffix == ".parquet"
+        parquet_writer = None
+        # One gzip stream for all chunks (appending would create a member per chunk)
+        gzip_file = gzip.open(output_csv, "wt", encoding="utf-8", newline="") if output_csv.suffix == ".gz" else None
+        total_rows = 0
+        columns = None
+        # Row hashes of every chunk, combined into one fingerprint at the end
+        hashes = []
+        # Keys written by earlier chunks (one row per key across the report)
+        seen_keys = set()
+        try:
+            for chunk_number, chunk in enumerate(self.read_excel_chunks(excel_file, chunk_size), 1):
+                if columns is None:
+                    # Sanitize once, reuse the same names for every chunk
+                    chunk = self.sanitize_dataframe_columns(chunk)
+                    columns = chunk.columns.tolist()
+                else:
+                    chunk.columns = columns
+                
+                chunk = self.apply_schema(chunk, warn_unknown=chunk_number == 1)
+                chunk = self.process_dataframe(chunk)
+                hashes.append(row_hashes(chunk))
+                if metadata:
+                    chunk = self.add_metadata_columns(chunk, metadata)
+                chunk = self.add_row_hash_columns(chunk)
+                chunk = self.dedupe_key_collisions(chunk, seen_keys)
+                
+                if is_parquet:
+                    import pyarrow.parquet as pq
+                    table = self.to_arrow_table(chunk)
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(output_csv, table.schema)
+                    parquet_writer.write_table(table)
+                else:
+                    self.write_output(chunk, output_csv, append=chunk_number > 1, handle=gzip_file)
+                total_rows += len(chunk)
+                output_columns = chunk.columns.tolist()
+                print(f"  Chunk {chunk_number}: {len(chunk)} rows (total {total_rows})")
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+            if gzip_file is not None:
+                gzip_file.close()
+        
+        if columns is None:
+            raise ValueError(f"No header row found in {excel_file.name}")
+        
+        print(f"✓ Streamed {total_rows} rows")
+        print()
+        return total_rows, output_columns, fingerprint_rows(output_columns, np.concatenate(hashes))
+    
+    def batches_loads(self) -> bool:
+        """
+        Check whether several outputs can be appended by one BigQuery load job (see upload_outputs)
+        
+        Returns:
+            True for Ford reports in append mode without skip_unchanged
+        """
+        loads_to_bigquery = hasattr(self, 'load_to_bigquery') and self.load_to_bigquery
+        return (
+            loads_to_bigquery and self.oem_name.lower() == "ford" and self.load_mode == "append"
+            and not self.skip_unchanged
+        )
+    
+    def submits_loads(self) -> bool:
+        """
+        Check whether BigQuery loads can be submitted to load_jobs without waiting
+        
+        skip_unchanged compares each report with the previous loaded date,
+        which is only recorded once its load finishes, so it needs waiting.
+        
+        Returns:
+            True for Ford reports in append or replace mode without skip_unchanged
+        """
+        loads_to_bigquery = hasattr(self, 'load_to_bigquery') and self.load_to_bigquery
+        return (
+            loads_to_bigquery and self.oem_name.lower() == "ford" and self.load_mode in ("append", "replace")
+            and not self.skip_unchanged
+        )
+    
+    def writes_to_storage(self) -> bool:
+        """
+        Check whether reports are written with the Storage Write API instead of uploaded and loaded
+        
+        Returns:
+            True for Ford reports loaded to BigQuery in storage-write mode
+        """
+        loads_to_bigquery = hasattr(self, 'load_to_bigquery') and self.load_to_bigquery
+        return loads_to_bigquery and self.oem_name.lower() == "ford" and self.load_mode == "storage-write"
+    
+    def read_output_frame(self, output_csv: Path) -> pd.DataFrame:
+        """
+        Read an output file back as the frame the in-memory conversion writes to storage
+        
+        Output files hold the raw values once read back (the CSV reader
+        un-escapes the quotes the writer doubled) and the row hashes computed
+        from them, so a report written from its output file stores the same
+        values and hashes as one written from memory.
+        
+        Args:
+            output_csv: Path to the output file (.csv, .csv.gz or .parquet)
+            
+        Returns:
+            DataFrame with the raw values and their row hashes
+        """
+        from processing.diff import load_snapshot
+        
+        return load_snapshot(output_csv, self)
+    
+    def write_frame(self, df: pd.DataFrame, label: str, snapshot: Optional[dict] = None) -> bool:
+        """
+        Write a processed report to ford_oem_orders with the Storage Write API
+        
+        The frame is converted to Arrow with the output column types (see
+        to_arrow_table) and written by BigQueryLoader.write_ford_oem_arrow
+        with storage_writer in storage_write_mode. Nothing goes through GCS.
+        A successful write records the snapshot in the snapshot registry.
+        
+        Args:
+            df: Processed DataFrame with metadata columns
+            label: Output filename, for logs
+            snapshot: Date, fingerprint and row count of the converted report
+            
+        Returns:
+            True if the rows were written, False otherwise
+        """
+        from processing.bigquery_loader import BigQueryLoader
+        
+        print("Writing to BigQuery...")
+        try:
+            success = BigQueryLoader().write_ford_oem_arrow(
+                self.to_arrow_table(df),
+                self.get_bigquery_schema(df.columns.tolist()),
+                label,
+                writer=self.storage_writer,
+                mode=self.storage_write_mode
+            )
+        except Exception as e:
+            print(f"⚠ BigQuery write failed: {e}")
+            import traceback
+            traceback.print_exc()
+            success = False
+        
+        if success and snapshot:
+            self.record_snapshot(snapshot)
+        print()
+        return success
+    
+    def upload_output(
+        self,
+        output_csv: Path,
+        snapshot: Optional[dict] = None,
+        storage_write_failed: bool = False
+    ) -> bool:
+        """
+        Upload the output file to GCS and load it to BigQuery (if this OEM supports it)
+        
+        With a snapshot (see last_snapshot), a successful BigQuery load records
+        the report's fingerprint in the snapshot registry. If skip_unchanged is
+        set and the fingerprint matches the previous loaded date, nothing is
+        uploaded or loaded: a "same as <date>" alias is recorded instead.
+        
+        Args:
+            output_csv: Path to the output CSV file
+            snapshot: Date, fingerprint and row count of the converted report
+            storage_write_failed: The Storage Write API write of this report
+                                  failed; upload the file and append it with
+                                  a load job instead (a committed-stream write
+                                  may have left rows, so that date's partition
+                                  is replaced)
+            
+        Returns:
+            True if GCS upload succeeded (or was skipped as unchanged), False otherwise
+        """
+        loads_to_bigquery = hasattr(self, 'load_to_bigquery') and self.load_to_bigquery
+        
+        # A failed storage write already checked skip_unchanged
+        if snapshot and self.skip_unchanged and loads_to_bigquery and not storage_write_failed:
+            if self.record_unchanged_snapshot(snapshot):
+                return True
+        
+        if loads_to_bigquery and self.oem_name.lower() == "ford" and self.load_mode == "delta":
+            return self.upload_delta_output(output_csv, snapshot)
+        
+        if storage_write_failed:
+            print("ℹ Storage Write API write failed, loading the output file with a load job instead")
+        elif self.writes_to_storage():
+            # Written from the output file; the in-memory conversion writes the frame directly
+            return self.write_frame(self.read_output_frame(output_csv), output_csv.name, snapshot)
+        
+        print(f"Uploading to GCS bucket...")
+        gcs_upload_success = upload_to_gcs(output_csv)
+        print()
+        
+        if self.load_jobs is not None and self.submits_loads():
+            self.submit_output_load(output_csv, gcs_upload_success, snapshot)
+            return gcs_upload_success
+        
+        # Load to BigQuery if this OEM supports it
+        if loads_to_bigquery:
+            from processing.bigquery_loader import BigQueryLoader
+            print("Loading to BigQuery...")
+            try:
+                loader = BigQueryLoader()
+                # Use OEM-specific BigQuery loading method
+                is_parquet = output_csv.suffix == ".parquet"
+                # Explicit schema for CSV loads that create a table (Parquet is self-describing)
+                new_table_schema = None
+                if not is_parquet:
+                    new_table_schema = self.get_bigquery_schema(read_csv_header(output_csv))
+                
+                if self.oem_name.lower() == "ford" and self.load_mode == "history":
+                    # Merge into ford_oem_orders_history (from the local file if GCS upload failed)
+                    success = loader.load_ford_oem_history(
+                        output_csv.name if gcs_upload_success else output_csv,
+                        new_table_schema
+                    )
+                elif self.oem_name.lower() == "ford" and (
+                    self.load_mode == "replace"
+                    or (storage_write_failed and self.storage_write_mode == "committed")
+                ):
+                    # Replace the date's partition of ford_oem_orders (reruns don't duplicate;
+                    # also drops the batches a failed committed-stream write left behind)
+                    success = loader.load_ford_oem_partition(
+                        output_csv.name if gcs_upload_success else output_csv,
+                        new_table_schema
+                    )
+                elif self.oem_name.lower() == "ford":
+                    # If GCS upload failed, load from local file instead
+                    if not gcs_upload_success:
+                        print("  ℹ GCS upload failed, loading directly from local file")
+                        if is_parquet:
+                            success = loader.load_ford_oem_parquet_from_local(output_csv)
+                        else:
+                            success = loader.load_ford_oem_csv_from_local(output_csv, new_table_schema)
+                    elif is_parquet:
+                        success = loader.load_ford_oem_parquet(output_csv.name)
+                    else:
+                        success = loader.load_ford_oem_csv(output_csv.name, new_table_schema)
+                elif is_parquet:
+                    success = loader.load_oem_parquet(output_csv.name, self.oem_name)
+                else:
+                    # For other OEMs, use generic method (if needed in future)
+                    success = loader.load_oem_csv(output_csv.name, self.oem_name, new_table_schema)
+                
+                if success:
+                    print("✓ BigQuery load successful")
+                    if snapshot:
+                        self.record_snapshot(snapshot)
+                else:
+                    print("⚠ BigQuery load had errors (check logs above)")
+            except Exception as e:
+                print(f"⚠ BigQuery load failed: {e}")
+                import traceback
+                traceback.print_exc()
+            print()
+        
+        return gcs_upload_success
+    
+    def submit_output_load(self, output_csv: Path, gcs_uploaded: bool, snapshot: Optional[dict] = None) -> bool:
+        """
+        Submit the BigQuery load of an uploaded output file to load_jobs
+        
+        The snapshot is recorded in the snapshot registry when the tracker
+        reports the job as done.
+        
+        Args:
+            output_csv: Path to the output file
+            gcs_uploaded: Whether the GCS upload succeeded (else the local file is loaded)
+            snapshot: Date, fingerprint and row count of the converted report
+            
+        Returns:
+            True if the load job was submitted, False otherwise
+        """
+        from processing.bigquery_loader import BigQueryLoader
+        
+        if not gcs_uploaded:
+            print("  ℹ GCS upload failed, loading directly from local file")
+        new_table_schema = None
+        if output_csv.suffix != ".parquet":
+            new_table_schema = self.get_bigquery_schema(read_csv_header(output_csv))
+        
+        def record_snapshot(event: dict):
+            if event["state"] == "done" and snapshot:
+                self.record_snapshot(snapshot)
+        
+        print("Submitting BigQuery load...")
+        try:
+            submitted = BigQueryLoader().submit_ford_oem_load(
+                self.load_jobs,
+                output_csv.name if gcs_uploaded else output_csv,
+                new_table_schema,
+                replace=self.load_mode == "replace",
+                on_done=record_snapshot
+            )
+        except Exception as e:
+            print(f"⚠ BigQuery load submission failed: {e}")
+            submitted = False
+        print()
+        return submitted
+    
+    def upload_outputs(self, outputs: list[tuple[Path, Optional[dict]]]) -> bool:
+        """
+        Upload several output files and load them to BigQuery in as few load jobs as possible
+        
+        Ford reports in append mode are uploaded to GCS one by one, then
+        appended with one load job per group of files with the same columns
+        (see BigQueryLoader.load_ford_oem_batch and batch_load_groups), so a
+        backfill waits for about one load instead of one per date. The rows
+        loaded for each date are checked against the converted row count.
+        Other OEMs and load modes (and --skip-unchanged, which compares each
+        date with the previous one as it is loaded) go through upload_output()
+        file by file, with the loads submitted together where submits_loads()
+        allows it.
+        
+        Args:
+            outputs: (output file, snapshot) pairs in load order (oldest report first)
+            
+        Returns:
+            True if every file was uploaded to GCS (or loaded from the local file), False otherwise
+        """
+        if not self.batches_loads() or len(outputs) <= 1:
+            return self._upload_outputs_concurrently(outputs)
+        
+        from processing.bigquery_loader import BigQueryLoader, batch_load_groups
+        
+        print(f"Uploading {len(outputs)} file(s) to GCS bucket...")
+        sources = {}
+        for output_csv, _ in outputs:
+            # If GCS upload failed, load from local file instead
+            sources[output_csv] = output_csv.name if upload_to_gcs(output_csv) else output_csv
+        snapshots = dict(outputs)
+        print()
+        
+        print("Loading to BigQuery...")
+        try:
+            loader = BigQueryLoader()
+            for group in batch_load_groups(list(sources)):
+                new_table_schema = None
+                if group[0].suffix != ".parquet":
+                    new_table_schema = self.get_bigquery_schema(read_csv_header(group[0]))
+                
+                row_counts = loader.load_ford_oem_batch([sources[output_csv] for output_csv in group], new_table_schema)
+                if row_counts is None:
+                    print(f"⚠ BigQuery batch load of {len(group)} file(s) had errors (check logs above)")
+                    continue
+                
+                for output_csv in group:
+                    snapshot = snapshots[output_csv]
+                    if not snapshot:
+                        continue
+                    loaded_rows = row_counts.get(snapshot["date"], 0)
+                    if loaded_rows != snapshot["rows"]:
+                        print(f"⚠ {output_csv.name}: {loaded_rows} rows loaded for {snapshot['date']}, "
+                              f"{snapshot['rows']} converted")
+                    self.record_snapshot(snapshot)
+                print("✓ BigQuery batch load successful")
+        except Exception as e:
+            print(f"⚠ BigQuery batch load failed: {e}")
+            import traceback
+            traceback.print_exc()
+        print()
+        
+        return all(isinstance(source, str) for source in sources.values())
+    
+    def _upload_outputs_concurrently(self, outputs: list[tuple[Path, Optional[dict]]]) -> bool:
+        """
+        Upload outputs one by one, letting their BigQuery loads run at the same time
+        
+        If the loads can be submitted (see submits_loads) and no tracker is
+        set, the loads go to a tracker that keeps submission order and are
+        awaited together after the last upload. Otherwise each upload_output()
+        call waits for its own load.
+        
+        Args:
+            outputs: (output file, snapshot) pairs in load order
+            
+        Returns:
+            True if every file was uploaded to GCS (or loaded from the local file), False otherwise
+        """
+        from processing.load_jobs import LoadJobTracker, print_load_event
+        
+        if self.load_jobs is not None or not self.submits_loads():
+            results = [self.upload_output(output_csv, snapshot) for output_csv, snapshot in outputs]
+            return all(results)
+        
+        self.load_jobs = LoadJobTracker(ordered=True)
+        try:
+            results = []
+            for output_csv, snapshot in outputs:
+                print(f"\n{output_csv.name}")
+                results.append(self.upload_output(output_csv, snapshot))
+                for event in self.load_jobs.poll():
+                    print_load_event(event)
+            
+            if len(self.load_jobs):
+                print(f"Waiting for {len(self.load_jobs)} load job(s)...")
+            for event in self.load_jobs.as_completed():
+                print_load_event(event)
+        finally:
+            self.load_jobs = None
+        print()
+        return all(results)
+    
+    def upload_delta_output(self, output_csv: Path, snapshot: Optional[dict]) -> bool:
+        """
+        Upload and load only the rows that changed since the last loaded date
+        
+        The output file is compared with the row versions of the last date
+        loaded in delta mode (kept locally by SnapshotKeyCache, or fetched
+        from BigQuery if missing). The new / changed / removed rows are
+        written next to the output as *_delta.<ext>, uploaded and appended to
+        ford_oem_orders_delta (see processing/delta.py). Dates must be loaded
+        in order.
+        
+        Args:
+            output_csv: Path to the full output file
+            snapshot: Date, fingerprint and row count of the converted report
+            
+        Returns:
+            True if the delta was uploaded (or loaded from the local file) and loaded, False otherwise
+        """
+        from processing.bigquery_loader import BigQueryLoader
+        from processing.delta import (
+            SnapshotKeyCache, compute_delta, snapshot_versions, CHANGE_TYPE_COLUMN, VERSION_COLUMNS
+        )
+        from processing.diff import load_snapshot
+        
+        if not snapshot:
+            print("✗ Delta mode needs the report date in the filename")
+            return False
+        
+        try:
+            loader = BigQueryLoader()
+            latest = loader.latest_ford_delta_date()
+            if latest and snapshot["date"] <= latest:
+                print(f"✗ {snapshot['date']} is not after the latest delta-loaded date {latest}")
+                print(f"  Delta mode needs reports loaded once each, in date order")
+                return False
+            
+            cache = SnapshotKeyCache()
+            previous = pd.DataFrame({column: pd.Series(dtype="int64") for column in VERSION_COLUMNS})
+            if latest:
+                cached = cache.load(self.oem_name, latest)
+                if cached is None:
+                    print(f"ℹ No local row versions for {latest}, fetching them from BigQuery...")
+                    cached = pd.DataFrame(loader.fetch_ford_delta_versions(latest), columns=VERSION_COLUMNS, dtype="int64")
+                previous = cached
+            
+            df = load_snapshot(output_csv, self)
+            delta = compute_delta(df, previous)
+            counts = delta[CHANGE_TYPE_COLUMN].value_counts()
+            print(f"Delta against {latest or 'an empty baseline'}: {len(delta)} of {len(df)} rows")
+            print(f"  new: {counts.get('new', 0)}, changed: {counts.get('changed', 0)}, "
+                  f"removed versions: {counts.get('removed', 0)}")
+            
+            source = None
+            new_table_schema = None
+            if len(delta):
+                delta_path = output_csv.with_name(output_csv.name.replace(".", "_delta.", 1))
+                self.write_output(delta, delta_path)
+                print(f"  Delta file: {delta_path.name} ({get_file_size_mb(delta_path):.2f} MB, "
+                      f"full output {get_file_size_mb(output_csv):.2f} MB)")
+                print()
+                if delta_path.suffix != ".parquet":
+                    new_table_schema = self.get_bigquery_schema(read_csv_header(delta_path))
+                
+                print(f"Uploading delta to GCS bucket...")
+                source = delta_path.name if upload_to_gcs(delta_path) else delta_path
+                print()
+            
+            # Source file metadata of the date, as strings for the loads table
+            metadata = {
+                column: str(df[column].iloc[0]) if column in df.columns and len(df) and pd.notna(df[column].iloc[0]) else None
+                for column in ("_source_filename", "_source_file_created_timestamp")
+            }
+            load_info = {
+                "date": snapshot["date"],
+                "baseline_date": latest,
+                "source_filename": metadata["_source_filename"],
+                "source_file_created_timestamp": metadata["_source_file_created_timestamp"],
+                "rows": len(df),
+                "delta_rows": len(delta),
+            }
+            print("Loading delta to BigQuery...")
+            if not loader.load_ford_oem_delta(source, load_info, new_table_schema):
+                print("⚠ BigQuery delta load had errors (check logs above)")
+                print()
+                return False
+        except Exception as e:
+            print(f"⚠ Delta load failed: {e}")
+            import traceback
+            traceback.print_exc()
+            print()
+            return False
+        
+        cache.save(self.oem_name, snapshot["date"], snapshot_versions(df))
+        self.record_snapshot(snapshot)
+        print("✓ BigQuery delta load successful")
+        print()
+        return True
+    
+    def record_snapshot(self, snapshot: dict, same_as: Optional[str] = None):
+        """
+        Record a loaded (or aliased) snapshot in the local registry and in BigQuery
+        
+        The BigQuery copy lets other hosts find this date's fingerprint (see
+        record_unchanged_snapshot); failing to write it only warns.
+        
+        Args:
+            snapshot: Date, fingerprint and row count of the converted report
+            same_as: Date whose rows the snapshot reuses, if it was not loaded
+        """
+        from processing.bigquery_loader import BigQueryLoader
+        
+        SnapshotRegistry().record(
+            self.oem_name, snapshot["date"], snapshot["fingerprint"], snapshot["rows"], same_as=same_as
+        )
+        try:
+            BigQueryLoader().record_snapshot_fingerprint(
+                self.oem_name, snapshot["date"], snapshot["fingerprint"], snapshot["rows"], same_as
+            )
+        except Exception as e:
+            print(f"⚠ Could not record the {snapshot['date']} fingerprint in BigQuery: {e}")
+    
+    def record_unchanged_snapshot(self, snapshot: dict) -> bool:
+        """
+        Record an alias instead of loading a report identical to the previous date
+        
+        The previous date's fingerprint is read from BigQuery (see
+        BigQueryLoader.previous_snapshot_fingerprint), so the check works
+        whichever host loaded that date. The local registry is only used when
+        BigQuery has no earlier fingerprint (dates loaded before fingerprints
+        were recorded there) or can't be queried.
+        
+        Args:
+            snapshot: Date, fingerprint and row count of the converted report
+            
+        Returns:
+            True if the report was unchanged and the alias was recorded, False
+            if it has to be loaded normally
+        """
+        from processing.bigquery_loader import BigQueryLoader
+        
+        previous = None
+        try:
+            previous = BigQueryLoader().previous_snapshot_fingerprint(self.oem_name, snapshot["date"])
+        except Exception as e:
+            print(f"⚠ Could not read the previous fingerprint from BigQuery: {e}")
+            print(f"  Using the local snapshot registry")
+        
+        if previous is not None:
+            same_as = None
+            if previous["fingerprint"] == snapshot["fingerprint"]:
+                same_as = previous["same_as"] or previous["date"]
+        else:
+            same_as = SnapshotRegistry().unchanged_since(self.oem_name, snapshot["date"], snapshot["fingerprint"])
+        if same_as is None:
+            return False
+        
+        print(f"ℹ {snapshot['date']} is unchanged from {same_as} ({snapshot['rows']} rows)")
+        print(f"  Skipping upload and load, recording it as same as {same_as}...")
+        try:
+            recorded = BigQueryLoader().record_snapshot_alias(
+                self.oem_name, snapshot["date"], same_as, snapshot["fingerprint"], snapshot["rows"]
+            )
+        except Exception as e:
+            print(f"⚠ Could not record snapshot alias: {e}")
+            recorded = False
+        
+        if not recorded:
+            print("  Falling back to a full upload and load")
+            print()
+            return False
+        
+        self.record_snapshot(snapshot, same_as=same_as)
+        print()
+        return True
+    
     def convert_excel_to_csv(
         self,
         excel_file: Optional[Path] = None,
-        upload_to_gcs_flag: bool = True
+        upload_to_gcs_flag: bool = True,
+        streaming: bool = False,
+        chunk_size: Optional[int] = None,
+        output_format: str = "csv",
+        compression: Optional[str] = None
     ) -> Path:
         """
         Convert Excel file to clean CSV - Main workflow
@@ -153,10 +1369,32 @@ class BaseOEMProcessor(ABC):
         Args:
             excel_file: Path to Excel file. If None, searches for files matching pattern
             upload_to_gcs_flag: Whether to upload to GCS after conversion
+            streaming: Process the file in row chunks with openpyxl's read-only
+                       reader instead of loading the whole sheet into memory
+            chunk_size: Rows per chunk in streaming mode (default: EXCEL_CHUNK_SIZE)
+            output_format: "csv" (default) or "parquet" for typed Parquet with
+                           native DATE columns, loaded to BigQuery as Parquet
+            compression: "gzip" to write .csv.gz with minimal quoting (CSV only)
             
         Returns:
-            Path to the created CSV file
+            Path to the created CSV (or Parquet) file
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{output_format}' (expected one of {OUTPUT_FORMATS})")
+        if compression is not None and (compression not in COMPRESSIONS or output_format != "csv"):
+            raise ValueError(f"Unsupported compression '{compression}' for {output_format} output")
+        loads_to_bigquery = hasattr(self, 'load_to_bigquery') and self.load_to_bigquery
+        if self.escape_quotes and output_format == "csv" and upload_to_gcs_flag and loads_to_bigquery:
+            raise ValueError("CSV output with pre-escaped quotes (escape_quotes) can't be loaded to BigQuery, "
+                             "which stores the raw quotes")
+        if self.load_mode not in LOAD_MODES:
+            raise ValueError(f"Unsupported load mode '{self.load_mode}' (expected one of {LOAD_MODES})")
+        if self.tie_break not in TIE_BREAKS:
+            raise ValueError(f"Unsupported tie-break '{self.tie_break}' (expected one of {TIE_BREAKS})")
+        if self.tie_break == "latest" and not self.TIE_BREAK_COLUMN:
+            raise ValueError(f"Tie-break 'latest' needs a TIE_BREAK_COLUMN for {self.oem_name}")
+        self.last_key_collisions = None
+        
         print("=" * 60)
         print(f"{self.oem_name} Dealer Report Excel to CSV Converter")
         print("=" * 60)
@@ -184,32 +1422,6 @@ class BaseOEMProcessor(ABC):
         try:
             print(f"Reading Excel file: {excel_file}")
             
-            # Read Excel file
-            df = self.read_excel_file(excel_file)
-            
-            print(f"✓ Successfully read Excel file")
-            print(f"  Rows: {len(df)}")
-            print(f"  Columns: {len(df.columns)}")
-            print()
-            
-            # Sanitize column names FIRST (before processing, so OEM processors can use sanitized names)
-            print("Sanitizing column names for BigQuery compatibility...")
-            df = self.sanitize_dataframe_columns(df)
-            print("✓ Column names sanitized")
-            print()
-            
-            # OEM-specific processing (after sanitization, so column names are consistent)
-            print(f"Processing {self.oem_name} data...")
-            df = self.process_dataframe(df)
-            print(f"✓ Data processed")
-            print()
-            
-            # Clean data values
-            print("Cleaning data (replacing problematic characters)...")
-            df = self.clean_dataframe_values(df)
-            print("✓ Data cleaned")
-            print()
-            
             # Generate output filename with date from source file
             # Try to extract date from Excel filename
             date_from_file = None
@@ -221,172 +1433,69 @@ class BaseOEMProcessor(ABC):
                 else:
                     print(f"  ⚠ Could not extract date from filename")
             
-            # Add metadata columns for BigQuery tracking
+            # Metadata columns for BigQuery tracking
+            metadata = None
             if hasattr(self, 'add_timestamp_column') and self.add_timestamp_column:
-                from datetime import datetime
-                import os
-                
-                # Add source filename (which file this data came from)
-                df['_source_filename'] = excel_file.name
-                
-                # Add file creation timestamp (when the source file was created)
-                # Try to get from file metadata
-                try:
-                    # Get file creation time (ctime) or modification time (mtime) as fallback
-                    file_created_time = os.path.getctime(excel_file)
-                    file_created_timestamp = datetime.fromtimestamp(file_created_time).isoformat()
-                except (OSError, ValueError):
-                    # If can't get file time, use current time as fallback
-                    file_created_timestamp = datetime.now().isoformat()
-                
-                df['_source_file_created_timestamp'] = file_created_timestamp
-                
-                # Add source file date (which date file this data came from)
-                # IMPORTANT: This uses the date from the SOURCE FILE (sheet name), NOT today's date
-                # This is the date extracted from the sheet filename - each order gets this date
-                source_date = None
-                if date_from_file:
-                    # Convert YYYYMMDD to YYYY-MM-DD format for better readability
-                    # date_from_file comes from extract_date_from_filename() - source file date
-                    source_date = f"{date_from_file[:4]}-{date_from_file[4:6]}-{date_from_file[6:8]}"
-                else:
-                    # Fallback: Try to extract from filename using alternative patterns
-                    import re
-                    # Try different date patterns
-                    patterns = [
-                        r'(\d{4})(\d{2})(\d{2})',  # YYYYMMDD
-                        r'(\d{2})/(\d{2})/(\d{4})',  # MM/DD/YYYY
-                        r'(\d{4})-(\d{2})-(\d{2})',  # YYYY-MM-DD
-                    ]
-                    
-                    source_date = None
-                    for pattern in patterns:
-                        match = re.search(pattern, excel_file.name)
-                        if match:
-                            if len(match.groups()) == 3:
-                                if pattern == r'(\d{4})(\d{2})(\d{2})':
-                                    # YYYYMMDD
-                                    year, month, day = match.groups()
-                                    source_date = f"{year}-{month}-{day}"
-                                    break
-                                elif pattern == r'(\d{2})/(\d{2})/(\d{4})':
-                                    # MM/DD/YYYY
-                                    month, day, year = match.groups()
-                                    source_date = f"{year}-{month}-{day}"
-                                    break
-                                elif pattern == r'(\d{4})-(\d{2})-(\d{2})':
-                                    # YYYY-MM-DD
-                                    source_date = match.group(0)
-                                    break
-                    
-                    if not source_date:
-                        # Last resort: use file modification date
-                        try:
-                            file_date = datetime.fromtimestamp(os.path.getmtime(excel_file))
-                            source_date = file_date.strftime("%Y-%m-%d")
-                            print(f"⚠ Could not extract date from filename, using file modification date: {source_date}")
-                        except:
-                            # Final fallback: today's date (but this shouldn't happen)
-                            source_date = datetime.now().strftime("%Y-%m-%d")
-                            print(f"⚠ Could not extract date, using today's date: {source_date}")
-                
-                # Set the date for ALL rows in the dataframe
-                df['_source_file_date'] = source_date  # Sheet date from filename - each order gets this
-                print(f"✓ Added metadata columns:")
-                print(f"  - _source_filename: {excel_file.name}")
-                print(f"  - _source_file_created_timestamp: {file_created_timestamp}")
-                print(f"  - _source_file_date: {source_date} (applied to all {len(df)} orders)")
+                metadata = self.get_source_metadata(excel_file, date_from_file)
+                print(f"✓ Adding metadata columns:")
+                print(f"  - _source_filename: {metadata['_source_filename']}")
+                print(f"  - _source_file_created_timestamp: {metadata['_source_file_created_timestamp']}")
+                print(f"  - _source_file_date: {metadata['_source_file_date']} (applied to all orders)")
                 print()
             
-            # Use date from filename, or fall back to today's date (no timestamp)
-            if date_from_file:
-                output_csv = self.output_dir / f"{self.oem_name}_Dealer_Report_clean_{date_from_file}.csv"
-                print(f"ℹ Using date from source file: {date_from_file}")
+            output_csv = self.get_output_path(date_from_file, output_format, compression)
+            
+            # Set by storage-write loads that write the processed frame before the output file
+            self.last_storage_write = None
+            if streaming:
+                row_count, columns, fingerprint = self._convert_streaming(
+                    excel_file,
+                    output_csv,
+                    metadata,
+                    chunk_size or EXCEL_CHUNK_SIZE
+                )
             else:
-                from datetime import datetime
-                date_only = datetime.now().strftime("%Y%m%d")
-                output_csv = self.output_dir / f"{self.oem_name}_Dealer_Report_clean_{date_only}.csv"
-                print(f"ℹ Using today's date: {date_only}")
+                snapshot_date = None
+                if upload_to_gcs_flag and self.writes_to_storage() and date_from_file:
+                    snapshot_date = f"{date_from_file[:4]}-{date_from_file[4:6]}-{date_from_file[6:]}"
+                row_count, columns, fingerprint = self._convert_in_memory(
+                    excel_file, output_csv, metadata, snapshot_date
+                )
             
-            # Verify metadata columns are set before saving
-            if hasattr(self, 'add_timestamp_column') and self.add_timestamp_column:
-                # Verify _source_file_date is set for all rows
-                if '_source_file_date' in df.columns:
-                    null_count = df['_source_file_date'].isna().sum()
-                    if null_count > 0:
-                        print(f"⚠ WARNING: {null_count} rows have NULL _source_file_date - filling with extracted date")
-                        # Fill any NULL values with the extracted date
-                        # source_date should already be set above, but if not, try to get it
-                        if not source_date and date_from_file:
-                            source_date = f"{date_from_file[:4]}-{date_from_file[4:6]}-{date_from_file[6:8]}"
-                        if source_date:
-                            df['_source_file_date'] = df['_source_file_date'].fillna(source_date)
-                    
-                    # Verify all rows have the date
-                    sample_dates = df['_source_file_date'].dropna().unique()
-                    if len(sample_dates) > 0:
-                        print(f"  ✓ Verified: All rows have _source_file_date = '{sample_dates[0]}'")
-                    else:
-                        print(f"  ⚠ WARNING: No _source_file_date values found in DataFrame!")
-            
-            # Save as clean CSV UTF-8
-            print(f"Writing to CSV file: {output_csv}")
-            df.to_csv(
-                output_csv,
-                index=False,
-                quoting=1,  # QUOTE_ALL - quote all fields
-                encoding="utf-8"
-            )
+            self.last_snapshot = None
+            if date_from_file:
+                self.last_snapshot = {
+                    "date": f"{date_from_file[:4]}-{date_from_file[4:6]}-{date_from_file[6:]}",
+                    "fingerprint": fingerprint,
+                    "rows": row_count,
+                }
             
             # Show file info
             file_size_mb = get_file_size_mb(output_csv)
             
-            print(f"✓ Successfully exported to CSV")
+            print(f"✓ Successfully exported to {output_format.upper()}")
             print(f"  Output file: {output_csv}")
             print(f"  File size: {file_size_mb:.2f} MB")
-            print(f"  Rows: {len(df)}")
-            print(f"  Columns: {len(df.columns)}")
+            if output_csv.suffix == ".gz":
+                uncompressed_mb = get_gzip_uncompressed_size(output_csv) / (1024 * 1024)
+                if file_size_mb:
+                    print(f"  Uncompressed size: {uncompressed_mb:.2f} MB ({uncompressed_mb / file_size_mb:.1f}x compression)")
+            print(f"  Rows: {row_count}")
+            if self.last_key_collisions and self.last_key_collisions["dropped_rows"]:
+                print(f"  Key collisions: {self.last_key_collisions['keys']} key(s), "
+                      f"{self.last_key_collisions['dropped_rows']} duplicate row(s) dropped")
+            print(f"  Columns: {len(columns)}")
             
             # Final verification - check CSV has the date column
-            if hasattr(self, 'add_timestamp_column') and self.add_timestamp_column:
-                if '_source_file_date' in df.columns:
-                    print(f"  ✓ Metadata: _source_file_date column present with {df['_source_file_date'].notna().sum()} non-null values")
+            if metadata and '_source_file_date' in columns:
+                print(f"  ✓ Metadata: _source_file_date = '{metadata['_source_file_date']}' on all {row_count} rows")
             print()
             
-            # Upload to GCS
-            gcs_upload_success = False
-            if upload_to_gcs_flag:
-                print(f"Uploading to GCS bucket...")
-                gcs_upload_success = upload_to_gcs(output_csv)
-                print()
-                
-                # Load to BigQuery if this OEM supports it
-                if hasattr(self, 'load_to_bigquery') and self.load_to_bigquery:
-                    from processing.bigquery_loader import BigQueryLoader
-                    print("Loading to BigQuery...")
-                    try:
-                        loader = BigQueryLoader()
-                        # Use OEM-specific BigQuery loading method
-                        if self.oem_name.lower() == "ford":
-                            # If GCS upload failed, load from local file instead
-                            if not gcs_upload_success:
-                                print("  ℹ GCS upload failed, loading directly from local CSV file")
-                                success = loader.load_ford_oem_csv_from_local(output_csv)
-                            else:
-                                success = loader.load_ford_oem_csv(output_csv.name)
-                        else:
-                            # For other OEMs, use generic method (if needed in future)
-                            success = loader.load_oem_csv(output_csv.name, self.oem_name)
-                        
-                        if success:
-                            print("✓ BigQuery load successful")
-                        else:
-                            print("⚠ BigQuery load had errors (check logs above)")
-                    except Exception as e:
-                        print(f"⚠ BigQuery load failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    print()
+            # Upload to GCS (and BigQuery), unless the rows were already written
+            if upload_to_gcs_flag and self.last_storage_write is None:
+                self.upload_output(output_csv, self.last_snapshot)
+            elif upload_to_gcs_flag and self.last_storage_write is False:
+                self.upload_output(output_csv, self.last_snapshot, storage_write_failed=True)
             
             print("=" * 60)
             print("Conversion complete!")
@@ -402,4 +1511,3 @@ class BaseOEMProcessor(ABC):
             import traceback
             traceback.print_exc()
             sys.exit(1)
-
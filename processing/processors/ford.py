@@ -13,12 +13,165 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.config import FORD_EXCEL_PATTERN
+from processing.schema import ColumnSpec, OEMSchema
+from processing.comparison_sql import ComparisonField
 from .base_oem import BaseOEMProcessor
 
+# Ford Dealer Report columns (sanitized names, in report order).
+# Date columns arrive as MM/DD/YYYY text; Estimated_Arrival_Week is a week
+# label and is kept as text. VIN8 (the last 8 characters of VIN) is loaded
+# as-is: ford_oem_orders has always had it.
+FORD_SCHEMA = OEMSchema([
+    ColumnSpec("Order_Number"),
+    ColumnSpec("Model_Year", "int64"),
+    ColumnSpec("Vehicle_Line", dictionary=True),
+    ColumnSpec("Body_Code", dictionary=True),
+    ColumnSpec("VIN"),
+    ColumnSpec("Last_Updated", "date"),
+    ColumnSpec("Status_Last_Updated", "date"),
+    ColumnSpec("Primary_Status", dictionary=True),
+    ColumnSpec("Secondary_Status", dictionary=True),
+    ColumnSpec("Estimated_Arrival_Week", dictionary=True),
+    ColumnSpec("Last_Location"),
+    ColumnSpec("Last_Location_Name"),
+    ColumnSpec("Last_Location_Code"),
+    ColumnSpec("Last_Location_Address"),
+    ColumnSpec("Last_Location_Date", "date"),
+    ColumnSpec("Conveyance", dictionary=True),
+    ColumnSpec("Ordering_Fin_Name", dictionary=True),
+    ColumnSpec("Ordering_FIN", dictionary=True),
+    ColumnSpec("End_User_Fin_Name", dictionary=True),
+    ColumnSpec("End_User_FIN", dictionary=True),
+    ColumnSpec("Customer_Name", dictionary=True),
+    ColumnSpec("Purchase_Order_Number"),
+    ColumnSpec("Special_Order_Number"),
+    ColumnSpec("Ship_Thru_Location", dictionary=True),
+    ColumnSpec("Ship_Thru_Plant", dictionary=True),
+    ColumnSpec("Final_Ramp", dictionary=True),
+    ColumnSpec("Order_Received", "date"),
+    ColumnSpec("Priority_Code", dictionary=True),
+    ColumnSpec("Fleet_Numeric_Priority_Code", dictionary=True),
+    ColumnSpec("Scheduled_Date", "date"),
+    ColumnSpec("Last_Updated_Estimated_Build_Date", "date"),
+    ColumnSpec("Estimated_Build_Date", "date"),
+    ColumnSpec("Plant_Date", "date"),
+    ColumnSpec("Produced_Date", "date"),
+    ColumnSpec("Released_Date", "date"),
+    ColumnSpec("Shipped_Date", "date"),
+    ColumnSpec("Ship_Through_Received_Date", "date"),
+    ColumnSpec("Ship_Through_Started_Date", "date"),
+    ColumnSpec("Ship_Through_Completed_Date", "date"),
+    ColumnSpec("Delivered_Date", "date"),
+    ColumnSpec("Upfitter_Estimated_Start_Date", "date"),
+    ColumnSpec("Upfitter_Estimated_Completion_Date", "date"),
+    ColumnSpec("Post_Delivered_Upfitting", dictionary=True),
+    ColumnSpec("Post_Delivered_Upfitting_Last_Updated", "date"),
+    ColumnSpec("Ordering_Dealer_Code", dictionary=True),
+    ColumnSpec("Ordering_Dealer_Name", dictionary=True),
+    ColumnSpec("Ordering_Dealer_Street", dictionary=True),
+    ColumnSpec("Ordering_Dealer_City", dictionary=True),
+    ColumnSpec("Ordering_Dealer_State_Province", dictionary=True),
+    ColumnSpec("Ordering_Dealer_Zip_Postal_Code", dictionary=True),
+    ColumnSpec("Ship_to_Dealer_Code"),
+    ColumnSpec("Ship_To_Name"),
+    ColumnSpec("Ship_To_Street"),
+    ColumnSpec("Ship_To_City"),
+    ColumnSpec("Ship_To_State_Province", dictionary=True),
+    ColumnSpec("Ship_To_Zip_Postal_Code"),
+    ColumnSpec("Engine", dictionary=True),
+    ColumnSpec("Wheelbase", dictionary=True),
+    ColumnSpec("Paint", dictionary=True),
+    ColumnSpec("Interior_Trims", dictionary=True),
+    ColumnSpec("Seat_Trim", dictionary=True),
+    ColumnSpec("All_Interior_Trim_Colors", dictionary=True),
+    # Columns added in later reports
+    ColumnSpec("Body_Code_Description", dictionary=True),
+    ColumnSpec("Customer_First_Initial", dictionary=True),
+    ColumnSpec("Order_Type_Code", dictionary=True),
+    ColumnSpec("Fleet_Incentive_Program", dictionary=True),
+    ColumnSpec("PEP_TCO_Code", dictionary=True),
+    ColumnSpec("Gross_Vehicle_Weight", dictionary=True),
+    ColumnSpec("Order_Key"),
+    ColumnSpec("VIN8"),
+])
+
+
+# Composite key identifying an order across snapshots (hashed into _row_key)
+FORD_KEY_COLUMNS = ("Order_Number", "Body_Code", "Model_Year", "Customer_Name", "VIN")
+
+# Fields compared between snapshots by the field comparison queries, in query
+# order, with the db_orders column each is cross-verified against and how
+# (date: the same day in another format also matches). The comparison
+# queries are generated from this manifest (see processing.comparison_sql)
+FORD_FIELD_MANIFEST = (
+    ComparisonField("Order_Number", "orderNo"),
+    ComparisonField("Model_Year", "modelYear"),
+    ComparisonField("Vehicle_Line", "model"),
+    ComparisonField("Body_Code", "bodyCode"),
+    ComparisonField("Body_Code_Description"),
+    ComparisonField("VIN", "vin"),
+    ComparisonField("Last_Updated"),
+    ComparisonField("Status_Last_Updated"),
+    ComparisonField("Primary_Status"),
+    ComparisonField("Secondary_Status", "stage"),
+    ComparisonField("Estimated_Arrival_Week", "chassisEta", "date"),
+    ComparisonField("Last_Location"),
+    ComparisonField("Last_Location_Name"),
+    ComparisonField("Last_Location_Code"),
+    ComparisonField("Last_Location_Address"),
+    ComparisonField("Last_Location_Date"),
+    ComparisonField("Conveyance"),
+    ComparisonField("Ordering_Fin_Name", "customer"),
+    ComparisonField("Ordering_FIN"),
+    ComparisonField("End_User_Fin_Name", "customer"),
+    ComparisonField("End_User_FIN"),
+    ComparisonField("Customer_Name", "customer"),
+    ComparisonField("Customer_First_Initial"),
+    ComparisonField("Purchase_Order_Number", "po"),
+    ComparisonField("Special_Order_Number"),
+    ComparisonField("Order_Type_Code"),
+    ComparisonField("Fleet_Incentive_Program"),
+    ComparisonField("PEP_TCO_Code"),
+    ComparisonField("Ship_Thru_Location", "shipThruLocation"),
+    ComparisonField("Ship_Thru_Plant"),
+    ComparisonField("Final_Ramp"),
+    ComparisonField("Order_Received", "orderDate", "date"),
+    ComparisonField("Priority_Code"),
+    ComparisonField("Fleet_Numeric_Priority_Code"),
+    ComparisonField("Scheduled_Date", "chassisEta", "date"),
+    ComparisonField("Last_Updated_Estimated_Build_Date", "chassisEta", "date"),
+    ComparisonField("Estimated_Build_Date", "chassisEta", "date"),
+    ComparisonField("Plant_Date", "chassisEta", "date"),
+    ComparisonField("Produced_Date", "chassisEta", "date"),
+    ComparisonField("Released_Date", "chassisEta", "date"),
+    ComparisonField("Shipped_Date", "finalEta", "date"),
+    ComparisonField("Ship_Through_Received_Date"),
+    ComparisonField("Ship_Through_Started_Date"),
+    ComparisonField("Ship_Through_Completed_Date"),
+    ComparisonField("Delivered_Date", "finalEta", "date"),
+    ComparisonField("Upfitter_Estimated_Start_Date"),
+    ComparisonField("Upfitter_Estimated_Completion_Date"),
+    ComparisonField("Post_Delivered_Upfitting"),
+    ComparisonField("Post_Delivered_Upfitting_Last_Updated"),
+    ComparisonField("Ordering_Dealer_Code"),
+    ComparisonField("Ordering_Dealer_Name"),
+)
+
+# Compared field names (hashed into _row_hash)
+FORD_COMPARISON_FIELDS = tuple(field.name for field in FORD_FIELD_MANIFEST)
+
+# Fields making up the order code matched against db_orders (plus "ford")
+FORD_DB_CODE_FIELDS = ("Order_Number", "Body_Code", "Model_Year")
+
 
 class FordProcessor(BaseOEMProcessor):
     """Processor for converting Ford Dealer Report Excel files to CSV"""
     
+    SCHEMA = FORD_SCHEMA
+    ROW_KEY_COLUMNS = FORD_KEY_COLUMNS
+    ROW_HASH_COLUMNS = FORD_COMPARISON_FIELDS
+    TIE_BREAK_COLUMN = "Last_Updated"
+    
     def __init__(self, input_dir: Optional[Path] = None, output_dir: Optional[Path] = None):
         """
         Initialize FordProcessor
@@ -71,44 +224,8 @@ class FordProcessor(BaseOEMProcessor):
         Returns:
             Processed DataFrame
         """
-        # Convert date columns from MM/DD/YYYY to YYYY-MM-DD format for BigQuery compatibility
-        # List of date column names that should be converted
-        date_columns = [
-            'Last_Updated', 'Status_Last_Updated', 'Last_Location_Date',
-            'Order_Received', 'Scheduled_Date', 'Last_Updated_Estimated_Build_Date',
-            'Estimated_Build_Date', 'Plant_Date', 'Produced_Date', 'Released_Date',
-            'Shipped_Date', 'Ship_Through_Received_Date', 'Ship_Through_Started_Date',
-            'Ship_Through_Completed_Date', 'Delivered_Date', 'Upfitter_Estimated_Start_Date',
-            'Upfitter_Estimated_Completion_Date', 'Post_Delivered_Upfitting_Last_Updated'
-        ]
-        
-        from datetime import datetime
-        
-        for col in date_columns:
-            if col in df.columns:
-                def convert_date(value):
-                    if pd.isna(value) or value == '' or value is None:
-                        return None
-                    value_str = str(value).strip()
-                    if not value_str:
-                        return None
-                    # Try to parse MM/DD/YYYY format
-                    try:
-                        # Try MM/DD/YYYY format
-                        date_obj = datetime.strptime(value_str, '%m/%d/%Y')
-                        return date_obj.strftime('%Y-%m-%d')
-                    except ValueError:
-                        try:
-                            # Try YYYY-MM-DD format (already correct)
-                            date_obj = datetime.strptime(value_str, '%Y-%m-%d')
-                            return value_str  # Already in correct format
-                        except ValueError:
-                            # If can't parse, return as-is (will be NULL in BigQuery)
-                            return None
-                
-                # Convert the column
-                df[col] = df[col].apply(convert_date)
-        
+        # Date columns are already parsed by apply_schema() (FORD_SCHEMA), and
+        # are written as YYYY-MM-DD. Unparseable values become NULL in BigQuery
         return df
 
 
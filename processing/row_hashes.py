@@ -0,0 +1,182 @@
+"""
+Row hashes - Precomputed row-key and row-content hash columns
+
+Every processed OEM row gets three INT64 columns:
+- _row_key: hash of the columns that identify an order (for Ford:
+  Order_Number, Body_Code, Model_Year, Customer_Name, VIN)
+- _row_hash: hash of the business fields that are compared between snapshots.
+  Only for the comparison queries: a change to any other column (Paint,
+  Ship_To_*, ...) leaves it unchanged, so it must not identify row versions
+- _content_hash: hash of every report column, identifying a row version in
+  history and delta loads (see content_hash())
+
+Comparison queries join snapshots on _row_key and skip rows whose _row_hash is
+unchanged, instead of evaluating COALESCE(CAST(... AS STRING), '') per key
+column and a CASE per field for every row.
+
+The hash is the first 60 bits of the SHA-256 of the values rendered as
+BigQuery's CAST(... AS STRING) would (NULL as ''), joined with a unit
+separator, so it fits a non-negative INT64 and rows already in BigQuery can
+be backfilled with the expressions from hash_columns_sql() and
+content_hash_sql().
+"""
+
+import hashlib
+from operator import methodcaller
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# Joins the values of one row before hashing (can't occur in report text)
+HASH_SEPARATOR = "\x1f"
+
+# Separates a column name from its value in the content hash
+NAME_SEPARATOR = "\x1e"
+
+# Hex digits of the SHA-256 kept (15 hex digits = 60 bits, always a positive INT64)
+HASH_HEX_DIGITS = 15
+
+
+def canonical_strings(series: pd.Series, missing: Optional[str] = "") -> pd.Series:
+    """
+    Render a column as plain Python strings, independent of its dtype
+
+    Dates become YYYY-MM-DD whether they are datetime64 or Arrow date32,
+    integers have no decimal point, categoricals become their values, and
+    missing values become empty strings by default (the CSV output doesn't
+    distinguish them either).
+
+    Args:
+        series: Processed column
+        missing: Value for missing cells (None keeps them as None)
+
+    Returns:
+        Object Series of strings
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype) or (
+        isinstance(series.dtype, pd.ArrowDtype) and series.dtype.kind == "M"
+    ):
+        strings = series.dt.strftime("%Y-%m-%d")
+    else:
+        strings = series.astype("string")
+    return strings.astype(object).where(series.notna(), missing)
+
+
+def hash_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.Series:
+    """
+    Hash the given columns of every row into a non-negative int64
+
+    Columns missing from df hash as NULL, like columns a table has but a
+    report doesn't.
+
+    Args:
+        df: Processed DataFrame
+        columns: Columns to hash, in a fixed order
+
+    Returns:
+        int64 Series aligned with df
+    """
+    columns = list(columns)
+    if not columns or df.empty:
+        return pd.Series(0, index=df.index, dtype="int64")
+
+    parts = [
+        canonical_strings(df[column]) if column in df.columns else pd.Series("", index=df.index, dtype=object)
+        for column in columns
+    ]
+    joined = parts[0].str.cat(parts[1:], sep=HASH_SEPARATOR) if len(parts) > 1 else parts[0]
+    return hash_strings(joined)
+
+
+def hash_strings(values: pd.Series) -> pd.Series:
+    """
+    Hash strings into non-negative int64s (first 60 bits of their SHA-256)
+
+    There is no vectorized SHA-256 in pandas / numpy, so each value still
+    goes through hashlib, but only for the digest: the encoding runs in
+    pandas and the 60 bits are extracted from all digests at once with
+    numpy instead of formatting and parsing a hex string per row.
+
+    Args:
+        values: Strings to hash
+
+    Returns:
+        int64 Series aligned with values
+    """
+    digests = b"".join(map(methodcaller("digest"), map(hashlib.sha256, values.str.encode("utf-8"))))
+    # First 8 bytes of each 32-byte digest, big-endian, minus the 4 bits past the kept hex digits
+    leading = np.frombuffer(digests, dtype=">u8").reshape(-1, 4)[:, 0] >> np.uint64(64 - 4 * HASH_HEX_DIGITS)
+    return pd.Series(leading.astype("int64"), index=values.index)
+
+
+def content_hash(df: pd.DataFrame, columns: Iterable[str]) -> pd.Series:
+    """
+    Hash every given column of each row, identifying row versions
+
+    Unlike hash_columns(), each non-empty value is hashed with its column
+    name, in column name order, and empty values are left out. The hash
+    therefore doesn't depend on the column order, and doesn't change when a
+    report gains a column that is empty, so versions stay comparable with
+    rows loaded before the column existed.
+
+    Args:
+        df: Processed DataFrame
+        columns: Report columns to hash (metadata and row hash columns excluded)
+
+    Returns:
+        int64 Series aligned with df
+    """
+    columns = sorted(column for column in columns if column in df.columns)
+    if df.empty:
+        return pd.Series(0, index=df.index, dtype="int64")
+
+    joined = pd.Series("", index=df.index, dtype=object)
+    for column in columns:
+        strings = canonical_strings(df[column])
+        joined = joined + (column + NAME_SEPARATOR + strings + HASH_SEPARATOR).where(strings != "", "")
+    return hash_strings(joined)
+
+
+def hash_columns_sql(columns: Iterable[str], table_alias: Optional[str] = None) -> str:
+    """
+    BigQuery expression computing the same hash as hash_columns()
+
+    Args:
+        columns: Columns to hash, in the same order as for hash_columns()
+        table_alias: Optional table alias to qualify the column names with
+
+    Returns:
+        SQL expression evaluating to INT64
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    values = ",\n        ".join(f"COALESCE(CAST({prefix}{column} AS STRING), '')" for column in columns)
+    return (
+        "CAST(CONCAT('0x', SUBSTR(TO_HEX(SHA256(ARRAY_TO_STRING([\n"
+        f"        {values}\n"
+        f"    ], '\\x1f'))), 1, {HASH_HEX_DIGITS})) AS INT64)"
+    )
+
+
+def content_hash_sql(columns: Iterable[str], table_alias: Optional[str] = None) -> str:
+    """
+    BigQuery expression computing the same hash as content_hash()
+
+    Args:
+        columns: Report columns to hash (any order)
+        table_alias: Optional table alias to qualify the column names with
+
+    Returns:
+        SQL expression evaluating to INT64
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    values = ",\n        ".join(
+        f"IF(COALESCE(CAST({prefix}{column} AS STRING), '') = '', '', "
+        f"CONCAT('{column}\\x1e', CAST({prefix}{column} AS STRING), '\\x1f'))"
+        for column in sorted(columns)
+    )
+    return (
+        "CAST(CONCAT('0x', SUBSTR(TO_HEX(SHA256(ARRAY_TO_STRING([\n"
+        f"        {values}\n"
+        f"    ], ''))), 1, {HASH_HEX_DIGITS})) AS INT64)"
+    )
@@ -0,0 +1,196 @@
+"""
+Ingestion schema - Declarative per-OEM column definitions
+
+Each OEM processor declares the columns it expects (by sanitized column name)
+with a target dtype, the date formats to parse, and whether the column is kept.
+The schema drives:
+- Column projection when reading Excel (dropped columns are never loaded)
+- Typed conversion right after reading (dates, integers)
+- Optionally, Arrow-backed string columns, dictionary-encoding low-cardinality ones
+- Parquet column types and the explicit BigQuery SchemaField list for new tables
+
+Columns that appear in a report but not in the schema are kept as strings, so a
+new column in the source file is never silently lost.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import pandas as pd
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from processing.utils import parse_date_series, DEFAULT_DATE_FORMATS
+
+# Supported target dtypes -> BigQuery column types
+BIGQUERY_TYPES = {
+    "string": "STRING",
+    "int64": "INT64",
+    "date": "DATE",
+    "timestamp": "TIMESTAMP",
+}
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Definition of one output column"""
+
+    name: str
+    dtype: str = "string"
+    date_formats: tuple = DEFAULT_DATE_FORMATS
+    keep: bool = True
+    # Few distinct values (statuses, codes): dictionary-encode in Arrow mode
+    dictionary: bool = False
+
+    def __post_init__(self):
+        if self.dtype not in BIGQUERY_TYPES:
+            raise ValueError(f"Unsupported dtype '{self.dtype}' for column {self.name}")
+
+
+# Metadata columns added by BaseOEMProcessor.add_metadata_columns()
+METADATA_COLUMNS = [
+    ColumnSpec("_source_filename"),
+    ColumnSpec("_source_file_created_timestamp", "timestamp"),
+    ColumnSpec("_source_file_date", "date"),
+]
+
+# Row hash columns added by BaseOEMProcessor.add_row_hash_columns()
+DERIVED_COLUMNS = [
+    ColumnSpec("_row_key", "int64"),
+    ColumnSpec("_row_hash", "int64"),
+    ColumnSpec("_content_hash", "int64"),
+]
+
+
+def to_arrow_strings(series: pd.Series, dictionary: bool = False) -> pd.Series:
+    """
+    Convert a string column to string[pyarrow], or a categorical of string[pyarrow]
+
+    Args:
+        series: Column of strings (any string or object dtype)
+        dictionary: Dictionary-encode the column (for low-cardinality values)
+
+    Returns:
+        Arrow-backed Series
+    """
+    series = series.astype(pd.StringDtype("pyarrow"))
+    if dictionary:
+        return series.astype("category")
+    return series
+
+
+def to_arrow_dates(series: pd.Series) -> pd.Series:
+    """
+    Convert a datetime64 column to an Arrow date32 column
+
+    Args:
+        series: datetime64 Series (NaT for missing)
+
+    Returns:
+        Series with ArrowDtype(date32)
+    """
+    import pyarrow as pa
+
+    array = pa.array(series, from_pandas=True).cast(pa.date32())
+    return pd.Series(array, index=series.index, dtype=pd.ArrowDtype(pa.date32()))
+
+
+class OEMSchema:
+    """Ordered collection of ColumnSpecs for one OEM report"""
+
+    def __init__(self, columns: Iterable[ColumnSpec]):
+        """
+        Initialize OEM schema
+
+        Args:
+            columns: Column definitions (sanitized column names)
+        """
+        self.columns = list(columns)
+        self._by_name = {spec.name: spec for spec in self.columns}
+        for spec in METADATA_COLUMNS + DERIVED_COLUMNS:
+            self._by_name.setdefault(spec.name, spec)
+
+    def get(self, name: str) -> Optional[ColumnSpec]:
+        """Get the spec for a column (including metadata and row hash columns), or None if undeclared"""
+        return self._by_name.get(name)
+
+    def columns_of_type(self, dtype: str) -> list[str]:
+        """Get the names of kept report columns with the given dtype"""
+        return [spec.name for spec in self.columns if spec.keep and spec.dtype == dtype]
+
+    def is_kept(self, name: str) -> bool:
+        """Check whether a column is kept (undeclared columns are kept)"""
+        spec = self.get(name)
+        return spec is None or spec.keep
+
+    def kept_columns(self) -> list[str]:
+        """Get the names of report columns the schema keeps"""
+        return [spec.name for spec in self.columns if spec.keep]
+
+    def dropped_columns(self) -> list[str]:
+        """Get the names of columns the schema drops"""
+        return [spec.name for spec in self.columns if not spec.keep]
+
+    def apply(self, df: pd.DataFrame, warn_unknown: bool = True, arrow_strings: bool = False) -> pd.DataFrame:
+        """
+        Drop unkept columns and convert columns to their target dtypes
+
+        Dates become datetime64 (unparseable values become NaT) and integers
+        become nullable Int64 (non-numeric values become NA), so they are not
+        round-tripped through strings later in the pipeline.
+
+        With arrow_strings, string columns become string[pyarrow] and columns
+        marked dictionary=True become categoricals (pandas' dictionary encoding,
+        written to Arrow as dictionary arrays), and dates become Arrow date32.
+
+        Args:
+            df: DataFrame with sanitized column names, all values as strings
+            warn_unknown: Print a warning for columns not declared in the schema
+            arrow_strings: Use Arrow-backed / dictionary-encoded columns
+
+        Returns:
+            Typed DataFrame
+        """
+        dropped = [column for column in df.columns if not self.is_kept(column)]
+        if dropped:
+            df = df.drop(columns=dropped)
+
+        unknown = [column for column in df.columns if self.get(column) is None]
+        if unknown and warn_unknown:
+            print(f"⚠ {len(unknown)} column(s) not in schema, kept as strings: {', '.join(unknown)}")
+
+        for column in df.columns:
+            spec = self.get(column)
+            if spec is None or spec.dtype == "string":
+                if arrow_strings:
+                    df[column] = to_arrow_strings(df[column], dictionary=spec is not None and spec.dictionary)
+                continue
+            if spec.dtype == "date":
+                df[column] = parse_date_series(df[column], spec.date_formats)
+                if arrow_strings:
+                    df[column] = to_arrow_dates(df[column])
+            elif spec.dtype == "int64":
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+            elif spec.dtype == "timestamp":
+                df[column] = pd.to_datetime(df[column], errors="coerce")
+        return df
+
+    def bigquery_type(self, name: str) -> str:
+        """Get the BigQuery type for a column (STRING if undeclared)"""
+        spec = self.get(name)
+        return BIGQUERY_TYPES[spec.dtype] if spec else "STRING"
+
+    def bigquery_schema(self, columns: list[str]) -> list:
+        """
+        Build an explicit BigQuery schema for an output file's columns
+
+        Args:
+            columns: Output column names, in file order
+
+        Returns:
+            List of bigquery.SchemaField (all NULLABLE)
+        """
+        from google.cloud import bigquery
+
+        return [bigquery.SchemaField(column, self.bigquery_type(column), mode="NULLABLE") for column in columns]
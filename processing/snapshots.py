@@ -0,0 +1,206 @@
+"""
+Snapshot fingerprints - Detect daily OEM reports that are unchanged from the previous day
+
+Consecutive daily reports are often identical apart from their file metadata.
+After process_dataframe(), every report gets a canonical row-set fingerprint:
+a SHA-256 over the column names and the sorted per-row hashes, so row order,
+the dtype mode (--arrow-strings) and the output format don't affect it, and
+the metadata columns (_source_filename, ...) are left out.
+
+Fingerprints of snapshots loaded to BigQuery are recorded in a BigQuery
+table shared by every host (see BigQueryLoader.record_snapshot_fingerprint)
+and in a local JSON registry, used when BigQuery has no earlier fingerprint.
+When a report's fingerprint matches the previous loaded date, the pipeline
+records a "same as <date>" alias instead of loading the rows again, and
+readers resolve the alias to the date that holds the rows.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.config import SNAPSHOT_REGISTRY_PATH
+from processing.schema import METADATA_COLUMNS, DERIVED_COLUMNS
+from processing.row_hashes import canonical_strings
+
+
+def row_hashes(df: pd.DataFrame, exclude: Iterable[str] = ()) -> np.ndarray:
+    """
+    Hash every row of a processed DataFrame
+
+    Args:
+        df: Processed DataFrame
+        exclude: Columns to leave out (metadata and row hash columns are always left out)
+
+    Returns:
+        uint64 array with one hash per row
+    """
+    skip = set(exclude) | {spec.name for spec in METADATA_COLUMNS + DERIVED_COLUMNS}
+    columns = sorted(column for column in df.columns if column not in skip)
+    canonical = pd.DataFrame({column: canonical_strings(df[column]) for column in columns}, index=df.index)
+    return pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+
+
+def fingerprint_rows(columns: Iterable[str], hashes: np.ndarray) -> str:
+    """
+    Combine column names and per-row hashes into an order-independent fingerprint
+
+    Args:
+        columns: Column names of the snapshot (metadata and row hash columns are ignored)
+        hashes: Row hashes from row_hashes(), possibly concatenated from chunks
+
+    Returns:
+        SHA-256 hex digest
+    """
+    metadata = {spec.name for spec in METADATA_COLUMNS + DERIVED_COLUMNS}
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(sorted(column for column in columns if column not in metadata)).encode("utf-8"))
+    digest.update(np.sort(np.asarray(hashes, dtype=np.uint64)).tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_dataframe(df: pd.DataFrame) -> str:
+    """
+    Compute the row-set fingerprint of a processed DataFrame
+
+    Args:
+        df: Processed DataFrame
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return fingerprint_rows(df.columns, row_hashes(df))
+
+
+class SnapshotRegistry:
+    """Local JSON registry of loaded snapshot fingerprints, per OEM and date"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize snapshot registry
+
+        Args:
+            path: Registry file. Defaults to config SNAPSHOT_REGISTRY_PATH
+        """
+        self.path = Path(path or SNAPSHOT_REGISTRY_PATH)
+
+    def _read(self) -> dict:
+        """Read the registry file (empty if missing or unreadable)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠ Warning: Could not read snapshot registry {self.path}: {e}")
+            return {}
+
+    def _write(self, registry: dict):
+        """Write the registry file atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(registry, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get(self, oem_name: str, snapshot_date: str) -> Optional[dict]:
+        """
+        Get the registry entry for a snapshot
+
+        Args:
+            oem_name: OEM name (e.g., "Ford")
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+
+        Returns:
+            Entry with fingerprint, rows, same_as and recorded_at, or None
+        """
+        return self._read().get(oem_name.lower(), {}).get(snapshot_date)
+
+    def previous(self, oem_name: str, snapshot_date: str) -> Optional[tuple[str, dict]]:
+        """
+        Get the latest snapshot recorded before a date
+
+        Args:
+            oem_name: OEM name
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+
+        Returns:
+            Tuple of (date, entry), or None if there is no earlier snapshot
+        """
+        entries = self._read().get(oem_name.lower(), {})
+        earlier = [date for date in entries if date < snapshot_date]
+        if not earlier:
+            return None
+        date = max(earlier)
+        return date, entries[date]
+
+    def resolve(self, oem_name: str, snapshot_date: str) -> str:
+        """
+        Follow "same as" aliases to the date whose rows were loaded
+
+        Args:
+            oem_name: OEM name
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+
+        Returns:
+            Date holding the rows (snapshot_date itself if it is not an alias)
+        """
+        entries = self._read().get(oem_name.lower(), {})
+        seen = set()
+        while snapshot_date in entries and entries[snapshot_date].get("same_as") and snapshot_date not in seen:
+            seen.add(snapshot_date)
+            snapshot_date = entries[snapshot_date]["same_as"]
+        return snapshot_date
+
+    def unchanged_since(self, oem_name: str, snapshot_date: str, fingerprint: str) -> Optional[str]:
+        """
+        Check whether a snapshot is identical to the previous recorded one
+
+        Args:
+            oem_name: OEM name
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+            fingerprint: Fingerprint of the new snapshot
+
+        Returns:
+            Date holding the identical rows (aliases resolved), or None if the
+            snapshot changed or there is no previous snapshot
+        """
+        previous = self.previous(oem_name, snapshot_date)
+        if previous is None or previous[1].get("fingerprint") != fingerprint:
+            return None
+        return self.resolve(oem_name, previous[0])
+
+    def record(
+        self,
+        oem_name: str,
+        snapshot_date: str,
+        fingerprint: str,
+        rows: int,
+        same_as: Optional[str] = None
+    ):
+        """
+        Record a loaded (or aliased) snapshot
+
+        Args:
+            oem_name: OEM name
+            snapshot_date: Snapshot date in YYYY-MM-DD format
+            fingerprint: Row-set fingerprint
+            rows: Number of rows in the snapshot
+            same_as: Date whose rows this snapshot reuses, if it was not loaded
+        """
+        registry = self._read()
+        registry.setdefault(oem_name.lower(), {})[snapshot_date] = {
+            "fingerprint": fingerprint,
+            "rows": rows,
+            "same_as": same_as,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        self._write(registry)
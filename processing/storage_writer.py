@@ -0,0 +1,215 @@
+"""
+Storage Write API ingestion - Write processed Arrow tables straight into BigQuery tables
+
+A load job reads a file that was first written to disk and uploaded to GCS.
+The Storage Write API takes the rows directly: the processed DataFrame is
+converted to Arrow (BaseOEMProcessor.to_arrow_table) and its record batches
+are appended to a write stream, so the data is queryable without a CSV
+write or a GCS hop.
+
+Write modes:
+- "pending": batches are buffered in a pending stream and committed
+  together when the stream is finalized, so a file's rows appear at once
+  or not at all
+- "committed": every batch is visible as soon as it is appended; a failure
+  part way leaves the batches written before it
+
+StorageWriter talks to BigQuery (needs google-cloud-bigquery-storage);
+FakeStorageWriter keeps the committed tables in memory with the same
+interface, for tests and dry runs. Neither creates tables or adds columns:
+the destination must already have every column (see
+BigQueryLoader.write_ford_oem_arrow).
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+WRITE_MODES = ("pending", "committed")
+
+# Rows per appended record batch (an append request is limited to 10 MB)
+DEFAULT_BATCH_ROWS = 10_000
+
+
+def prepare_arrow_table(table):
+    """
+    Convert an Arrow table to the types the Storage Write API maps to the BigQuery columns
+    
+    Arrow timestamps without a time zone are written as DATETIME, so they
+    are marked UTC to land in TIMESTAMP columns; dictionary-encoded columns
+    are decoded to plain strings.
+    
+    Args:
+        table: pyarrow Table (e.g. from BaseOEMProcessor.to_arrow_table)
+    
+    Returns:
+        pyarrow Table ready to be written
+    """
+    import pyarrow as pa
+    
+    columns = []
+    fields = []
+    for field, column in zip(table.schema, table.columns):
+        arrow_type = field.type
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if pa.types.is_timestamp(arrow_type) and arrow_type.tz is None:
+            arrow_type = pa.timestamp(arrow_type.unit, tz="UTC")
+        columns.append(column if arrow_type == field.type else column.cast(arrow_type))
+        fields.append(pa.field(field.name, arrow_type))
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+
+def _check_mode(mode: str):
+    """Raise ValueError for an unknown write mode"""
+    if mode not in WRITE_MODES:
+        raise ValueError(f"Unsupported write mode '{mode}' (expected one of {WRITE_MODES})")
+
+
+class StorageWriter:
+    """Writes Arrow tables to BigQuery tables through the Storage Write API"""
+    
+    def __init__(self, project_id: str, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS):
+        """
+        Initialize storage writer
+        
+        Args:
+            project_id: GCP project ID
+            dataset_id: BigQuery dataset ID
+            batch_rows: Rows per appended record batch
+        """
+        from google.cloud import bigquery_storage_v1
+        
+        self.project_id = project_id
+        self.dataset_id = dataset_id
+        self.batch_rows = batch_rows
+        self.client = bigquery_storage_v1.BigQueryWriteClient()
+    
+    def write_table(self, table_id: str, table, mode: str = "pending") -> int:
+        """
+        Append an Arrow table to a BigQuery table
+        
+        Args:
+            table_id: Destination table (must exist with every column of table)
+            table: pyarrow Table
+            mode: "pending" (commit all rows at once) or "committed"
+        
+        Returns:
+            Number of rows written
+        
+        Raises:
+            RuntimeError: If the stream could not be committed
+        """
+        from google.cloud.bigquery_storage_v1 import types, writer
+        
+        _check_mode(mode)
+        table = prepare_arrow_table(table)
+        parent = self.client.table_path(self.project_id, self.dataset_id, table_id)
+        stream_type = types.WriteStream.Type.PENDING if mode == "pending" else types.WriteStream.Type.COMMITTED
+        write_stream = self.client.create_write_stream(
+            parent=parent, write_stream=types.WriteStream(type_=stream_type)
+        )
+        
+        # The first request of the connection carries the stream name and Arrow schema
+        request_template = types.AppendRowsRequest(
+            write_stream=write_stream.name,
+            arrow_rows=types.AppendRowsRequest.ArrowData(
+                writer_schema=types.ArrowSchema(serialized_schema=table.schema.serialize().to_pybytes())
+            ),
+        )
+        append_rows_stream = writer.AppendRowsStream(self.client, request_template)
+        try:
+            offset = 0
+            futures = []
+            for batch in table.to_batches(max_chunksize=self.batch_rows):
+                # Offsets make a retried append fail instead of writing rows twice
+                request = types.AppendRowsRequest(
+                    offset=offset,
+                    arrow_rows=types.AppendRowsRequest.ArrowData(
+                        rows=types.ArrowRecordBatch(serialized_record_batch=batch.serialize().to_pybytes())
+                    ),
+                )
+                futures.append(append_rows_stream.send(request))
+                offset += batch.num_rows
+            for future in futures:
+                future.result()
+        finally:
+            append_rows_stream.close()
+        
+        self.client.finalize_write_stream(name=write_stream.name)
+        if mode == "pending":
+            response = self.client.batch_commit_write_streams(
+                types.BatchCommitWriteStreamsRequest(parent=parent, write_streams=[write_stream.name])
+            )
+            if response.stream_errors:
+                errors = "; ".join(error.error_message for error in response.stream_errors)
+                raise RuntimeError(f"Write stream of {table_id} was not committed: {errors}")
+        return offset
+
+
+class FakeStorageWriter:
+    """In-memory stand-in for StorageWriter (tests and dry runs)"""
+    
+    def __init__(self, batch_rows: int = DEFAULT_BATCH_ROWS, fail_after_batches: Optional[int] = None):
+        """
+        Initialize fake storage writer
+        
+        Args:
+            batch_rows: Rows per appended record batch
+            fail_after_batches: Raise after appending this many batches of a
+                                table (simulates a failure part way)
+        """
+        self.batch_rows = batch_rows
+        self.fail_after_batches = fail_after_batches
+        # Committed record batches per table
+        self.tables: dict[str, list] = {}
+    
+    def write_table(self, table_id: str, table, mode: str = "pending") -> int:
+        """
+        Append an Arrow table to an in-memory table (same contract as StorageWriter.write_table)
+        
+        Batches go through Arrow IPC serialization like the real requests.
+        
+        Args:
+            table_id: Destination table
+            table: pyarrow Table
+            mode: "pending" or "committed"
+        
+        Returns:
+            Number of rows written
+        """
+        import pyarrow as pa
+        
+        _check_mode(mode)
+        table = prepare_arrow_table(table)
+        schema_bytes = table.schema.serialize()
+        committed = self.tables.setdefault(table_id, [])
+        pending = []
+        rows = 0
+        for number, batch in enumerate(table.to_batches(max_chunksize=self.batch_rows)):
+            if self.fail_after_batches is not None and number >= self.fail_after_batches:
+                raise RuntimeError(f"Simulated append failure after {number} batch(es) of {table_id}")
+            received = pa.ipc.read_record_batch(batch.serialize(), pa.ipc.read_schema(schema_bytes))
+            (pending if mode == "pending" else committed).append(received)
+            rows += batch.num_rows
+        committed.extend(pending)
+        return rows
+    
+    def read_table(self, table_id: str):
+        """
+        Get the committed rows of a table
+        
+        Args:
+            table_id: Destination table
+        
+        Returns:
+            pyarrow Table, or None if nothing was committed
+        """
+        import pyarrow as pa
+        
+        batches = self.tables.get(table_id)
+        if not batches:
+            return None
+        return pa.Table.from_batches(batches)
@@ -5,9 +5,13 @@ Shared utility functions for SHAED Order ELT
 import json
 import os
 import re
+import struct
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+import pandas as pd
 from google.cloud import storage
 
 import sys
@@ -65,6 +69,60 @@ def clean_value(value: Any) -> str:
     return str(value)
 
 
+# Date formats accepted in OEM reports, tried in order
+DEFAULT_DATE_FORMATS = ('%m/%d/%Y', '%Y-%m-%d')
+
+
+def parse_date_series(series: pd.Series, formats: Iterable[str] = DEFAULT_DATE_FORMATS) -> pd.Series:
+    """
+    Parse a column of date strings with a list of formats (vectorized)
+    
+    Each format is parsed column-wise with pd.to_datetime(errors="coerce") and
+    the results are combined so the first format that matches a cell wins.
+    Empty or unparseable values become NaT. Report date columns repeat a small
+    set of values, so only the distinct values are parsed and the result is
+    expanded back with the factorized codes.
+    
+    Args:
+        series: Column of date strings
+        formats: strptime-style formats to try, in order
+        
+    Returns:
+        datetime64 Series
+    """
+    codes, uniques = pd.factorize(series.astype("string").str.strip())
+    uniques = pd.Series(uniques, dtype="string")
+    
+    parsed = None
+    for fmt in formats:
+        attempt = pd.to_datetime(uniques, format=fmt, errors="coerce")
+        parsed = attempt if parsed is None else parsed.fillna(attempt)
+    
+    # Missing values have code -1, which selects the trailing NaT
+    parsed = pd.concat([parsed, pd.Series([pd.NaT], dtype=parsed.dtype)], ignore_index=True)
+    result = parsed.iloc[codes]
+    result.index = series.index
+    return result
+
+
+def normalize_date_series(series: pd.Series, formats: Iterable[str] = DEFAULT_DATE_FORMATS) -> pd.Series:
+    """
+    Normalize a column of date strings to YYYY-MM-DD for BigQuery (vectorized)
+    
+    Values matching none of the formats (including empty strings) become None,
+    which loads as NULL in BigQuery.
+    
+    Args:
+        series: Column of date strings (e.g., "10/01/2025" or "2025-10-01")
+        formats: strptime-style formats to try, in order
+        
+    Returns:
+        Object Series of "YYYY-MM-DD" strings and None
+    """
+    formatted = parse_date_series(series, formats).dt.strftime('%Y-%m-%d')
+    return formatted.astype(object).where(formatted.notna(), None)
+
+
 def upload_to_gcs(file_path: Path, blob_name: Optional[str] = None) -> bool:
     """
     Upload a file to Google Cloud Storage
@@ -90,9 +148,28 @@ def upload_to_gcs(file_path: Path, blob_name: Optional[str] = None) -> bool:
             blob_name = f"{GCS_BUCKET_PATH}/{blob_name}"
         
         blob = bucket.blob(blob_name)
-        blob.upload_from_filename(str(file_path))
+        
+        # Store .gz files as-is (no Content-Encoding): BigQuery reads gzip CSV natively
+        content_type = "application/gzip" if file_path.suffix == ".gz" else None
+        start = time.perf_counter()
+        blob.upload_from_filename(str(file_path), content_type=content_type)
+        elapsed = time.perf_counter() - start
         
         print(f"✓ Successfully uploaded to gs://{GCS_BUCKET_NAME}/{blob_name}")
+        print(f"  Uploaded {get_file_size_mb(file_path):.2f} MB in {elapsed:.1f}s")
+        if file_path.suffix == ".gz":
+            compressed_size = os.path.getsize(file_path)
+            uncompressed_size = get_gzip_uncompressed_size(file_path)
+            if compressed_size and uncompressed_size:
+                ratio = uncompressed_size / compressed_size
+                # Not measured: assumes upload time scales with bytes sent (it
+                # doesn't for small files, where request overhead dominates)
+                estimated_time_saved = elapsed * (ratio - 1)
+                print(
+                    f"  Compression: {uncompressed_size / (1024 * 1024):.2f} MB → "
+                    f"{compressed_size / (1024 * 1024):.2f} MB ({ratio:.1f}x), "
+                    f"estimated upload time saved: ~{estimated_time_saved:.1f}s (assuming time scales with size)"
+                )
         return True
     except Exception as e:
         print(f"⚠ Warning: Failed to upload to GCS: {e}")
@@ -123,6 +200,47 @@ def get_file_size_mb(file_path: Path) -> float:
     return size_bytes / (1024 * 1024)
 
 
+def get_gzip_uncompressed_size(file_path: Path) -> int:
+    """
+    Get the uncompressed size of a single-member gzip file without decompressing it
+    
+    Reads the ISIZE trailer (last 4 bytes), which holds the uncompressed size
+    modulo 2^32 - exact for files under 4 GB.
+    
+    Args:
+        file_path: Path to .gz file
+        
+    Returns:
+        Uncompressed size in bytes, or 0 if the file is too small to be gzip
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < 18:  # 10-byte header + 8-byte trailer
+            return 0
+        f.seek(-4, os.SEEK_END)
+        return struct.unpack('<I', f.read(4))[0]
+
+
+def read_csv_header(csv_file_path: Path) -> list[str]:
+    """
+    Read the header row of a local CSV file (plain or gzip-compressed)
+    
+    Args:
+        csv_file_path: Local path to .csv or .csv.gz file
+        
+    Returns:
+        List of column names
+    """
+    import csv
+    import gzip
+    
+    opener = gzip.open if csv_file_path.suffix == ".gz" else open
+    with opener(csv_file_path, 'rt', encoding='utf-8', newline='') as f:
+        csv_header = next(csv.reader(f), [])
+    # Remove quotes from header if present
+    return [col.strip('"') for col in csv_header]
+
+
 def sanitize_column_name(col_name: str) -> str:
     """
     Sanitize column names for BigQuery compatibility.
@@ -55,6 +55,54 @@ WHERE "orderType" = 'order';
 # Ford Excel file pattern - supports both .xls and .xlsx
 FORD_EXCEL_PATTERN = "Ford Dealer Report*.xls*"
 
+# Rows per chunk when OEM reports are processed in streaming mode (--stream)
+EXCEL_CHUNK_SIZE = int(os.getenv("EXCEL_CHUNK_SIZE", "50000"))
+
+# Parquet cache of parsed Excel reports (keyed on file content hash)
+EXCEL_CACHE_ENABLED = os.getenv("EXCEL_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+EXCEL_CACHE_DIR = Path(os.getenv("EXCEL_CACHE_DIR", str(DATA_DIR / "cache")))
+EXCEL_CACHE_MAX_MB = float(os.getenv("EXCEL_CACHE_MAX_MB", "500"))
+
+# Hold OEM report strings in Arrow-backed / dictionary-encoded columns
+ARROW_STRINGS_ENABLED = os.getenv("ARROW_STRINGS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Local registry of loaded OEM snapshot fingerprints (for skipping unchanged
+# daily reports). Fingerprints are also recorded in BigQuery
+# ({oem}_oem_snapshot_fingerprints), which is what hosts check first; this
+# file is only the fallback for dates loaded before that table existed
+SNAPSHOT_REGISTRY_PATH = Path(os.getenv("SNAPSHOT_REGISTRY_PATH", str(OUTPUT_DIR / "_fingerprints.json")))
+
+# Row versions of the last loaded snapshot per OEM (baseline for delta loads)
+SNAPSHOT_KEYS_DIR = Path(os.getenv("SNAPSHOT_KEYS_DIR", str(OUTPUT_DIR / "_snapshot_keys")))
+
+# How Ford reports are loaded to BigQuery: "append" (a full copy per day in
+# ford_oem_orders), "replace" (the same, replacing the date's partition so a
+# rerun does not duplicate it, see BigQueryLoader.load_ford_oem_partition),
+# "history" (order versions with valid_from / valid_to in
+# ford_oem_orders_history, see BigQueryLoader.load_ford_oem_history),
+# "delta" (only new / changed / removed rows, see processing/delta.py) or
+# "storage-write" (append to ford_oem_orders through the Storage Write API,
+# without GCS, see processing/storage_writer.py)
+FORD_LOAD_MODE = os.getenv("FORD_LOAD_MODE", "append")
+
+# Storage Write API stream type for "storage-write" loads: "pending" (each
+# report's rows are committed at once) or "committed" (rows visible as written)
+FORD_STORAGE_WRITE_MODE = os.getenv("FORD_STORAGE_WRITE_MODE", "pending")
+
+# Which row an OEM report keeps when its composite key repeats: "first" or
+# "last" in report order, or "latest" by the processor's TIE_BREAK_COLUMN
+# (see processing/dedupe.py)
+ROW_KEY_TIE_BREAK = os.getenv("ROW_KEY_TIE_BREAK", "first")
+
+# Table (or view) the backend reads Ford snapshots from by _source_file_date
+FORD_ORDERS_TABLE = os.getenv(
+    "FORD_ORDERS_TABLE",
+    {
+        "history": "ford_oem_orders_snapshots",
+        "delta": "ford_oem_orders_delta_snapshots",
+    }.get(FORD_LOAD_MODE, "ford_oem_orders")
+)
+
 # Ensure directories exist
 INPUT_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
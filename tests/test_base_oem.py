@@ -0,0 +1,302 @@
+"""
+Tests for shared OEM processor steps
+"""
+
+import pandas as pd
+import pytest
+
+from processing.processors import FordProcessor
+
+
+def _make_processor(tmp_path):
+    """Create a processor that reads and writes under tmp_path"""
+    return FordProcessor(input_dir=tmp_path / "input", output_dir=tmp_path / "output")
+
+
+def test_clean_dataframe_values_escapes_quotes(tmp_path):
+    """Test that quotes are doubled in string cells and other values are kept"""
+    processor = _make_processor(tmp_path)
+    df = pd.DataFrame({
+        "Body_Style": ['F-150 4x4 6.5" Box', None, "Transit"],
+        "Mixed": ['12" wheels', 3, None],
+        "Count": [1, 2, 3],
+    })
+    df["Mixed"] = df["Mixed"].astype(object)
+
+    cleaned = processor.clean_dataframe_values(df)
+
+    assert cleaned["Body_Style"].tolist()[0] == 'F-150 4x4 6.5"" Box'
+    assert pd.isna(cleaned["Body_Style"].tolist()[1])
+    assert cleaned["Mixed"].tolist()[:2] == ['12"" wheels', 3]
+    assert cleaned["Count"].tolist() == [1, 2, 3]
+    # The input frame is left unchanged unless inplace=True
+    assert df["Body_Style"].tolist()[0] == 'F-150 4x4 6.5" Box'
+
+
+def test_clean_dataframe_values_writer_escaping(tmp_path):
+    """Test that the CSV writer escapes quotes by default and escape_quotes pre-doubles them"""
+    processor = _make_processor(tmp_path)
+    df = pd.DataFrame({"Body_Style": ['6.5" Box', "Transit"]})
+    output_csv = tmp_path / "out.csv"
+
+    processor.write_output(df, output_csv)
+    assert output_csv.read_text(encoding="utf-8").splitlines()[1] == '"6.5"" Box"'
+    assert pd.read_csv(output_csv)["Body_Style"].tolist() == ['6.5" Box', "Transit"]
+
+    processor.escape_quotes = True
+    processor.write_output(df, output_csv)
+    assert output_csv.read_text(encoding="utf-8").splitlines()[1] == '"6.5"""" Box"'
+    assert df["Body_Style"].tolist() == ['6.5" Box', "Transit"]
+
+
+def test_pre_escaped_csv_is_not_loaded_to_bigquery(tmp_path):
+    """Test that escape_quotes CSV output is refused when it would be loaded to BigQuery"""
+    processor = _make_processor(tmp_path)
+    processor.escape_quotes = True
+
+    with pytest.raises(ValueError, match="escape_quotes"):
+        processor.convert_excel_to_csv(excel_file=tmp_path / "report.xlsx")
+
+
+def test_convert_files_parallel_reports_per_file(tmp_path):
+    """Test that parallel conversion returns one result per file, including failures"""
+    from openpyxl import Workbook
+    from processing.parallel import convert_files_parallel
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "VIN", "Body Style"])
+    workbook.active.append(["7248", "1FTFW1E50PFA00001", '6.5" Box'])
+    workbook.save(report)
+    missing = tmp_path / "Ford Dealer Report 43576-10.04.2025.xlsx"
+
+    results = convert_files_parallel(
+        "ford",
+        [report, missing],
+        jobs=2,
+        output_dir=tmp_path / "output",
+        settings={"use_excel_cache": False}
+    )
+
+    assert [result["file"] for result in results] == [report, missing]
+    assert results[0]["error"] is None
+    assert results[0]["output"].name == "Ford_Dealer_Report_clean_20251003.csv"
+    assert results[0]["output"].exists()
+    assert results[1]["error"] and results[1]["output"] is None
+
+
+def test_to_arrow_table_types_parquet_columns(tmp_path):
+    """Test that Parquet output gets DATE/INT64 columns and unescaped strings"""
+    pa = pytest.importorskip("pyarrow")
+    processor = _make_processor(tmp_path)
+    df = pd.DataFrame({
+        "Model_Year": ["2026", None],
+        "Delivered_Date": ["2025-10-02", None],
+        "Body_Style": ['6.5" Box', None],
+        "_source_file_date": ["2025-10-03", "2025-10-03"],
+    })
+
+    table = processor.to_arrow_table(df)
+
+    assert table.schema.field("Model_Year").type == pa.int64()
+    assert table.schema.field("Delivered_Date").type == pa.date32()
+    assert table.schema.field("_source_file_date").type == pa.date32()
+    assert table.schema.field("Body_Style").type == pa.string()
+    assert table.column("Model_Year").to_pylist() == [2026, None]
+    assert str(table.column("Delivered_Date").to_pylist()[0]) == "2025-10-02"
+    assert table.column("Body_Style").to_pylist() == ['6.5" Box', None]
+
+
+def test_write_output_gzip_uses_minimal_quoting(tmp_path):
+    """Test that .csv.gz output is compressed and only quotes where needed"""
+    import gzip
+
+    processor = _make_processor(tmp_path)
+    output_csv = processor.get_output_path("20251003", compression="gzip")
+    df = pd.DataFrame({"Order_Number": ["7248"], "Body_Style": ['6.5" Box']})
+
+    processor.write_output(df, output_csv)
+
+    assert output_csv.name == "Ford_Dealer_Report_clean_20251003.csv.gz"
+    with gzip.open(output_csv, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["Order_Number,Body_Style", '7248,"6.5"" Box"']
+
+
+def test_clean_dataframe_values_escapes_categories(tmp_path):
+    """Test that dictionary-encoded columns are escaped via their categories"""
+    processor = _make_processor(tmp_path)
+    df = pd.DataFrame({"Body_Style": ['6.5" Box', "Transit", '6.5" Box', None]}, dtype="category")
+
+    cleaned = processor.clean_dataframe_values(df)
+
+    assert isinstance(cleaned["Body_Style"].dtype, pd.CategoricalDtype)
+    assert cleaned["Body_Style"].tolist()[:3] == ['6.5"" Box', "Transit", '6.5"" Box']
+    assert pd.isna(cleaned["Body_Style"].tolist()[3])
+
+
+def test_streaming_and_in_memory_fingerprints_match(tmp_path):
+    """Test that the row-set fingerprint doesn't depend on the conversion mode"""
+    from openpyxl import Workbook
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year", "Delivered Date"])
+    for number in range(5):
+        workbook.active.append([f"72{number}", "2026", "10/02/2025"])
+    workbook.save(report)
+
+    snapshots = []
+    for options in ({}, {"streaming": True, "chunk_size": 2}, {"output_format": "parquet"}):
+        processor = _make_processor(tmp_path)
+        processor.use_excel_cache = False
+        processor.convert_excel_to_csv(excel_file=report, upload_to_gcs_flag=False, **options)
+        snapshots.append(processor.last_snapshot)
+
+    assert snapshots[0]["date"] == "2025-10-03"
+    assert snapshots[0]["rows"] == 5
+    assert snapshots[0] == snapshots[1] == snapshots[2]
+
+
+def test_streaming_output_matches_in_memory_output(tmp_path):
+    """Test that chunked streaming writes the same CSV and .csv.gz content as the in-memory path"""
+    import gzip
+    from openpyxl import Workbook
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year", "Delivered Date", "Body Style", "Primary Status"])
+    for number in range(7):
+        workbook.active.append([
+            f"72{number}",
+            "2026" if number % 3 else None,
+            "10/02/2025" if number % 2 else None,
+            '6.5" Box' if number % 2 else "Transit, Van",
+            "Shipped" if number < 4 else None,
+        ])
+    workbook.save(report)
+
+    for compression in (None, "gzip"):
+        contents = []
+        for options in ({}, {"streaming": True, "chunk_size": 3}):
+            processor = _make_processor(tmp_path)
+            processor.use_excel_cache = False
+            output = processor.convert_excel_to_csv(
+                excel_file=report, upload_to_gcs_flag=False, compression=compression, **options
+            )
+            opener = gzip.open if compression else open
+            with opener(output, "rb") as f:
+                contents.append(f.read())
+
+        assert contents[0].count(b"\n") == 8
+        assert contents[0] == contents[1]
+
+
+def test_parquet_output_stores_the_csv_values_and_hashes(tmp_path):
+    """Test that Parquet output holds the raw quotes read back from CSV output, and the same row hashes"""
+    from openpyxl import Workbook
+    from processing.diff import load_snapshot
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year", "Body Style"])
+    workbook.active.append(["7248", "2026", '6.5" Box'])
+    workbook.active.append(["7249", "2026", "Transit"])
+    workbook.save(report)
+
+    frames = []
+    for options in ({}, {"output_format": "parquet"}, {"output_format": "parquet", "streaming": True, "chunk_size": 1}):
+        processor = _make_processor(tmp_path)
+        processor.use_excel_cache = False
+        output = processor.convert_excel_to_csv(excel_file=report, upload_to_gcs_flag=False, **options)
+        frames.append(load_snapshot(output, processor))
+
+    # CSV output is read back as text, Parquet keeps the INT64 hash columns
+    for frame in frames:
+        assert frame["Body_Style"].tolist() == ['6.5" Box', "Transit"]
+        for column in ("_row_key", "_row_hash", "_content_hash"):
+            assert frame[column].astype(str).tolist() == frames[0][column].tolist()
+
+
+def test_row_hash_columns_follow_the_metadata_columns(tmp_path):
+    """Test that the row hash columns are the last output columns, after the columns older tables have"""
+    from openpyxl import Workbook
+    from processing.utils import read_csv_header
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year"])
+    for number in range(3):
+        workbook.active.append([f"72{number}", "2026"])
+    workbook.save(report)
+
+    for options in ({}, {"streaming": True, "chunk_size": 2}):
+        processor = _make_processor(tmp_path)
+        processor.use_excel_cache = False
+        output = processor.convert_excel_to_csv(excel_file=report, upload_to_gcs_flag=False, **options)
+
+        assert read_csv_header(output)[-6:] == [
+            "_source_filename", "_source_file_created_timestamp", "_source_file_date", "_row_key", "_row_hash",
+            "_content_hash"
+        ]
+
+
+def _storage_write_processor(tmp_path, write_succeeds):
+    """Create a storage-write processor whose write_frame records the frames instead of writing"""
+    processor = _make_processor(tmp_path)
+    processor.use_excel_cache = False
+    processor.load_to_bigquery = True
+    processor.load_mode = "storage-write"
+    processor.written_frames = []
+    processor.uploads = []
+
+    def write_frame(df, label, snapshot=None):
+        processor.written_frames.append(df.copy())
+        return write_succeeds
+
+    def upload_output(output_csv, snapshot=None, storage_write_failed=False):
+        processor.uploads.append((output_csv, storage_write_failed))
+        return True
+
+    processor.write_frame = write_frame
+    processor.upload_output = upload_output
+    return processor
+
+
+def test_storage_write_frame_is_the_same_from_memory_and_from_csv(tmp_path):
+    """Test that storage-write stores the raw quotes and hashes the CSV output reads back as"""
+    from openpyxl import Workbook
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year", "Body Style", "Primary Status"])
+    workbook.active.append(["7248", "2026", '6.5" Box', 'Shipped "A"'])
+    workbook.active.append(["7249", "2026", "Transit", None])
+    workbook.save(report)
+
+    processor = _storage_write_processor(tmp_path, write_succeeds=True)
+    output = processor.convert_excel_to_csv(excel_file=report)
+    in_memory = processor.written_frames[0]
+    from_csv = processor.read_output_frame(output)
+
+    assert processor.uploads == []
+    assert in_memory["Body_Style"].tolist() == from_csv["Body_Style"].tolist() == ['6.5" Box', "Transit"]
+    assert in_memory["Primary_Status"].iloc[0] == from_csv["Primary_Status"].iloc[0] == 'Shipped "A"'
+    for column in ("_row_key", "_row_hash", "_content_hash"):
+        assert in_memory[column].astype(str).tolist() == from_csv[column].tolist()
+
+
+def test_failed_storage_write_falls_back_to_a_load_job(tmp_path):
+    """Test that the output file is uploaded and loaded when the Storage Write API write fails"""
+    from openpyxl import Workbook
+
+    report = tmp_path / "Ford Dealer Report 43576-10.03.2025.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["Order Number", "Model Year"])
+    workbook.active.append(["7248", "2026"])
+    workbook.save(report)
+
+    processor = _storage_write_processor(tmp_path, write_succeeds=False)
+    output = processor.convert_excel_to_csv(excel_file=report)
+
+    assert len(processor.written_frames) == 1
+    assert processor.uploads == [(output, True)]
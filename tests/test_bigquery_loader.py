@@ -0,0 +1,141 @@
+"""
+Tests for the SQL generated by the BigQuery loader
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from processing.bigquery_loader import (
+    batch_load_groups,
+    ford_history_merge_sql,
+    ford_orders_partition_sql,
+    ford_snapshots_view_sql,
+    ford_unescape_quotes_sql,
+    orders_snapshot_sql,
+    orders_staging_table,
+    orders_unique_code_sql,
+)
+from processing.processors import FordProcessor
+
+
+MIGRATION_SQL = Path(__file__).parent.parent / "backend" / "queries" / "ford_oem_orders_history_migration.sql"
+PARTITION_SQL = Path(__file__).parent.parent / "backend" / "queries" / "ford_oem_orders_partition_migration.sql"
+UNIQUE_CODE_SQL = Path(__file__).parent.parent / "backend" / "queries" / "db_orders_lowercase_unique_code.sql"
+TABLE_PREFIX = "arcane-transit-357411.shaed_elt"
+
+
+def test_history_merge_inserts_new_versions_and_closes_current_ones():
+    """Test that the merge matches current versions on key and content hash and inserts every staged column"""
+    columns = ["Order_Number", "_row_key", "_row_hash", "_content_hash"]
+    script = ford_history_merge_sql("p.d.history", "p.d.staging", "p.d.loads", columns)
+
+    assert "ON h.valid_to IS NULL\n    AND h._row_key = s._row_key\n    AND h._content_hash = s._content_hash\n" in script
+    assert "INSERT (Order_Number, _row_key, _row_hash, _content_hash, valid_from, valid_to)" in script
+    assert "VALUES (s.Order_Number, s._row_key, s._row_hash, s._content_hash, @snapshot_date, NULL)" in script
+    assert "WHEN NOT MATCHED BY SOURCE AND h.valid_to IS NULL THEN\n    UPDATE SET valid_to = @snapshot_date" in script
+    assert script.index("COMMIT TRANSACTION") < script.rindex("SELECT")
+
+
+def test_history_merge_versions_a_change_to_a_column_that_is_not_compared(tmp_path):
+    """Test that a report where only Paint changed doesn't match the current version"""
+    processor = FordProcessor(input_dir=tmp_path, output_dir=tmp_path)
+    merged = processor.add_row_hash_columns(pd.DataFrame({"Order_Number": ["7248"], "Paint": ["Oxford White"]}))
+    staged = processor.add_row_hash_columns(pd.DataFrame({"Order_Number": ["7248"], "Paint": ["Agate Black"]}))
+    script = ford_history_merge_sql("p.d.history", "p.d.staging", "p.d.loads", list(staged.columns))
+    on_clause = script[script.index("ON h.valid_to IS NULL"):script.index("WHEN NOT MATCHED BY TARGET")]
+
+    # The MERGE matches on these columns only: the Paint change is a new version
+    matched_on = [column for column in staged.columns if f"h.{column} = s.{column}" in on_clause]
+    assert matched_on == ["_row_key", "_content_hash"]
+    assert merged["_row_key"].equals(staged["_row_key"]) and merged["_row_hash"].equals(staged["_row_hash"])
+    assert not merged["_content_hash"].equals(staged["_content_hash"])
+
+
+def test_unescape_quotes_rehashes_the_versions_it_changes():
+    """Test that quote un-escaping recomputes the row hashes from the un-doubled values"""
+    columns = ["Order_Number", "Paint", "_source_file_date", "_row_key", "_row_hash", "_content_hash"]
+    sql = ford_unescape_quotes_sql("p.d.ford_oem_orders", columns, ["Order_Number", "Paint"])
+
+    assert "Paint = REPLACE(t.Paint, '\"\"', '\"')" in sql
+    assert "_content_hash = v._content_hash" in sql
+    assert "REPLACE(Paint, '\"\"', '\"') AS Paint" in sql
+    assert "WHERE Order_Number LIKE '%\"\"%'\n            OR Paint LIKE '%\"\"%'" in sql
+    assert "CONCAT('Paint\\x1e', CAST(Paint AS STRING), '\\x1f')" in sql
+    assert "_source_file_date\\x1e" not in sql
+    assert "AND t._content_hash = v.old_content_hash" in sql
+
+
+def test_unescape_quotes_without_row_hashes_only_updates_text():
+    """Test that tables without row hash columns (field changes) only get their text un-doubled"""
+    sql = ford_unescape_quotes_sql("p.d.ford_field_changes", ["Field_Name", "Old_Value"], ["Old_Value"])
+
+    assert "SET\n    Old_Value = REPLACE(Old_Value, '\"\"', '\"')\nWHERE Old_Value LIKE '%\"\"%'" in sql
+    assert "_row_hash" not in sql
+
+
+def test_migration_view_matches_loader():
+    """Test that the migration creates the same snapshots view the loader maintains"""
+    view = ford_snapshots_view_sql(
+        f"{TABLE_PREFIX}.ford_oem_orders_snapshots",
+        f"{TABLE_PREFIX}.ford_oem_orders_history",
+        f"{TABLE_PREFIX}.ford_oem_history_loads"
+    )
+
+    assert view.strip() + ";" in MIGRATION_SQL.read_text()
+
+
+def test_orders_snapshot_precomputes_code_and_matches_db_orders_types():
+    """Test that an extract becomes db_orders rows with UniqueCode, DATE columns and its snapshot date"""
+    sql = orders_snapshot_sql("p.d.db_orders_staging", {
+        "orderNo": "STRING", "bodyCode": "STRING", "modelYear": "INTEGER", "oem": "STRING",
+        "chassisEta": "STRING", "orderDate": "STRING"
+    }, {
+        "orderNo": "STRING", "bodyCode": "STRING", "modelYear": "STRING", "oem": "STRING",
+        "chassisEta": "DATE", "dealerCode": "INTEGER", "UniqueCode": "STRING", "snapshot_date": "DATE"
+    })
+
+    assert "SAFE.PARSE_DATE('%m/%d/%Y', CAST(chassisEta AS STRING))) AS chassisEta" in sql
+    assert "AS orderDate" in sql
+    # Missing date columns are left out of the REPLACE list
+    assert "finalEta" not in sql
+    # Types follow the existing db_orders table; columns the extract lacks are NULL
+    assert "SAFE_CAST(modelYear AS STRING) AS modelYear" in sql
+    assert "CAST(NULL AS INT64) AS dealerCode" in sql
+    assert "COALESCE(CAST(modelYear AS STRING), ''), '||', LOWER(COALESCE(CAST(oem AS STRING), ''))) AS UniqueCode" in sql
+    assert "@snapshot_date AS snapshot_date" in sql
+
+
+def test_partition_migration_keeps_old_table_and_matches_loader():
+    """Test that the partitioned copy takes the table's name and the migration file matches the loader"""
+    script = ford_orders_partition_sql(TABLE_PREFIX, "ford_oem_orders")
+
+    assert "PARTITION BY _source_file_date\nCLUSTER BY Order_Number, Body_Code, Model_Year" in script
+    assert script.index("RENAME TO ford_oem_orders_unpartitioned") < script.index("_partitioned` RENAME TO ford_oem_orders;")
+    assert "DROP" not in script
+    assert script.strip() in PARTITION_SQL.read_text()
+
+
+def test_batch_load_groups_split_on_column_changes(tmp_path):
+    """Test that consecutive files share a load job until their columns change"""
+    headers = ["A,B", "A,B", "A,B,C", "A,B"]
+    files = []
+    for day, header in enumerate(headers, start=1):
+        path = tmp_path / f"Ford_Dealer_Report_clean_2025110{day}.csv"
+        path.write_text(f"{header}\n1,2\n")
+        files.append(path)
+
+    groups = batch_load_groups(files)
+
+    assert groups == [files[:2], [files[2]], [files[3]]]
+
+
+def test_orders_extracts_are_staged_per_date():
+    """Test that extracts of different dates never share a staging table"""
+    assert orders_staging_table("2025-11-05") == "db_orders_staging_20251105"
+    assert orders_staging_table("2025-11-05") != orders_staging_table("2025-11-06")
+
+
+def test_unique_code_migration_matches_loader():
+    """Test that the checked-in UniqueCode rebuild uses the loader's expression"""
+    assert f"SET UniqueCode = {orders_unique_code_sql()}\nWHERE oem != LOWER(oem);" in UNIQUE_CODE_SQL.read_text()
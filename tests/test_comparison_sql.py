@@ -0,0 +1,104 @@
+"""
+Tests for the generated comparison SQL
+"""
+
+from pathlib import Path
+
+from processing.comparison_sql import (
+    change_feed_sql, db_comparison_sql, field_comparison_sql, field_changes_refresh_sql
+)
+from processing.processors.ford import (
+    FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, FORD_DB_CODE_FIELDS, FORD_COMPARISON_FIELDS
+)
+from processing.row_hashes import hash_columns_sql
+
+
+def test_change_feed_lags_fields_per_key_in_one_scan():
+    """Test that the feed compares each snapshot with the previous one of the same key"""
+    sql = change_feed_sql("p.d.ford_oem_orders", FORD_KEY_COLUMNS, ["Primary_Status", "VIN"])
+
+    assert sql.count("FROM `p.d.ford_oem_orders`") == 1
+    assert "WINDOW snapshot_order AS (PARTITION BY _row_key, duplicate_number ORDER BY _source_file_date)" in sql
+    assert "STRUCT('Primary_Status' AS name, CAST(Primary_Status AS STRING) AS value)" in sql
+    assert "WHERE v.previous_row_hash != v._row_hash" in sql
+    assert "UNION ALL" not in sql
+
+
+def test_comparison_queries_are_generated_from_the_manifest():
+    """Test that each manifest field is one array element, with only needed columns read"""
+    sql = db_comparison_sql(
+        "p.d.ford_oem_orders", "p.d.db_orders",
+        FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, FORD_DB_CODE_FIELDS, "ford"
+    )
+
+    assert "UNION ALL" not in sql
+    assert "SELECT *" not in sql
+    assert sql.count("STRUCT('Plant_Date' AS name") == 1
+    assert "WHEN 'Plant_Date' THEN STRUCT('chassisEta' AS name, CAST(db.chassisEta AS STRING) AS value, 'date' AS compare_mode)" in sql
+    assert "WHEN 'Primary_Status'" not in sql
+    assert "WHERE o._row_hash != n._row_hash" in sql
+
+
+def test_query_files_match_the_manifest():
+    """Test that the console copies of the comparison queries are regenerated with the manifest"""
+    queries_dir = Path(__file__).parent.parent / "backend" / "queries"
+    table = "arcane-transit-357411.shaed_elt"
+    expected = {
+        "ford_orders_field_comparison_parameterized.sql": field_comparison_sql(
+            f"{table}.ford_oem_orders", FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST
+        ),
+        "ford_orders_db_comparision.sql": db_comparison_sql(
+            f"{table}.ford_oem_orders", f"{table}.db_orders",
+            FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, FORD_DB_CODE_FIELDS, "ford"
+        ),
+    }
+    for name, sql in expected.items():
+        text = (queries_dir / name).read_text()
+        assert text[text.index("WITH old_data AS"):].rstrip().rstrip(";") == sql.strip()
+
+
+def test_field_changes_are_materialized_per_new_date_partition():
+    """Test the load-time script and the query reading a materialized pair"""
+    script = field_changes_refresh_sql(
+        "p.d.ford_field_changes", "p.d.ford_field_change_loads", "p.d.ford_oem_orders",
+        FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST
+    )
+
+    assert "PARTITION BY new_date" in script
+    assert "DELETE FROM `p.d.ford_field_changes` WHERE new_date = @new_date;" in script
+    assert script.index("BEGIN TRANSACTION") < script.index("INSERT INTO `p.d.ford_field_changes`")
+    # A rerun replaces the pair's loads row instead of adding another
+    loads_delete = script.index("DELETE FROM `p.d.ford_field_change_loads` WHERE new_date = @new_date;")
+    assert script.index("BEGIN TRANSACTION") < loads_delete < script.index("COMMIT TRANSACTION")
+
+    sql = field_comparison_sql("p.d.ford_oem_orders", FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, "p.d.ford_field_changes")
+    assert "p.d.ford_oem_orders" not in sql
+    assert "WHERE new_date = @new_date\n        AND old_date = @old_date" in sql
+
+
+def test_db_orders_snapshot_is_one_partition_joined_on_the_precomputed_code():
+    """Test that db_orders is filtered on @db_orders_date and read as is, with one DATE comparison per date field"""
+    sql = db_comparison_sql(
+        "p.d.ford_oem_orders", "p.d.db_orders",
+        FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST, FORD_DB_CODE_FIELDS, "ford"
+    )
+    db_orders_data = sql[sql.index("db_orders_data AS"):sql.index("field_mapping AS")]
+
+    assert "WHERE snapshot_date = @db_orders_date\n        AND LOWER(oem) = 'ford'" in db_orders_data
+    assert "CONCAT" not in db_orders_data
+    assert "REGEXP_CONTAINS" not in sql
+    assert sql.count("WHEN Compare_Mode = 'date'") == 1
+
+
+def test_rows_without_hash_columns_get_them_computed():
+    """Test that rows loaded before the hash backfill still join on the processor's hashes"""
+    row_key = hash_columns_sql(FORD_KEY_COLUMNS).replace("\n", "\n        ")
+    row_hash = hash_columns_sql(FORD_COMPARISON_FIELDS).replace("\n", "\n        ")
+    feed = change_feed_sql("p.d.ford_oem_orders", FORD_KEY_COLUMNS, ["VIN"], FORD_COMPARISON_FIELDS)
+    comparison = field_comparison_sql("p.d.ford_oem_orders", FORD_KEY_COLUMNS, FORD_FIELD_MANIFEST)
+
+    for sql in (feed, comparison):
+        assert f"COALESCE(_row_key, {row_key}) AS _row_key" in sql
+        assert f"COALESCE(_row_hash, {row_hash}) AS _row_hash" in sql
+    # The feed numbers duplicates on the computed key, not the stored column
+    assert feed.index("AS _row_key") < feed.index("ROW_NUMBER()")
@@ -0,0 +1,52 @@
+"""
+Tests for the composite-key dedupe stage
+"""
+
+import pandas as pd
+
+from processing.dedupe import dedupe_rows
+
+
+def report(rows: list[tuple]) -> pd.DataFrame:
+    """Build a processed report from (key, last_updated, status) rows"""
+    return pd.DataFrame({
+        "_row_key": pd.Series([key for key, _, _ in rows], dtype="int64"),
+        "Last_Updated": pd.to_datetime([updated for _, updated, _ in rows]),
+        "Primary_Status": [status for _, _, status in rows],
+    })
+
+
+def test_tie_breaks_keep_one_row_per_key_in_report_order():
+    """Test the first / last / latest rules and the collision report"""
+    df = report([
+        (1, "2025-11-05", "Ordered"),
+        (2, "2025-11-06", "Ordered"),
+        (1, "2025-11-07", "Shipped"),
+        (1, None, "Produced"),
+    ])
+
+    first, collisions = dedupe_rows(df, "first")
+    assert first["Primary_Status"].tolist() == ["Ordered", "Ordered"]
+    assert len(collisions) == 3
+    assert collisions["_kept"].sum() == 1
+
+    last, _ = dedupe_rows(df, "last")
+    assert last["Primary_Status"].tolist() == ["Ordered", "Produced"]
+
+    latest, _ = dedupe_rows(df, "latest", "Last_Updated")
+    assert latest["Primary_Status"].tolist() == ["Ordered", "Shipped"]
+    assert latest["_row_key"].is_unique
+
+
+def test_seen_keys_drop_rows_of_keys_from_earlier_chunks():
+    """Test that streaming chunks keep the first row of a key across chunks"""
+    seen = set()
+    first_chunk, _ = dedupe_rows(report([(1, "2025-11-05", "Ordered"), (2, "2025-11-05", "Ordered")]), seen_keys=seen)
+    second_chunk, collisions = dedupe_rows(
+        report([(2, "2025-11-06", "Shipped"), (3, "2025-11-06", "Ordered")]), seen_keys=seen
+    )
+
+    assert len(first_chunk) == 2
+    assert second_chunk["_row_key"].tolist() == [3]
+    assert collisions["_row_key"].tolist() == [2]
+    assert seen == {1, 2, 3}
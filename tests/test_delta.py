@@ -0,0 +1,90 @@
+"""
+Tests for delta loads
+"""
+
+import pandas as pd
+
+from processing.delta import SnapshotKeyCache, compute_delta, snapshot_versions, CHANGE_TYPE_COLUMN
+from processing.processors import FordProcessor
+
+
+def snapshot(date: str, rows: list[tuple]) -> pd.DataFrame:
+    """Build a processed snapshot (as read back from CSV) from (key, hash, status) rows"""
+    return pd.DataFrame({
+        "Primary_Status": [status for _, _, status in rows],
+        "_row_key": [str(key) for key, _, _ in rows],
+        "_content_hash": [str(content_hash) for _, content_hash, _ in rows],
+        "_source_file_date": date,
+    }, dtype=str)
+
+
+def rebuild(deltas: dict, date: str) -> set:
+    """Rebuild a date's snapshot from delta rows, like ford_oem_orders_delta_snapshots"""
+    events = pd.concat(deltas.values(), ignore_index=True)
+    rows = set()
+    for _, row in events[events[CHANGE_TYPE_COLUMN] != "removed"].iterrows():
+        later = events[
+            (events["_row_key"] == row["_row_key"]) & (events["_content_hash"] == row["_content_hash"])
+            & (events["_source_file_date"] > row["_source_file_date"])
+        ]["_source_file_date"]
+        if row["_source_file_date"] <= date and (later.empty or date < later.min()):
+            rows.add((row["_row_key"], row["_content_hash"], row["Primary_Status"]))
+    return rows
+
+
+def test_deltas_rebuild_every_snapshot():
+    """Test new / changed / removed rows and that the deltas rebuild each day"""
+    days = {
+        "2025-11-07": snapshot("2025-11-07", [(1, 10, "Ordered"), (2, 20, "Ordered"), (3, 30, "Shipped")]),
+        "2025-11-10": snapshot("2025-11-10", [(1, 10, "Ordered"), (2, 21, "Shipped"), (4, 40, "Ordered")]),
+        "2025-11-11": snapshot("2025-11-11", [(1, 10, "Ordered"), (2, 20, "Ordered"), (4, 40, "Ordered")]),
+    }
+    deltas = {}
+    previous = pd.DataFrame({"_row_key": pd.Series(dtype="int64"), "_content_hash": pd.Series(dtype="int64")})
+    for date, df in days.items():
+        deltas[date] = compute_delta(df, previous)
+        previous = snapshot_versions(df)
+
+    second = deltas["2025-11-10"]
+    assert sorted(zip(second["_row_key"], second[CHANGE_TYPE_COLUMN])) == [
+        ("2", "changed"), ("2", "removed"), ("3", "removed"), ("4", "new")
+    ]
+    assert (second["_source_file_date"] == "2025-11-10").all()
+    assert second.loc[second[CHANGE_TYPE_COLUMN] == "removed", "Primary_Status"].isna().all()
+
+    for date, df in days.items():
+        assert rebuild(deltas, date) == set(zip(df["_row_key"], df["_content_hash"], df["Primary_Status"]))
+
+
+def test_change_to_a_column_that_is_not_compared_is_a_new_version(tmp_path):
+    """Test that a row whose only change is outside the compared fields is in the delta"""
+    processor = FordProcessor(input_dir=tmp_path, output_dir=tmp_path)
+    before = pd.DataFrame({"Order_Number": ["7248"], "Primary_Status": ["Shipped"], "Paint": ["Oxford White"]})
+    after = before.assign(Paint="Agate Black")
+    before, after = processor.add_row_hash_columns(before), processor.add_row_hash_columns(after)
+    assert after["_row_hash"].tolist() == before["_row_hash"].tolist()
+
+    delta = compute_delta(after, snapshot_versions(before))
+
+    assert sorted(delta[CHANGE_TYPE_COLUMN]) == ["changed", "removed"]
+    assert delta.loc[delta[CHANGE_TYPE_COLUMN] == "changed", "Paint"].tolist() == ["Agate Black"]
+
+
+def test_key_cache_keeps_latest_snapshot(tmp_path):
+    """Test that saving a snapshot's versions replaces the older baseline"""
+    cache = SnapshotKeyCache(tmp_path)
+    versions = pd.DataFrame({"_row_key": [1], "_content_hash": [10]})
+
+    cache.save("Ford", "2025-11-07", versions)
+    cache.save("Ford", "2025-11-10", versions)
+
+    assert cache.load("Ford", "2025-11-07") is None
+    assert cache.load("Ford", "2025-11-10").to_dict("list") == {"_row_key": [1], "_content_hash": [10]}
+
+
+def test_key_cache_ignores_versions_cached_by_row_hash(tmp_path):
+    """Test that a baseline cached before versions used _content_hash is not used"""
+    cache = SnapshotKeyCache(tmp_path)
+    pd.DataFrame({"_row_key": [1], "_row_hash": [10]}).to_parquet(tmp_path / "ford_20251107.parquet")
+
+    assert cache.load("Ford", "2025-11-07") is None
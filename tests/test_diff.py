@@ -0,0 +1,86 @@
+"""
+Tests for the local snapshot diff engine
+"""
+
+import pandas as pd
+
+from processing.diff import diff_snapshots, load_snapshot
+from processing.processors import FordProcessor
+
+
+KEYS = ["Order_Number", "VIN"]
+FIELDS = ["Primary_Status", "Dealer_Rack"]
+
+
+def test_diff_reports_changed_fields_of_matched_rows():
+    """Test changes, NULL vs value, NULL vs '' and unmatched rows"""
+    old_df = pd.DataFrame({
+        "Order_Number": ["1", "2", "3", "4"],
+        "VIN": ["A", None, "C", "D"],
+        "Primary_Status": ["Shipped", "Shipped", None, "Gone"],
+        "Dealer_Rack": ["X", None, "Y", "Z"],
+    })
+    new_df = pd.DataFrame({
+        "Order_Number": ["1", "2", "3", "5"],
+        "VIN": ["A", "", "C", "E"],
+        "Primary_Status": ["Delivered", "Shipped", "", "New"],
+        "Dealer_Rack": ["X", "R1", "Y", "Z"],
+    })
+
+    changes = diff_snapshots(old_df, new_df, KEYS, FIELDS)
+
+    # Order 3 only differs by NULL vs '' and is skipped; orders 4/5 don't match
+    assert changes["Order_Number"].tolist() == ["1", "2"]
+    assert changes["Field_Name"].tolist() == ["Primary_Status", "Dealer_Rack"]
+    assert changes["New_Value"].tolist() == ["Delivered", "R1"]
+    assert changes.loc[0, "Old_Value"] == "Shipped"
+    assert pd.isna(changes.loc[1, "Old_Value"]) and pd.isna(changes.loc[1, "VIN"])
+
+
+def test_diff_pairs_every_duplicate_key():
+    """Test that duplicate keys compare every old row against every new row, like the join"""
+    old_df = pd.DataFrame({"Order_Number": ["1", "1"], "VIN": ["A", "A"],
+                           "Primary_Status": ["a", "b"], "Dealer_Rack": ["X", "X"]})
+    new_df = pd.DataFrame({"Order_Number": ["1"], "VIN": ["A"],
+                           "Primary_Status": ["c"], "Dealer_Rack": ["X"]})
+
+    changes = diff_snapshots(old_df, new_df, KEYS, FIELDS)
+
+    assert sorted(changes["Old_Value"]) == ["a", "b"]
+    assert set(changes["New_Value"]) == {"c"}
+
+
+def test_csv_and_parquet_snapshots_diff_the_same(tmp_path):
+    """Test that a typed Parquet snapshot compares equal to the CSV of the same rows"""
+    processor = FordProcessor(input_dir=tmp_path, output_dir=tmp_path)
+    df = pd.DataFrame({
+        "Order_Number": ["7248", "7249"],
+        "Model_Year": pd.array([2026, None], dtype="Int64"),
+        "Delivered_Date": pd.to_datetime(["2025-10-02", None]),
+        "Primary_Status": ['Shipped "A"', None],
+    })
+    # Written the way the processor writes each format (raw values, the CSV writer escapes quotes)
+    processor.write_output(df, tmp_path / "snapshot.csv")
+    processor.write_output(df, tmp_path / "snapshot.parquet")
+
+    csv_df = load_snapshot(tmp_path / "snapshot.csv", processor)
+    assert csv_df["Primary_Status"].iloc[0] == 'Shipped "A"'
+    assert load_snapshot(tmp_path / "snapshot.parquet", processor)["Primary_Status"].iloc[0] == 'Shipped "A"'
+
+    changes = diff_snapshots(
+        csv_df,
+        load_snapshot(tmp_path / "snapshot.parquet", processor),
+        ["Order_Number", "Model_Year"],
+        ["Delivered_Date", "Primary_Status"]
+    )
+
+    assert changes.empty
+
+
+def test_pre_escaped_csv_snapshot_is_un_doubled(tmp_path):
+    """Test that CSV written with escape_quotes reads back as the raw values"""
+    processor = FordProcessor(input_dir=tmp_path, output_dir=tmp_path)
+    processor.escape_quotes = True
+    processor.write_output(pd.DataFrame({"Primary_Status": ['Shipped "A"', None]}), tmp_path / "snapshot.csv")
+
+    assert load_snapshot(tmp_path / "snapshot.csv", processor)["Primary_Status"].iloc[0] == 'Shipped "A"'
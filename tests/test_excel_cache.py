@@ -0,0 +1,70 @@
+"""
+Tests for the Parquet cache of parsed Excel reports
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from processing.excel_cache import ExcelCache, hash_file_content
+
+
+def _make_report(tmp_path, name, content):
+    """Create a fake report file with the given bytes"""
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test that a cached DataFrame is returned unchanged"""
+    cache = ExcelCache(cache_dir=tmp_path / "cache", max_size_mb=10)
+    report = _make_report(tmp_path, "report.xlsx", b"report-1")
+    df = pd.DataFrame({"Order Number": ["7248", None], "VIN": ["1FT", "2FT"]}, dtype=str)
+
+    assert cache.get(report) is None
+    cache.put(report, df)
+    cached = cache.get(report)
+
+    assert cached is not None
+    assert cached["Order Number"].tolist()[0] == "7248"
+    assert pd.isna(cached["Order Number"].tolist()[1])
+    assert cached.columns.tolist() == ["Order Number", "VIN"]
+
+
+def test_cache_is_keyed_on_content(tmp_path):
+    """Test that renamed copies hit and changed content misses"""
+    cache = ExcelCache(cache_dir=tmp_path / "cache", max_size_mb=10)
+    report = _make_report(tmp_path, "a.xlsx", b"same")
+    copy = _make_report(tmp_path, "b.xlsx", b"same")
+    changed = _make_report(tmp_path, "c.xlsx", b"different")
+
+    cache.put(report, pd.DataFrame({"x": ["1"]}))
+
+    assert hash_file_content(report) == hash_file_content(copy)
+    assert cache.get(copy) is not None
+    assert cache.get(changed) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest entries are removed when the cache is full"""
+    cache = ExcelCache(cache_dir=tmp_path / "cache", max_size_mb=10)
+    df = pd.DataFrame({"x": [str(i) for i in range(100)]})
+    reports = [_make_report(tmp_path, f"r{i}.xlsx", f"r{i}".encode()) for i in range(3)]
+
+    for i, report in enumerate(reports):
+        entry = cache.put(report, df)
+        os.utime(entry, (i, i))
+
+    # Touch the first entry so the second becomes least recently used
+    cache.get(reports[0])
+    entry_size = entry.stat().st_size
+    cache.max_size_bytes = entry_size * 2
+    cache.evict()
+
+    assert cache.get(reports[0]) is not None
+    assert cache.get(reports[1]) is None
+    assert cache.get(reports[2]) is not None
@@ -0,0 +1,53 @@
+"""
+Tests for non-blocking load job tracking
+"""
+
+from processing.load_jobs import LoadJobTracker, STATE_DONE, STATE_FAILED
+
+
+class FakeJob:
+    """Stand-in for a BigQuery job that finishes when told to"""
+
+    def __init__(self, job_id, output_rows=10, error_result=None):
+        self.job_id = job_id
+        self.output_rows = output_rows
+        self.error_result = error_result
+        self.finished = False
+
+    def done(self):
+        return self.finished
+
+
+def test_poll_reports_finished_jobs_and_runs_callbacks():
+    """Test that a poll returns only finished jobs, with their rows or error"""
+    tracker = LoadJobTracker()
+    first, second, third = FakeJob("a", 5), FakeJob("b"), FakeJob("c", error_result={"message": "bad row"})
+    seen = []
+    for label, job in (("first", first), ("second", second), ("third", third)):
+        tracker.submit(label, job, on_done=seen.append)
+
+    assert tracker.poll() == []
+    second.finished = third.finished = True
+    events = tracker.poll()
+
+    assert [(event["label"], event["state"], event["rows"], event["error"]) for event in events] == [
+        ("second", STATE_DONE, 10, None),
+        ("third", STATE_FAILED, None, "bad row"),
+    ]
+    assert seen == events
+    assert len(tracker) == 1
+
+
+def test_ordered_tracker_holds_events_until_earlier_jobs_finish():
+    """Test that an ordered tracker releases events in submission order"""
+    tracker = LoadJobTracker(ordered=True)
+    first, second = FakeJob("a"), FakeJob("b")
+    tracker.submit("first", first)
+    tracker.submit("second", second)
+
+    second.finished = True
+    assert tracker.poll() == []
+    first.finished = True
+
+    assert [event["label"] for event in tracker.as_completed(interval=0)] == ["first", "second"]
+    assert len(tracker) == 0
@@ -0,0 +1,38 @@
+"""
+Tests for processing utility functions
+"""
+
+import gzip
+
+import pandas as pd
+
+from processing.utils import get_gzip_uncompressed_size, normalize_date_series, parse_date_series
+
+
+def test_normalize_date_series_formats():
+    """Test MM/DD/YYYY and YYYY-MM-DD are both normalized"""
+    series = pd.Series(["10/01/2025", " 1/5/2025 ", "2025-10-01"], dtype=str)
+    assert normalize_date_series(series).tolist() == ["2025-10-01", "2025-01-05", "2025-10-01"]
+
+
+def test_normalize_date_series_null_on_garbage():
+    """Test empty, missing and unparseable values become None"""
+    series = pd.Series(["", None, "garbage", "13/01/2025", "2025-10-01 12:00:00"], dtype=object)
+    assert normalize_date_series(series).tolist() == [None, None, None, None, None]
+
+
+def test_parse_date_series_first_format_wins():
+    """Test formats are tried in order"""
+    series = pd.Series(["01/02/2025"], dtype=str)
+    parsed = parse_date_series(series, formats=("%d/%m/%Y", "%m/%d/%Y"))
+    assert parsed.iloc[0] == pd.Timestamp("2025-02-01")
+
+
+def test_get_gzip_uncompressed_size(tmp_path):
+    """Test that the gzip trailer gives the uncompressed size"""
+    data = b'"Order_Number","VIN"\n' * 1000
+    path = tmp_path / "orders.csv.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(data)
+
+    assert get_gzip_uncompressed_size(path) == len(data)
@@ -0,0 +1,86 @@
+"""
+Tests for the precomputed _row_key / _row_hash columns
+"""
+
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+
+from processing.processors import FordProcessor
+from processing.processors.ford import FORD_SCHEMA, FORD_KEY_COLUMNS, FORD_COMPARISON_FIELDS
+from processing.row_hashes import content_hash, content_hash_sql, hash_columns, hash_columns_sql
+
+
+BACKFILL_SQL = Path(__file__).parent.parent / "backend" / "queries" / "ford_oem_orders_add_row_hashes.sql"
+CONTENT_HASH_SQL = Path(__file__).parent.parent / "backend" / "queries" / "ford_versions_add_content_hash.sql"
+VIN8_SQL = Path(__file__).parent.parent / "backend" / "queries" / "ford_orders_backfill_vin8.sql"
+
+
+def test_hash_matches_bigquery_expression_semantics():
+    """Test that the hash is the first 60 bits of SHA-256 over CAST-as-STRING values"""
+    df = pd.DataFrame({
+        "Order_Number": ["7248"],
+        "Model_Year": pd.array([2026], dtype="Int64"),
+        "Delivered_Date": pd.to_datetime(["2025-10-02"]),
+        "VIN": [None],
+    })
+    expected = int(hashlib.sha256("7248\x1f2026\x1f2025-10-02\x1f\x1f".encode()).hexdigest()[:15], 16)
+
+    hashes = hash_columns(df, ["Order_Number", "Model_Year", "Delivered_Date", "VIN", "Missing_Column"])
+
+    assert hashes.tolist() == [expected]
+    assert 0 <= expected < 2 ** 63
+
+
+def test_content_hash_covers_named_non_empty_values():
+    """Test that the content hash hashes name/value pairs in name order, skipping empty values"""
+    df = pd.DataFrame({"VIN": [None], "Paint": ["Oxford White"], "Model_Year": pd.array([2026], dtype="Int64")})
+    expected = int(hashlib.sha256("Model_Year\x1e2026\x1fPaint\x1eOxford White\x1f".encode()).hexdigest()[:15], 16)
+
+    assert content_hash(df, df.columns).tolist() == [expected]
+    assert content_hash(df, ["Paint", "Model_Year", "New_Empty_Column"]).tolist() == [expected]
+
+
+def test_processor_adds_key_and_content_hashes(tmp_path):
+    """Test that the key survives a field change while the content hashes don't"""
+    processor = FordProcessor(input_dir=tmp_path, output_dir=tmp_path)
+    df = pd.DataFrame({
+        "Order_Number": ["7248", "7248", "7248"],
+        "Body_Code": ["W1E", "W1E", "W1E"],
+        "Primary_Status": ["Shipped", "Delivered", "Delivered"],
+        "Paint": ["Oxford White", "Oxford White", "Agate Black"],
+    })
+
+    df = processor.add_row_hash_columns(df)
+
+    assert df["_row_key"].dtype == "int64"
+    assert df["_row_key"].nunique() == 1
+    assert df["_row_hash"].iloc[0] != df["_row_hash"].iloc[1]
+    # Paint isn't compared: only the content hash sees it change
+    assert df["_row_hash"].iloc[1] == df["_row_hash"].iloc[2]
+    assert df["_content_hash"].nunique() == 3
+
+
+def test_backfill_sql_matches_processor_columns():
+    """Test that the checked-in backfill SQL uses the processor's column lists"""
+    sql = BACKFILL_SQL.read_text(encoding="utf-8")
+
+    assert hash_columns_sql(FORD_KEY_COLUMNS).replace("\n", "\n    ") in sql
+    assert hash_columns_sql(FORD_COMPARISON_FIELDS).replace("\n", "\n    ") in sql
+    assert content_hash_sql(FORD_SCHEMA.kept_columns()).replace("\n", "\n    ") in sql
+
+
+def test_content_hash_backfill_sql_matches_processor_columns():
+    """Test that the checked-in version backfill SQL hashes the processor's report columns"""
+    sql = CONTENT_HASH_SQL.read_text(encoding="utf-8")
+
+    assert content_hash_sql(FORD_SCHEMA.kept_columns()).replace("\n", "\n    ") in sql
+
+
+def test_vin8_backfill_sql_matches_processor_columns():
+    """Test that the checked-in VIN8 backfill SQL hashes the processor's report columns, VIN8 included"""
+    sql = VIN8_SQL.read_text(encoding="utf-8")
+
+    assert "VIN8" in FORD_SCHEMA.kept_columns()
+    assert content_hash_sql(FORD_SCHEMA.kept_columns()).replace("\n", "\n        ") in sql
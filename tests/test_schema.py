@@ -0,0 +1,79 @@
+"""
+Tests for declarative OEM ingestion schemas
+"""
+
+import pandas as pd
+import pytest
+
+from processing.schema import ColumnSpec, OEMSchema
+
+
+SCHEMA = OEMSchema([
+    ColumnSpec("Order_Number"),
+    ColumnSpec("Model_Year", "int64"),
+    ColumnSpec("Delivered_Date", "date"),
+    ColumnSpec("VIN8", keep=False),
+])
+
+
+def test_apply_drops_and_types_columns():
+    """Test that unkept columns are dropped and typed columns are converted"""
+    df = pd.DataFrame({
+        "Order_Number": ["7248", "A100"],
+        "Model_Year": ["2026", "n/a"],
+        "Delivered_Date": ["10/02/2025", ""],
+        "VIN8": ["TKA30472", None],
+        "New_Column": ["x", "y"],
+    }, dtype=str)
+
+    typed = SCHEMA.apply(df)
+
+    assert list(typed.columns) == ["Order_Number", "Model_Year", "Delivered_Date", "New_Column"]
+    assert typed["Model_Year"].tolist()[0] == 2026
+    assert pd.isna(typed["Model_Year"].tolist()[1])
+    assert typed["Delivered_Date"].tolist()[0] == pd.Timestamp("2025-10-02")
+    assert pd.isna(typed["Delivered_Date"].tolist()[1])
+    # Undeclared columns are kept as strings
+    assert typed["New_Column"].tolist() == ["x", "y"]
+
+
+def test_bigquery_schema_follows_file_order():
+    """Test that the BigQuery schema uses declared types, STRING for the rest"""
+    fields = SCHEMA.bigquery_schema(["Delivered_Date", "Order_Number", "New_Column", "_source_file_date"])
+
+    assert [(field.name, field.field_type) for field in fields] == [
+        ("Delivered_Date", "DATE"),
+        ("Order_Number", "STRING"),
+        ("New_Column", "STRING"),
+        ("_source_file_date", "DATE"),
+    ]
+
+
+def test_column_spec_rejects_unknown_dtype():
+    """Test that an unsupported dtype is rejected when the schema is declared"""
+    with pytest.raises(ValueError):
+        ColumnSpec("Order_Number", "decimal")
+
+
+def test_apply_arrow_strings_dictionary_encodes_columns():
+    """Test that arrow mode gives Arrow strings, categoricals and date32 columns"""
+    pytest.importorskip("pyarrow")
+    schema = OEMSchema([
+        ColumnSpec("Order_Number"),
+        ColumnSpec("Primary_Status", dictionary=True),
+        ColumnSpec("Delivered_Date", "date"),
+    ])
+    df = pd.DataFrame({
+        "Order_Number": ["7248", "7249", None],
+        "Primary_Status": ["Shipped", "Shipped", None],
+        "Delivered_Date": ["10/02/2025", "", None],
+    }, dtype=str)
+
+    typed = schema.apply(df, arrow_strings=True)
+
+    assert typed["Order_Number"].dtype == pd.StringDtype("pyarrow")
+    assert isinstance(typed["Primary_Status"].dtype, pd.CategoricalDtype)
+    assert list(typed["Primary_Status"].cat.categories) == ["Shipped"]
+    assert str(typed["Delivered_Date"].dtype) == "date32[day][pyarrow]"
+    assert str(typed["Delivered_Date"].tolist()[0]) == "2025-10-02"
+    assert pd.isna(typed["Delivered_Date"].tolist()[1])
@@ -0,0 +1,52 @@
+"""
+Tests for snapshot fingerprints and the "same as" registry
+"""
+
+import pandas as pd
+
+from processing.schema import ColumnSpec, OEMSchema
+from processing.snapshots import SnapshotRegistry, fingerprint_dataframe
+
+
+SCHEMA = OEMSchema([
+    ColumnSpec("Order_Number"),
+    ColumnSpec("Primary_Status", dictionary=True),
+    ColumnSpec("Delivered_Date", "date"),
+])
+
+
+def _report(rows, source_filename="report.xlsx"):
+    """Typed report DataFrame with a metadata column"""
+    df = pd.DataFrame(rows, columns=["Order_Number", "Primary_Status", "Delivered_Date"], dtype=str)
+    df["_source_filename"] = source_filename
+    return df
+
+
+def test_fingerprint_ignores_row_order_metadata_and_dtypes():
+    """Test that only the row set decides the fingerprint"""
+    rows = [["7248", "Shipped", "10/02/2025"], ["7249", None, None]]
+    fingerprint = fingerprint_dataframe(SCHEMA.apply(_report(rows)))
+
+    assert fingerprint_dataframe(SCHEMA.apply(_report(rows[::-1], "other.xlsx"))) == fingerprint
+    assert fingerprint_dataframe(SCHEMA.apply(_report(rows), arrow_strings=True)) == fingerprint
+
+    changed = [["7248", "Delivered", "10/02/2025"], ["7249", None, None]]
+    assert fingerprint_dataframe(SCHEMA.apply(_report(changed))) != fingerprint
+
+
+def test_registry_resolves_unchanged_snapshots(tmp_path):
+    """Test that an unchanged snapshot points at the date that holds the rows"""
+    registry = SnapshotRegistry(tmp_path / "_fingerprints.json")
+    registry.record("Ford", "2025-10-10", "abc", 10)
+
+    assert registry.unchanged_since("Ford", "2025-10-11", "abc") == "2025-10-10"
+    assert registry.unchanged_since("Ford", "2025-10-11", "def") is None
+    assert registry.unchanged_since("Ford", "2025-10-10", "abc") is None
+
+    registry.record("Ford", "2025-10-11", "abc", 10, same_as="2025-10-10")
+
+    # Chains collapse to the loaded date
+    assert registry.unchanged_since("Ford", "2025-10-12", "abc") == "2025-10-10"
+    assert registry.resolve("Ford", "2025-10-11") == "2025-10-10"
+    assert registry.resolve("Ford", "2025-10-10") == "2025-10-10"
+    assert registry.get("ford", "2025-10-11")["same_as"] == "2025-10-10"
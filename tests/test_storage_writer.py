@@ -0,0 +1,44 @@
+"""
+Tests for Storage Write API ingestion against the in-memory fake writer
+"""
+
+import pyarrow as pa
+import pytest
+
+from processing.storage_writer import FakeStorageWriter, prepare_arrow_table
+
+
+def report_table(rows: int) -> pa.Table:
+    """Build a processed Ford report as Arrow, typed like to_arrow_table() output"""
+    return pa.table({
+        "Order_Number": pa.array([f"A{number}" for number in range(rows)]),
+        "_source_file_date": pa.array([19300] * rows, type=pa.int32()).cast(pa.date32()),
+        "_source_file_created_timestamp": pa.array([0] * rows, type=pa.timestamp("us")),
+    })
+
+
+def test_prepare_marks_timestamps_utc_and_decodes_dictionaries():
+    """Test that naive timestamps become UTC (TIMESTAMP columns) and dictionaries plain strings"""
+    table = report_table(2).append_column("Status", pa.array(["open", "open"]).dictionary_encode())
+
+    prepared = prepare_arrow_table(table)
+
+    assert prepared.schema.field("_source_file_created_timestamp").type == pa.timestamp("us", tz="UTC")
+    assert prepared.schema.field("Status").type == pa.string()
+    assert prepared.column("Status").to_pylist() == ["open", "open"]
+
+
+def test_pending_write_commits_all_rows_or_none():
+    """Test that a pending write is atomic per report and a committed one keeps written batches"""
+    writer = FakeStorageWriter(batch_rows=2)
+    assert writer.write_table("ford_oem_orders", report_table(5)) == 5
+    assert writer.read_table("ford_oem_orders").column("Order_Number").to_pylist() == [f"A{n}" for n in range(5)]
+
+    failing = FakeStorageWriter(batch_rows=2, fail_after_batches=2)
+    with pytest.raises(RuntimeError):
+        failing.write_table("ford_oem_orders", report_table(5), mode="pending")
+    assert failing.read_table("ford_oem_orders") is None
+
+    with pytest.raises(RuntimeError):
+        failing.write_table("ford_oem_orders", report_table(5), mode="committed")
+    assert failing.read_table("ford_oem_orders").num_rows == 4